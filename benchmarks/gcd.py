@@ -0,0 +1,56 @@
+"""Benchmark the gcd algorithms against math.gcd on random operands.
+
+Run from the repository root, for example:
+
+    python -m benchmarks.gcd --bits 100000 1000000 4000000 --repeat 3
+
+Prints the best time in milliseconds of each algorithm for each operand size.
+Lehmer's algorithm is quadratic and skipped above --quadratic-limit bits.
+"""
+
+import argparse
+import math
+import random
+import timeit
+
+from src.algorithms.number_theory.gcd import (extended_half_gcd,
+                                              extended_lehmer, half_gcd,
+                                              lehmer)
+
+# (name, function, whether it takes quadratic time)
+FUNCTIONS = [
+    ("math.gcd", math.gcd, False),
+    ("lehmer", lehmer, True),
+    ("half_gcd", half_gcd, False),
+    ("extended_lehmer", extended_lehmer, True),
+    ("extended_half_gcd", extended_half_gcd, False),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bits", type=int, nargs="+",
+                        default=[10**4, 10**5, 10**6, 2 * 10**6, 4 * 10**6])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--quadratic-limit", type=int, default=10**6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'bits':>10}",
+          *(f"{name:>18}" for name, _, _ in FUNCTIONS))
+    for bits in args.bits:
+        a, b = rng.getrandbits(bits), rng.getrandbits(bits)
+        row = [f"{bits:>10}"]
+        for _, function, quadratic in FUNCTIONS:
+            if quadratic and bits > args.quadratic_limit:
+                row.append(f"{'-':>18}")
+                continue
+            seconds = min(timeit.repeat(lambda: function(a, b), number=1,
+                                        repeat=args.repeat))
+            row.append(f"{seconds * 1e3:>18.3f}")
+        print(*row, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,15 @@
 """Algorithms for finding the closest pair in a set of points."""
 
+import bisect
+import heapq
 import math
 import random
 from collections import defaultdict
+from collections.abc import Iterable
 from numbers import Real
+from typing import Optional
 
 # TODO: Khuller-Matias
-# TODO: sweep line
-# TODO: divide and conquer
-# TODO: dynamic
 
 
 def brute_force(points: list[tuple[Real, ...]]) -> tuple[int, int]:
@@ -74,3 +75,327 @@ def rabin_lipton_2d(points: list[tuple[Real, Real]]) -> tuple[int, int]:
                         out = (i, j)
 
     return out
+
+
+def divide_and_conquer_2d(points: list[tuple[Real, Real]]) -> tuple[int, int]:
+    """Return the indices of two points at pairwise minimal distance.
+
+    Points are sorted by x once. Each recursive call returns its points
+    sorted by y, by merging the results of its halves, so the strip around
+    the dividing line never needs to be sorted.
+
+    Complexity: O(n lg n)
+    """
+    n = len(points)
+    if n < 2:
+        raise ValueError("input smaller than 2")
+
+    order = sorted(range(n), key=points.__getitem__)
+    ys = [point[1] for point in points]
+
+    smallest_distance = math.inf
+    out = None
+
+    def closest(start: int, stop: int) -> list[int]:
+        nonlocal smallest_distance, out
+
+        if stop - start <= 3:
+            local_points = order[start:stop]
+            for a, i in enumerate(local_points):
+                for j in local_points[a + 1:]:
+                    distance = math.dist(points[i], points[j])
+                    if distance < smallest_distance:
+                        smallest_distance = distance
+                        out = (i, j)
+            local_points.sort(key=ys.__getitem__)
+            return local_points
+
+        mid = (start + stop) // 2
+        mid_x = points[order[mid]][0]
+        left = closest(start, mid)
+        right = closest(mid, stop)
+
+        # merge by y
+        merged = []
+        a = b = 0
+        while a < len(left) and b < len(right):
+            if ys[left[a]] <= ys[right[b]]:
+                merged.append(left[a])
+                a += 1
+            else:
+                merged.append(right[b])
+                b += 1
+        merged.extend(left[a:])
+        merged.extend(right[b:])
+
+        strip = [
+            i for i in merged
+            if abs(points[i][0] - mid_x) < smallest_distance
+        ]
+        for a, i in enumerate(strip):
+            for j in strip[a + 1:]:
+                if ys[j] - ys[i] >= smallest_distance:
+                    break
+                distance = math.dist(points[i], points[j])
+                if distance < smallest_distance:
+                    smallest_distance = distance
+                    out = (i, j)
+
+        return merged
+
+    closest(0, n)
+    return out
+
+
+def sweep_line_2d(points: list[tuple[Real, Real]]) -> tuple[int, int]:
+    """Return the indices of two points at pairwise minimal distance.
+
+    Sweeps the points from left to right, keeping the points within the
+    current smallest distance of the sweep line in a list sorted by y. Each
+    point is only compared with active points that are close in y.
+
+    Complexity: O(n lg n) comparisons, O(n^2) worst case time for the list
+    updates, which are fast in practice
+    """
+    n = len(points)
+    if n < 2:
+        raise ValueError("input smaller than 2")
+
+    order = sorted(range(n), key=points.__getitem__)
+
+    smallest_distance = math.inf
+    out = None
+    active = []  # (y, index) pairs
+    left = 0
+    for i in order:
+        x, y = points[i]
+
+        while x - points[order[left]][0] >= smallest_distance:
+            j = order[left]
+            del active[bisect.bisect_left(active, (points[j][1], j))]
+            left += 1
+
+        idx = bisect.bisect_left(active, (y - smallest_distance, ))
+        # y - smallest_distance is rounded, so look just below it as well
+        while idx > 0 and y - active[idx - 1][0] < smallest_distance:
+            idx -= 1
+
+        while idx < len(active) and active[idx][0] - y < smallest_distance:
+            j = active[idx][1]
+            distance = math.dist(points[i], points[j])
+            if distance < smallest_distance:
+                smallest_distance = distance
+                out = (j, i)
+                if distance == 0:
+                    return out
+            idx += 1
+
+        bisect.insort(active, (y, i))
+
+    return out
+
+
+class DynamicClosestPair:
+    """Set of points in the plane that keeps track of its closest pair.
+
+    Points at the same coordinates are grouped into a single site, and sites
+    holding more than one point are kept in a set, so coincident points give
+    a closest pair at distance zero without touching the grid. The sites are
+    hashed into a grid of square cells, stored in a dict keyed by (x, y) cell
+    coordinates. Every pair of sites in the same or adjacent cells is kept in
+    a heap ordered by distance, so any pair at distance at most the cell size
+    is in the heap, and the closest valid pair in the heap is the closest
+    pair overall as long as its distance is at most the cell size. Pairs
+    involving deleted sites are discarded lazily.
+
+    The grid is rebuilt with a cell size of twice the minimum distance when
+    a deletion leaves no pair within the cell size, since the heap can no
+    longer answer queries. Insertions only shrink the cell size once at
+    least n/2 operations have passed since the last rebuild, or once the
+    neighborhood of the new point holds more than _CROWDED sites, so that
+    alternately inserting and deleting a point close to another one does
+    not rebuild the grid every time.
+    """
+
+    __slots__ = ("_points", "_sites", "_members", "_coincident", "_grid",
+                 "_unit", "_pairs", "_stale", "_operations", "_next_key")
+
+    _CROWDED = 32
+
+    _points: dict[int, tuple[Real, Real]]
+    _sites: dict[tuple[Real, Real], int]
+    _members: dict[int, dict[int, None]]
+    _coincident: dict[int, None]
+    _grid: defaultdict[tuple[int, int], list[tuple[int, tuple[Real, Real]]]]
+    _unit: Optional[float]
+    _pairs: list[tuple[float, int, int]]
+    _stale: int
+    _operations: int
+    _next_key: int
+
+    def __init__(self, points: Iterable[tuple[Real, Real]] = ()):
+        """Initialize the set with the given points.
+
+        Points receive the keys 0, 1, ... in order.
+
+        Complexity: O(n lg n)
+        """
+        self._points = {}
+        self._sites = {}
+        self._members = {}
+        self._coincident = {}
+        self._next_key = 0
+        for point in points:
+            self._add(point)
+        self._unit = None
+        self._rebuild()
+
+    def _add(self, point: tuple[Real, Real]) -> tuple[int, bool]:
+        """Add a point to its site; return its key and whether it is new."""
+        key = self._next_key
+        self._next_key += 1
+        self._points[key] = point
+
+        site = self._sites.get(point)
+        if site is None:
+            self._sites[point] = key
+            self._members[key] = {key: None}
+            return key, True
+        self._members[site][key] = None
+        self._coincident[site] = None
+        return key, False
+
+    def _cell(self, point: tuple[Real, Real]) -> tuple[int, int]:
+        return (math.floor(point[0] / self._unit),
+                math.floor(point[1] / self._unit))
+
+    def _neighbors(self, point: tuple[Real, Real]) -> Iterable[tuple]:
+        """Yield the (site, point) entries in the cells around a point."""
+        x, y = self._cell(point)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                yield from self._grid.get((x + dx, y + dy), ())
+
+    def _rebuild(self) -> None:
+        """Recompute the cell size, grid and pair heap from scratch."""
+        self._grid = defaultdict(list)
+        self._pairs = []
+        self._stale = 0
+        self._operations = 0
+
+        if len(self._sites) < 2:
+            self._unit = None
+            return
+
+        coordinates = list(self._sites)
+        i, j = sweep_line_2d(coordinates)
+        self._unit = 2 * math.dist(coordinates[i], coordinates[j])
+
+        for point, site in self._sites.items():
+            for other, location in self._neighbors(point):
+                self._pairs.append((math.dist(point, location), other, site))
+            self._grid[self._cell(point)].append((site, point))
+        heapq.heapify(self._pairs)
+
+    def _top(self) -> Optional[tuple[float, int, int]]:
+        """Return the closest valid pair of sites in the heap, if any."""
+        pairs = self._pairs
+        while pairs and (pairs[0][1] not in self._members
+                         or pairs[0][2] not in self._members):
+            heapq.heappop(pairs)
+            self._stale -= 1
+        return pairs[0] if pairs else None
+
+    def insert(self, point: tuple[Real, Real]) -> int:
+        """Insert a point and return its key.
+
+        Complexity: O(lg n) amortized
+        """
+        key, new_site = self._add(point)
+        if not new_site:
+            return key
+        if self._unit is None:
+            self._rebuild()
+            return key
+
+        neighbors = 0
+        for other, location in self._neighbors(point):
+            heapq.heappush(self._pairs,
+                           (math.dist(point, location), other, key))
+            neighbors += 1
+        self._grid[self._cell(point)].append((key, point))
+        self._operations += 1
+
+        if neighbors > self._CROWDED or (
+                self._top()[0] < self._unit / 4
+                and self._operations >= len(self._sites) // 2):
+            self._rebuild()
+        return key
+
+    def delete(self, key: int) -> None:
+        """Delete the point with the given key.
+
+        Complexity: O(lg n) amortized, plus O(n lg n) when no pair within the
+        cell size is left
+        """
+        point = self._points.pop(key)
+        site = self._sites[point]
+        members = self._members[site]
+        del members[key]
+        if len(members) == 1:
+            del self._coincident[site]
+        if members:
+            return
+
+        del self._members[site]
+        del self._sites[point]
+        if self._unit is None:
+            return
+
+        cell = self._grid[self._cell(point)]
+        cell.remove((site, point))
+        if not cell:
+            del self._grid[self._cell(point)]
+        self._stale += sum(1 for _ in self._neighbors(point))
+        self._operations += 1
+
+        if len(self._sites) < 2:
+            self._rebuild()
+            return
+
+        if self._stale > len(self._pairs) // 2:
+            self._pairs = [
+                pair for pair in self._pairs
+                if pair[1] in self._members and pair[2] in self._members
+            ]
+            heapq.heapify(self._pairs)
+            self._stale = 0
+
+        top = self._top()
+        if top is None or top[0] > self._unit:
+            self._rebuild()
+
+    def closest_pair(self) -> Optional[tuple[int, int]]:
+        """Return the keys of two points at minimal distance.
+
+        Return None if there are fewer than two points.
+
+        Complexity: O(1) amortized
+        """
+        if self._coincident:
+            members = iter(self._members[next(iter(self._coincident))])
+            return next(members), next(members)
+        top = self._top()
+        if top is None:
+            return None
+        return (next(iter(self._members[top[1]])),
+                next(iter(self._members[top[2]])))
+
+    def __getitem__(self, key: int) -> tuple[Real, Real]:
+        return self._points[key]
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._points
+
+    def __len__(self) -> int:
+        return len(self._points)
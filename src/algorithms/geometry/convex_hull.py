@@ -1,54 +1,420 @@
-"""Algorithms for finding the convex hull of a set of points in the plane."""
+"""Algorithms for finding the convex hull of a set of points in the plane.
 
-from collections.abc import Sequence
+All algorithms return the indices of the hull vertices in counterclockwise
+order, starting with the lexicographically smallest point. Collinear points
+on hull edges are not included, and of duplicate points only the one with the
+smallest index is.
+"""
+
+import bisect
+import itertools
+import math
+import operator
+from collections.abc import Iterable, Sequence
 from numbers import Real
 
+from src.algorithms.geometry.predicates import orientation
+
 Point = tuple[Real, Real]
+# a point with its index in the input
+_Entry = tuple[Real, Real, int]
+
+
+def _chains(points: Sequence[_Entry]) -> tuple[list[_Entry], list[_Entry]]:
+    """Return the lower and upper hull chains of lexicographically sorted
+    (x, y, index) tuples, each from the smallest to the largest point."""
+    lo_hull = []
+    hi_hull = []
+    for i in range(len(points)):
+        point = points[i]
+
+        if i > 0 and points[i - 1][:2] == point[:2]:
+            continue
+
+        while len(lo_hull) > 1 and orientation(lo_hull[-2], lo_hull[-1],
+                                               point) <= 0:
+            lo_hull.pop()
+        lo_hull.append(point)
+
+        while len(hi_hull) > 1 and orientation(hi_hull[-2], hi_hull[-1],
+                                               point) >= 0:
+            hi_hull.pop()
+        hi_hull.append(point)
+
+    return lo_hull, hi_hull
 
 
 def recursive_convex_hull(points: Sequence[Point]) -> list[int]:
-    """Return the indices of the convex hull of the given set of points."""
+    """Return the indices of the convex hull of the given set of points.
+
+    Sorts the points, then splits them into a left and right half, and merges
+    the recursively computed hulls of the halves along their upper and lower
+    tangents.
+
+    Complexity: O(n lg n)
+    """
     indices = sorted(range(len(points)), key=points.__getitem__)
+    indices = [idx for k, idx in enumerate(indices)
+               if k == 0 or points[indices[k - 1]] != points[idx]]
     points = [points[idx] for idx in indices]
 
-    def rch(start: int, stop: int) -> list[int]:
+    def merge(left: list[int], right: list[int], sign: int) -> list[int]:
+        # walk the ends of both chains towards each other until the segment
+        # between them turns the same way as the rest of the chain
+        a = len(left) - 1
+        b = 0
+        moved = True
+        while moved:
+            moved = False
+            while a > 0 and sign * orientation(points[left[a - 1]],
+                                               points[left[a]],
+                                               points[right[b]]) <= 0:
+                a -= 1
+                moved = True
+            while b < len(right) - 1 and sign * orientation(
+                    points[left[a]], points[right[b]],
+                    points[right[b + 1]]) <= 0:
+                b += 1
+                moved = True
+        return left[:a + 1] + right[b:]
+
+    def rch(start: int, stop: int) -> tuple[list[int], list[int]]:
         if stop - start == 1:
-            return [start]
+            return [start], [start]
 
         mid = (start + stop) // 2
-        left_hull = rch(start, mid)
-        right_hull = rch(mid, stop)
+        left_lo, left_hi = rch(start, mid)
+        right_lo, right_hi = rch(mid, stop)
+        return merge(left_lo, right_lo, 1), merge(left_hi, right_hi, -1)
 
-        # TODO: combine
+    if not points:
+        return []
 
-    return [indices[idx] for idx in rch(0, len(points))]
+    lo_hull, hi_hull = rch(0, len(points))
+    hull = lo_hull + hi_hull[-2:0:-1]
+    return [indices[idx] for idx in hull]
+
+
+def _akl_toussaint(points: Sequence[Point]) -> list[int]:
+    """Return the indices, in increasing order, of the points that do not lie
+    strictly inside the octagon spanned by the points extreme in x, y, x + y
+    and x - y. The others can't be hull vertices.
+
+    Points strictly inside the largest axis-parallel box within the octagon
+    are discarded by comparisons alone; only the remaining points are tested
+    against the octagon's edges.
+
+    Complexity: O(n)
+    """
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    sums = list(map(operator.add, xs, ys))
+    diffs = list(map(operator.sub, xs, ys))
+
+    # counterclockwise, starting at the bottom
+    octagon = [
+        points[values.index(extreme(values))]
+        for extreme, values in ((min, ys), (max, diffs), (max, xs),
+                                (max, sums), (max, ys), (min, diffs),
+                                (min, xs), (min, sums))
+    ]
+    b, br, r, tr, t, tl, l, bl = octagon
+    x_lo = max(bl[0], l[0], tl[0])
+    x_hi = min(br[0], r[0], tr[0])
+    y_lo = max(bl[1], b[1], br[1])
+    y_hi = min(tl[1], t[1], tr[1])
+
+    vertices = [p for k, p in enumerate(octagon) if p != octagon[k - 1]]
+    if len(vertices) < 3:
+        return list(range(len(points)))
+    edges = list(zip(vertices, vertices[1:] + vertices[:1]))
+
+    return [
+        i for i, p in enumerate(points)
+        if not (x_lo < p[0] < x_hi and y_lo < p[1] < y_hi) and
+        not all(orientation(u, v, p) > 0 for u, v in edges)
+    ]
 
 
 def monotone_chain(points: Sequence[Point]) -> list[int]:
     """Return the indices of the convex hull of the given set of points.
 
     Points will be in counterclockwise order, with the leftmost point first.
+
+    Points inside the octagon of extreme points are discarded before sorting.
+    If the points are already sorted (by x, then y), sorting is skipped.
+
+    Complexity: O(n lg n), O(n) for sorted input
     """
-    points = sorted((x, y, i) for i, (x, y) in enumerate(points))
+    if not points:
+        return []
 
-    def clockwise(p, q, r):
-        return (q[0] - p[0]) * (r[1] - p[1]) <= (q[1] - p[1]) * (r[0] - p[0])
+    candidates = _akl_toussaint(points)
+    if all(map(operator.le, points, itertools.islice(points, 1, None))):
+        points = [(*points[i], i) for i in candidates]
+    else:
+        points = sorted((*points[i], i) for i in candidates)
 
-    lo_hull = []
-    hi_hull = []
-    for i in range(len(points)):
-        point = points[i]
+    lo_hull, hi_hull = _chains(points)
+    hull = lo_hull + hi_hull[-2:0:-1]
+    return [point[2] for point in hull]
 
-        if i > 0 and points[i - 1][:2] == point[:2]:
-            continue
 
-        while len(lo_hull) > 1 and clockwise(lo_hull[-2], lo_hull[-1], point):
-            lo_hull.pop()
-        lo_hull.append(point)
+def _tangent(chain: list[_Entry], p: _Entry, sign: int) -> int:
+    """Return the position of the point of a lower (sign 1) or upper
+    (sign -1) hull chain that comes next after p when wrapping around all
+    points of the chain greater than p, or -1 if there are none.
 
-        while len(hi_hull) > 1 and clockwise(point, hi_hull[-1], hi_hull[-2]):
-            hi_hull.pop()
-        hi_hull.append(point)
+    Complexity: O(lg k) where k is the length of the chain
+    """
+    lo = bisect.bisect_right(chain, (p[0], p[1], math.inf))
+    if lo == len(chain):
+        return -1
 
-    hull = lo_hull + hi_hull[-2:0:-1]
-    return [point[2] for point in hull]
+    # the turn p, chain[i], chain[i + 1] changes sign once, at the tangent
+    hi = len(chain) - 1
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if sign * orientation(p, chain[mid], chain[mid + 1]) > 0:
+            hi = mid
+        else:
+            lo = mid + 1
+    return lo
+
+
+def _wrap(groups: list[list[_Entry]], start: _Entry, sign: int,
+          max_size: int) -> list[_Entry] | None:
+    """Gift-wrap a lower (sign 1) or upper (sign -1) hull chain from start
+    around the given hull chains, or return None if it gets longer than
+    max_size."""
+    chain = [start]
+    while len(chain) <= max_size:
+        p = chain[-1]
+        best = None
+        for group in groups:
+            k = _tangent(group, p, sign)
+            if k < 0:
+                continue
+
+            q = group[k]
+            if best is None:
+                best = q
+                continue
+
+            # of collinear points, take the farthest, which is the largest
+            turn = orientation(p, best, q)
+            if sign * turn < 0 or turn == 0 and q[:2] > best[:2]:
+                best = q
+
+        if best is None:
+            return chain
+        chain.append(best)
+    return None
+
+
+def chan(points: Sequence[Point], group_size: int = 256) -> list[int]:
+    """Return the indices of the convex hull of the given set of points.
+
+    Splits the points into groups of m = group_size points and computes the
+    hull of every group with monotone chain. The lower and upper hull chains
+    are then gift-wrapped around the groups, finding the next vertex in each
+    group by binary search. If the hull turns out to have more than m
+    vertices, the wrapping is aborted and restarted with m squared, where the
+    new groups only contain the hull vertices of the old ones.
+
+    The default group size is large because with smaller groups, the first
+    wrapping takes longer than the group hulls save.
+
+    Complexity: O(n lg h) where h is the number of hull vertices
+    """
+    if group_size < 2:
+        raise ValueError("group size must be at least 2")
+    n = len(points)
+    if n == 0:
+        return []
+
+    m = min(group_size, n)
+    groups = [
+        sorted((x, y, i) for i, (x, y) in enumerate(points[start:start + m],
+                                                     start))
+        for start in range(0, n, m)
+    ]
+    while True:
+        chains = [_chains(group) for group in groups]
+        start = min(lo_chain[0] for lo_chain, _ in chains)
+
+        lo_hull = _wrap([lo_chain for lo_chain, _ in chains], start, 1, m + 1)
+        if lo_hull is not None:
+            hi_hull = _wrap([hi_chain for _, hi_chain in chains], start, -1,
+                            m + 2 - len(lo_hull))
+            if hi_hull is not None:
+                hull = lo_hull + hi_hull[-2:0:-1]
+                return [point[2] for point in hull]
+
+        # the hull of a group is the hull of the hulls of its parts
+        groups = [
+            sorted({
+                point
+                for lo_chain, hi_chain in chains[start:start + m]
+                for point in lo_chain + hi_chain
+            }) for start in range(0, len(chains), m)
+        ]
+        m = min(m * m, n)
+
+
+class IncrementalConvexHull:
+    """Convex hull of a growing set of points in the plane.
+
+    The lower and upper hull chains are kept as lists of (x, y, key) tuples
+    sorted lexicographically, so the neighbors of a point on either chain are
+    found by binary search. Inserting a point removes the chain vertices that
+    end up inside, each of which is removed at most once.
+    """
+
+    __slots__ = ("_lower", "_upper", "_size")
+
+    _lower: list[_Entry]
+    _upper: list[_Entry]
+    _size: int
+
+    def __init__(self, points: Iterable[Point] = ()):
+        """Initialize the hull of the given points.
+
+        Points receive the keys 0, 1, ... in order.
+
+        Complexity: O(n lg n)
+        """
+        entries = sorted((x, y, i) for i, (x, y) in enumerate(points))
+        self._lower, self._upper = _chains(entries)
+        self._size = len(entries)
+
+    @staticmethod
+    def _insert(chain: list[_Entry], point: _Entry, sign: int) -> None:
+        """Insert a point into a lower (sign 1) or upper (sign -1) chain."""
+        pos = bisect.bisect_left(chain, point[:2])
+        if pos < len(chain) and chain[pos][:2] == point[:2]:
+            return
+        if 0 < pos < len(chain) and sign * orientation(
+                chain[pos - 1], point, chain[pos]) <= 0:
+            return
+
+        start = pos
+        while start > 1 and sign * orientation(chain[start - 2],
+                                               chain[start - 1], point) <= 0:
+            start -= 1
+        stop = pos
+        while stop < len(chain) - 1 and sign * orientation(
+                point, chain[stop], chain[stop + 1]) <= 0:
+            stop += 1
+        chain[start:stop] = [point]
+
+    def insert(self, point: Point) -> int:
+        """Insert a point and return its key.
+
+        Duplicates of points inserted before are never hull vertices.
+
+        Complexity: O(lg h) amortized, plus O(h) to move list elements, where
+        h is the number of hull vertices
+        """
+        key = self._size
+        self._size += 1
+        entry = (point[0], point[1], key)
+        self._insert(self._lower, entry, 1)
+        self._insert(self._upper, entry, -1)
+        return key
+
+    @staticmethod
+    def _below(chain: list[_Entry], point: Point) -> int:
+        """Return the sign of the turn from the chain edge below or above the
+        given point to the point, assuming it lies within the chain's range."""
+        pos = bisect.bisect_left(chain, point)
+        if pos == 0:
+            return 0
+        return orientation(chain[pos - 1], chain[pos], point)
+
+    def contains(self, point: Point) -> bool:
+        """Return whether the point lies inside or on the boundary of the
+        hull.
+
+        Complexity: O(lg h)
+        """
+        point = (point[0], point[1])
+        if not self._lower:
+            return False
+        if not self._lower[0][:2] <= point <= self._lower[-1][:2]:
+            return False
+        return (self._below(self._lower, point) >= 0 and
+                self._below(self._upper, point) <= 0)
+
+    @staticmethod
+    def _extremes(chain: list[_Entry], point: Point, start: int,
+                  stop: int) -> list[_Entry]:
+        """Return the points of chain[start:stop] that may be extreme in angle
+        as seen from the given point.
+
+        Seen from a point outside the hull, the angle to the points of a
+        chain piece on one side of it is unimodal. So the extremes are at the
+        ends, or where the turn from point over two consecutive chain points
+        changes sign, which is found by binary search.
+        """
+        if stop - start < 3:
+            return chain[start:stop]
+
+        first = orientation(point, chain[start], chain[start + 1])
+        lo = start + 1
+        hi = stop - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if orientation(point, chain[mid], chain[mid + 1]) != first:
+                hi = mid
+            else:
+                lo = mid + 1
+        return [chain[start], chain[stop - 1]] + chain[lo - 1:lo + 2]
+
+    def tangents(self, point: Point) -> tuple[int, int]:
+        """Return the keys of the hull vertices touched by the two tangents
+        through a point outside the nonempty hull.
+
+        The hull lies to the left of the line from the point through the
+        first vertex, and to the right of the one through the second. Of
+        several vertices on a tangent, the farthest is returned.
+
+        Complexity: O(lg h)
+        """
+        if not self._lower:
+            raise ValueError("hull is empty")
+        point = (point[0], point[1])
+        if self.contains(point):
+            raise ValueError("point not outside hull")
+
+        candidates = []
+        for chain in self._lower, self._upper:
+            pos = bisect.bisect_left(chain, point)
+            candidates += self._extremes(chain, point, 0, pos)
+            candidates += self._extremes(chain, point, pos, len(chain))
+
+        def farther(p: _Entry, q: _Entry) -> bool:
+            return ((p[0] - point[0])**2 + (p[1] - point[1])**2 >
+                    (q[0] - point[0])**2 + (q[1] - point[1])**2)
+
+        right = left = candidates[0]
+        for candidate in candidates:
+            turn = orientation(point, right, candidate)
+            if turn < 0 or turn == 0 and farther(candidate, right):
+                right = candidate
+            turn = orientation(point, left, candidate)
+            if turn > 0 or turn == 0 and farther(candidate, left):
+                left = candidate
+        return right[2], left[2]
+
+    def vertices(self) -> list[int]:
+        """Return the keys of the hull vertices in counterclockwise order,
+        starting with the lexicographically smallest point.
+
+        Complexity: O(h)
+        """
+        hull = self._lower + self._upper[-2:0:-1]
+        return [point[2] for point in hull]
+
+    def __len__(self) -> int:
+        return self._size
@@ -0,0 +1,238 @@
+"""Algorithms for finding the convex hull of a set of points in space.
+
+Hulls are returned as lists of triangular faces, each an (i, j, k) triple of
+point indices in counterclockwise order as seen from outside the hull.
+
+A point only sees a face if it lies strictly above the plane through it. So
+points in the plane of a face are never added through it, and faces are never
+degenerate. Where four or more hull vertices are coplanar, the flat region is
+triangulated arbitrarily, and may have vertices on its edges or inside it.
+Predicates are exact, see the predicates module.
+"""
+
+import random
+from array import array
+from collections.abc import Sequence
+from numbers import Real
+
+from src.algorithms.geometry.convex_hull import monotone_chain
+from src.algorithms.geometry.predicates import (orientation, orientation_3d,
+                                                orientation_3d_error_bound)
+
+Point3 = tuple[Real, Real, Real]
+Face = tuple[int, int, int]
+
+
+def _sub(p: Point3, q: Point3) -> tuple[Real, Real, Real]:
+    return p[0] - q[0], p[1] - q[1], p[2] - q[2]
+
+
+def _normal(p: Point3, q: Point3, r: Point3) -> tuple[Real, Real, Real]:
+    """Return the cross product of q - p and r - p."""
+    ux, uy, uz = _sub(q, p)
+    vx, vy, vz = _sub(r, p)
+    return uy * vz - uz * vy, uz * vx - ux * vz, ux * vy - uy * vx
+
+
+def _collinear(p: Point3, q: Point3, r: Point3) -> bool:
+    return all(
+        orientation((p[i], p[j]), (q[i], q[j]), (r[i], r[j])) == 0
+        for i, j in ((0, 1), (1, 2), (2, 0)))
+
+
+def _planar_hull(points: Sequence[Point3], normal: tuple[Real, Real, Real],
+                 indices: list[int]) -> list[Face]:
+    """Return both sides of a triangulation of the hull of coplanar points
+    with the given normal.
+
+    The two sides are fans from different hull vertices, so that they share
+    no diagonal and every directed edge occurs in exactly one face."""
+    axis = max(range(3), key=lambda a: abs(normal[a]))
+    kept = [a for a in range(3) if a != axis]
+    projected = [(points[i][kept[0]], points[i][kept[1]]) for i in indices]
+    hull = [indices[k] for k in monotone_chain(projected)]
+
+    faces = []
+    for k in range(1, len(hull) - 1):
+        faces.append((hull[0], hull[k], hull[k + 1]))
+        faces.append((hull[1], hull[(k + 2) % len(hull)], hull[k + 1]))
+    return faces
+
+
+def randomized_incremental(points: Sequence[Point3]) -> list[Face]:
+    """Return the faces of the convex hull of the given set of points.
+
+    Starts with a tetrahedron of extreme points, then inserts the other
+    points in random order, maintaining a bipartite conflict graph between
+    the faces and the points not yet inserted that see them. An inserted
+    point deletes the faces it sees and connects the horizon to itself. The
+    conflicts of a new face are among those of the two old faces adjacent to
+    its horizon edge.
+
+    Faces are stored in flat arrays: the vertices and neighbors of face f are
+    at positions 3f, 3f + 1, 3f + 2, where the neighbor at 3f + k lies across
+    the edge from vertex k to vertex k + 1 (mod 3).
+
+    If all points are coplanar, returns both sides of a triangulation of
+    their planar hull. If they are collinear, returns no faces.
+
+    Complexity: O(n lg n) expected
+    """
+    n = len(points)
+    if n == 0:
+        return []
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    zs = [p[2] for p in points]
+
+    # start from a large tetrahedron of extreme points, so that many points
+    # are discarded right away: the extremes along the axis of largest
+    # spread, the point farthest from the line through them, and the point
+    # farthest from the plane through all three
+    column = max((xs, ys, zs), key=lambda c: max(c) - min(c))
+    a = column.index(min(column))
+    b = column.index(max(column))
+    if column[a] == column[b]:
+        return []
+
+    pa, pb = points[a], points[b]
+    normals = [_normal(pa, pb, p) for p in points]
+    areas = [x * x + y * y + z * z for x, y, z in normals]
+    c = areas.index(max(areas))
+    # the float estimates only pick the points, the exact predicates decide
+    # whether the input is degenerate
+    if _collinear(pa, pb, points[c]):
+        c = next((i for i in range(n) if not _collinear(pa, pb, points[i])),
+                 None)
+        if c is None:
+            return []
+
+    pc = points[c]
+    x, y, z = normals[c]
+    heights = [
+        abs(x * (px - pa[0]) + y * (py - pa[1]) + z * (pz - pa[2]))
+        for px, py, pz in zip(xs, ys, zs)
+    ]
+    e = heights.index(max(heights))
+    if orientation_3d(pa, pb, pc, points[e]) == 0:
+        e = next((i for i in range(n)
+                  if orientation_3d(pa, pb, pc, points[i]) != 0), None)
+        if e is None:
+            return _planar_hull(points, normals[c], list(range(n)))
+
+    vertices = array("l")
+    neighbors = array("l")
+    alive = bytearray()
+    # face f has normal (nx[f], ny[f], nz[f]), and the float test whether a
+    # point lies above it is only trusted beyond error_bounds[f]
+    nx = []
+    ny = []
+    nz = []
+    error_bounds = []
+    extent = [max(column) - min(column) for column in (xs, ys, zs)]
+    face_conflicts: list[list[int] | None] = []
+    point_conflicts: list[list[int]] = [[] for _ in range(n)]
+
+    def add_face(a: int, b: int, c: int) -> int:
+        f = len(alive)
+        vertices.extend((a, b, c))
+        neighbors.extend((-1, -1, -1))
+        alive.append(1)
+        x, y, z = _normal(points[a], points[b], points[c])
+        nx.append(x)
+        ny.append(y)
+        nz.append(z)
+        error_bounds.append(
+            orientation_3d_error_bound(points[a], points[b], points[c],
+                                       extent) if isinstance(x, float) else 0)
+        face_conflicts.append(None)
+        return f
+
+    def set_conflicts(f: int, candidates: list[int]) -> None:
+        x, y, z, bound = nx[f], ny[f], nz[f], error_bounds[f]
+        a, b, c = vertices[3 * f:3 * f + 3]
+        ax, ay, az = xs[a], ys[a], zs[a]
+        conflicts = [
+            q for q in candidates
+            if x * (xs[q] - ax) + y * (ys[q] - ay) + z * (zs[q] - az) > -bound
+        ]
+        if bound:
+            u, v, w = points[a], points[b], points[c]
+            conflicts = [
+                q for q in conflicts
+                if x * (xs[q] - ax) + y * (ys[q] - ay) + z * (zs[q] - az) >
+                bound or orientation_3d(u, v, w, points[q]) > 0
+            ]
+        # candidates may repeat
+        conflicts = list(dict.fromkeys(conflicts))
+        face_conflicts[f] = conflicts
+        for q in conflicts:
+            point_conflicts[q].append(f)
+
+    # the initial tetrahedron, with faces oriented away from the fourth point
+    if orientation_3d(points[a], points[b], points[c], points[e]) > 0:
+        b, c = c, b
+    for face in (a, b, c), (a, e, b), (b, e, c), (c, e, a):
+        add_face(*face)
+    for f in range(4):
+        for k in range(3):
+            u = vertices[3 * f + k]
+            v = vertices[3 * f + (k + 1) % 3]
+            for g in range(4):
+                if g != f and _edge_position(vertices, g, v, u) >= 0:
+                    neighbors[3 * f + k] = g
+
+    initial = {a, b, c, e}
+    rest = [i for i in range(n) if i not in initial]
+    random.shuffle(rest)
+    for f in range(4):
+        set_conflicts(f, rest)
+
+    for p in rest:
+        visible = [f for f in point_conflicts[p] if alive[f]]
+        point_conflicts[p] = []
+        if not visible:
+            continue
+
+        for f in visible:
+            alive[f] = 0
+
+        # new faces over the horizon edges, indexed by their first and
+        # second vertex
+        by_start = {}
+        by_end = {}
+        for f in visible:
+            for k in range(3):
+                g = neighbors[3 * f + k]
+                if not alive[g]:
+                    continue
+
+                u = vertices[3 * f + k]
+                v = vertices[3 * f + (k + 1) % 3]
+                t = add_face(u, v, p)
+                neighbors[3 * t] = g
+                neighbors[3 * g + _edge_position(vertices, g, v, u)] = t
+                by_start[u] = t
+                by_end[v] = t
+                set_conflicts(t, face_conflicts[f] + face_conflicts[g])
+
+        for u, t in by_start.items():
+            v = vertices[3 * t + 1]
+            neighbors[3 * t + 1] = by_start[v]
+            neighbors[3 * t + 2] = by_end[u]
+
+        for f in visible:
+            face_conflicts[f] = None
+
+    return [(vertices[3 * f], vertices[3 * f + 1], vertices[3 * f + 2])
+            for f in range(len(alive)) if alive[f]]
+
+
+def _edge_position(vertices: array, f: int, u: int, v: int) -> int:
+    """Return the k such that face f has the edge from vertex k to vertex
+    k + 1 (mod 3) going from u to v, or -1 if it has no such edge."""
+    for k in range(3):
+        if (vertices[3 * f + k] == u
+                and vertices[3 * f + (k + 1) % 3] == v):
+            return k
+    return -1
@@ -0,0 +1,261 @@
+"""Array-backed k-d tree for nearest neighbor and range queries.
+
+Points are stored by coordinate in flat arrays, in the order of an implicit
+balanced tree: the node covering positions [start, stop) splits at the median
+position mid = (start + stop) // 2 along the axis of largest spread, with
+[start, mid) on one side and [mid, stop) on the other. The split axis and
+value of every such node are stored at index mid of two further arrays.
+Ranges of at most leaf_size positions are leaves, which are scanned as a
+whole with NumPy.
+
+Coordinates are converted to floats, and stored in a d x n float64 array.
+"""
+
+import heapq
+import random
+from array import array
+from collections.abc import Iterable, MutableSequence, Sequence
+from numbers import Real
+
+import numpy as np
+
+Point = Sequence[Real]
+
+
+def _select(order: MutableSequence[int], start: int, stop: int, rank: int,
+            values: Sequence[float]) -> None:
+    """Rearrange order[start:stop] around the element of given rank.
+
+    Afterwards, values[order[i]] <= values[order[rank]] for start <= i < rank,
+    and values[order[i]] >= values[order[rank]] for rank < i < stop.
+
+    Uses a three-way partition, so that duplicate values don't slow it down.
+
+    Complexity: O(k) expected, where k is the length of the range
+    """
+    while stop - start > 1:
+        pivot = values[order[random.randrange(start, stop)]]
+
+        # order[start:lt] < pivot, order[lt:i] == pivot, order[gt:stop] > pivot
+        lt = i = start
+        gt = stop
+        while i < gt:
+            value = values[order[i]]
+            if value < pivot:
+                order[lt], order[i] = order[i], order[lt]
+                lt += 1
+                i += 1
+            elif value > pivot:
+                gt -= 1
+                order[gt], order[i] = order[i], order[gt]
+            else:
+                i += 1
+
+        if rank < lt:
+            stop = lt
+        elif rank >= gt:
+            start = gt
+        else:
+            return
+
+
+class KDTree:
+    """Static k-d tree over a list of points of equal dimension."""
+
+    __slots__ = ("_coords", "_indices", "_axes", "_splits", "_leaf_size")
+
+    _coords: np.ndarray
+    _indices: array
+    _axes: array
+    _splits: array
+    _leaf_size: int
+
+    def __init__(self, points: Sequence[Point], leaf_size: int = 16):
+        """Build a k-d tree over the given points.
+
+        Complexity: O(d n lg n) expected, where d is the number of dimensions
+        """
+        n = len(points)
+        dimension = len(points[0]) if n else 0
+        if any(len(point) != dimension for point in points):
+            raise ValueError("points differ in dimension")
+        if n and not dimension:
+            raise ValueError("points must have at least one dimension")
+        if leaf_size < 1:
+            raise ValueError("leaf size must be positive")
+
+        columns = [[float(point[axis]) for point in points]
+                   for axis in range(dimension)]
+        order = list(range(n))
+        axes = array("b", [-1]) * n
+        splits = array("d", [0.0]) * n
+
+        stack = [(0, n)]
+        while stack:
+            start, stop = stack.pop()
+            if stop - start <= leaf_size:
+                continue
+
+            axis = max(range(dimension),
+                       key=lambda a: self._spread(columns[a], order, start,
+                                                  stop))
+            mid = (start + stop) // 2
+            _select(order, start, stop, mid, columns[axis])
+            axes[mid] = axis
+            splits[mid] = columns[axis][order[mid]]
+
+            stack.append((start, mid))
+            stack.append((mid, stop))
+
+        self._coords = np.array(columns, dtype=np.float64).reshape(
+            dimension, n)[:, order]
+        self._indices = array("l", order)
+        self._axes = axes
+        self._splits = splits
+        self._leaf_size = leaf_size
+
+    @staticmethod
+    def _spread(column: Sequence[float], order: Sequence[int], start: int,
+                stop: int) -> float:
+        values = [column[i] for i in order[start:stop]]
+        return max(values) - min(values)
+
+    def _leaf_distances(self, point: np.ndarray, start: int,
+                        stop: int) -> list[float]:
+        """Return the squared distances from the query, given as a d x 1
+        array, to positions start:stop."""
+        diffs = self._coords[:, start:stop] - point
+        return np.einsum("ij,ij->j", diffs, diffs).tolist()
+
+    def _check_query(self, query: Point) -> list[float]:
+        if self._indices and len(query) != len(self._coords):
+            raise ValueError(f"query has dimension {len(query)}, "
+                             f"tree has dimension {len(self._coords)}")
+        return [float(x) for x in query]
+
+    def _nearest(self, query: list[float], k: int,
+                 exclude: int = -1) -> list[int]:
+        # max-heap of (-squared distance, -index) for the best k found
+        best = []
+        point = np.array(query).reshape(-1, 1)
+        indices = self._indices
+        axes = self._axes
+        splits = self._splits
+        leaf_size = self._leaf_size
+
+        stack = [(0.0, 0, len(indices))]
+        while stack:
+            bound, start, stop = stack.pop()
+            if len(best) == k and bound > -best[0][0]:
+                continue
+
+            if stop - start <= leaf_size:
+                distances = self._leaf_distances(point, start, stop)
+                for offset, distance in enumerate(distances):
+                    idx = indices[start + offset]
+                    if idx == exclude:
+                        continue
+                    item = (-distance, -idx)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+                continue
+
+            mid = (start + stop) // 2
+            axis = axes[mid]
+            diff = query[axis] - splits[mid]
+            plane_bound = max(bound, diff * diff)
+            # push the far side first, so that the near side is visited first
+            if diff < 0:
+                stack.append((plane_bound, mid, stop))
+                stack.append((bound, start, mid))
+            else:
+                stack.append((plane_bound, start, mid))
+                stack.append((bound, mid, stop))
+
+        best.sort(reverse=True)
+        return [-idx for _, idx in best]
+
+    def nearest(self, query: Point, k: int = 1) -> list[int]:
+        """Return the indices of the k points nearest to query.
+
+        Indices are ordered by distance, with ties broken by index. If there
+        are fewer than k points, all of them are returned.
+
+        Complexity: O(k lg k + lg n) expected for well-distributed points
+        """
+        if k < 1 or not self._indices:
+            return []
+        return self._nearest(self._check_query(query), k)
+
+    def within(self, query: Point, radius: Real) -> list[int]:
+        """Return the indices of all points at distance at most radius.
+
+        Indices are returned in increasing order.
+
+        Complexity: O(lg n + r) expected for well-distributed points, where r
+        is the number of points returned
+        """
+        if not self._indices:
+            return []
+        query = self._check_query(query)
+        point = np.array(query).reshape(-1, 1)
+        squared_radius = radius * radius
+        indices = self._indices
+        axes = self._axes
+        splits = self._splits
+
+        result = []
+        stack = [(0, len(indices))]
+        while stack:
+            start, stop = stack.pop()
+
+            if stop - start <= self._leaf_size:
+                distances = self._leaf_distances(point, start, stop)
+                result.extend(indices[start + offset]
+                              for offset, distance in enumerate(distances)
+                              if distance <= squared_radius)
+                continue
+
+            mid = (start + stop) // 2
+            axis = axes[mid]
+            diff = query[axis] - splits[mid]
+            if diff <= radius:
+                stack.append((start, mid))
+            if diff >= -radius:
+                stack.append((mid, stop))
+
+        result.sort()
+        return result
+
+    def nearest_batch(self, queries: Iterable[Point],
+                      k: int = 1) -> list[list[int]]:
+        """Return the result of nearest for every query."""
+        return [self.nearest(query, k) for query in queries]
+
+    def within_batch(self, queries: Iterable[Point],
+                     radius: Real) -> list[list[int]]:
+        """Return the result of within for every query."""
+        return [self.within(query, radius) for query in queries]
+
+    def all_nearest_neighbors(self) -> list[int]:
+        """Return for every point the index of the nearest other point.
+
+        Ties are broken by index. Requires at least two points.
+
+        Complexity: O(n lg n) expected for well-distributed points
+        """
+        n = len(self._indices)
+        if n < 2:
+            raise ValueError("input smaller than 2")
+
+        result = [-1 for _ in range(n)]
+        for position in range(n):
+            idx = self._indices[position]
+            query = self._coords[:, position].tolist()
+            result[idx] = self._nearest(query, 1, exclude=idx)[0]
+        return result
+
+    def __len__(self) -> int:
+        return len(self._indices)
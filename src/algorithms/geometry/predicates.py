@@ -0,0 +1,139 @@
+"""Robust geometric predicates.
+
+Each predicate returns the sign of a determinant. With float coordinates,
+the determinant is first evaluated in floating point, together with a bound
+on its rounding error, as in Shewchuk's "Adaptive Precision Floating-Point
+Arithmetic and Fast Robust Geometric Predicates". Only if the bound doesn't
+settle the sign is the determinant recomputed exactly with Fractions. With
+int or Fraction coordinates, the floating-point evaluation is already exact.
+
+The error bounds assume that all coordinates are floats, or ints that floats
+represent exactly.
+"""
+
+import sys
+from collections.abc import Sequence
+from fractions import Fraction
+from numbers import Real
+
+Point = Sequence[Real]
+
+_EPSILON = sys.float_info.epsilon / 2
+_ORIENTATION_BOUND = (3 + 16 * _EPSILON) * _EPSILON
+_ORIENTATION_3D_BOUND = (7 + 56 * _EPSILON) * _EPSILON
+_IN_CIRCLE_BOUND = (10 + 96 * _EPSILON) * _EPSILON
+# covers the absolute error of products that underflow
+_UNDERFLOW = 2.0**-1020
+
+
+def _sign(value: Real) -> int:
+    return (value > 0) - (value < 0)
+
+
+def _orientation_determinant(p: Point, q: Point,
+                             r: Point) -> tuple[Real, Real]:
+    left = (q[0] - p[0]) * (r[1] - p[1])
+    right = (q[1] - p[1]) * (r[0] - p[0])
+    return left - right, abs(left) + abs(right)
+
+
+def orientation(p: Point, q: Point, r: Point) -> int:
+    """Return 1 if p, q, r make a left (counterclockwise) turn, -1 if they
+    make a right turn, and 0 if they are collinear.
+
+    Complexity: O(1)
+    """
+    det, permanent = _orientation_determinant(p, q, r)
+    if not isinstance(det, float):
+        return _sign(det)
+    if abs(det) > _ORIENTATION_BOUND * permanent + _UNDERFLOW:
+        return _sign(det)
+    return _sign(
+        _orientation_determinant(*([Fraction(x) for x in point[:2]]
+                                   for point in (p, q, r)))[0])
+
+
+def _orientation_3d_determinant(p: Point, q: Point, r: Point,
+                                s: Point) -> tuple[Real, Real]:
+    ux, uy, uz = q[0] - p[0], q[1] - p[1], q[2] - p[2]
+    vx, vy, vz = r[0] - p[0], r[1] - p[1], r[2] - p[2]
+    wx, wy, wz = s[0] - p[0], s[1] - p[1], s[2] - p[2]
+    uyvz, uzvy = uy * vz, uz * vy
+    uzvx, uxvz = uz * vx, ux * vz
+    uxvy, uyvx = ux * vy, uy * vx
+    det = wx * (uyvz - uzvy) + wy * (uzvx - uxvz) + wz * (uxvy - uyvx)
+    permanent = (abs(wx) * (abs(uyvz) + abs(uzvy)) + abs(wy) *
+                 (abs(uzvx) + abs(uxvz)) + abs(wz) * (abs(uxvy) + abs(uyvx)))
+    return det, permanent
+
+
+def orientation_3d(p: Point, q: Point, r: Point, s: Point) -> int:
+    """Return 1 if s lies above the plane through p, q, r, as seen from
+    which p, q, r are in counterclockwise order, -1 if it lies below, and 0
+    if the four points are coplanar.
+
+    Complexity: O(1)
+    """
+    det, permanent = _orientation_3d_determinant(p, q, r, s)
+    if not isinstance(det, float):
+        return _sign(det)
+    if abs(det) > _ORIENTATION_3D_BOUND * permanent + _UNDERFLOW:
+        return _sign(det)
+    return _sign(
+        _orientation_3d_determinant(*([Fraction(x) for x in point[:3]]
+                                      for point in (p, q, r, s)))[0])
+
+
+def orientation_3d_error_bound(p: Point, q: Point, r: Point,
+                               extent: Sequence[float]) -> float:
+    """Return a bound on the rounding error of the float determinant that
+    orientation_3d(p, q, r, s) computes, for any s whose coordinates differ
+    from those of p by at most extent.
+
+    Filters that evaluate the determinant for many s can decide those where
+    it exceeds the bound, and call orientation_3d for the rest.
+
+    Complexity: O(1)
+    """
+    ux, uy, uz = q[0] - p[0], q[1] - p[1], q[2] - p[2]
+    vx, vy, vz = r[0] - p[0], r[1] - p[1], r[2] - p[2]
+    permanent = (extent[0] * (abs(uy * vz) + abs(uz * vy)) + extent[1] *
+                 (abs(uz * vx) + abs(ux * vz)) + extent[2] *
+                 (abs(ux * vy) + abs(uy * vx)))
+    return _ORIENTATION_3D_BOUND * permanent + _UNDERFLOW
+
+
+def _in_circle_determinant(a: Point, b: Point, c: Point,
+                           d: Point) -> tuple[Real, Real]:
+    adx, ady = a[0] - d[0], a[1] - d[1]
+    bdx, bdy = b[0] - d[0], b[1] - d[1]
+    cdx, cdy = c[0] - d[0], c[1] - d[1]
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+    det = (alift * (bdxcdy - cdxbdy) + blift * (cdxady - adxcdy) + clift *
+           (adxbdy - bdxady))
+    permanent = ((abs(bdxcdy) + abs(cdxbdy)) * alift +
+                 (abs(cdxady) + abs(adxcdy)) * blift +
+                 (abs(adxbdy) + abs(bdxady)) * clift)
+    return det, permanent
+
+
+def in_circle(a: Point, b: Point, c: Point, d: Point) -> int:
+    """Return 1 if d lies inside the circle through a, b, c, -1 if it lies
+    outside, and 0 if it lies on it. The points a, b, c must be in
+    counterclockwise order, otherwise the sign is reversed.
+
+    Complexity: O(1)
+    """
+    det, permanent = _in_circle_determinant(a, b, c, d)
+    if not isinstance(det, float):
+        return _sign(det)
+    if abs(det) > _IN_CIRCLE_BOUND * permanent + _UNDERFLOW:
+        return _sign(det)
+    return _sign(
+        _in_circle_determinant(*([Fraction(x) for x in point[:2]]
+                                 for point in (a, b, c, d)))[0])
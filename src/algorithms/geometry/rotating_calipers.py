@@ -0,0 +1,174 @@
+"""Rotating calipers over convex hulls.
+
+All functions take a list of points and the indices of their convex hull in
+counterclockwise order without collinear vertices, as returned by
+convex_hull.monotone_chain.
+"""
+
+import math
+from collections.abc import Iterator, Sequence
+from numbers import Real
+
+from src.algorithms.geometry.convex_hull import Point
+
+
+def _cross(p: Point, q: Point, r: Point) -> Real:
+    """Return the cross product of q - p and r - p."""
+    return (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0])
+
+
+def _dot(p: Point, q: Point, r: Point) -> Real:
+    """Return the dot product of q - p and r - p."""
+    return (q[0] - p[0]) * (r[0] - p[0]) + (q[1] - p[1]) * (r[1] - p[1])
+
+
+def _squared_distance(p: Point, q: Point) -> Real:
+    return (p[0] - q[0])**2 + (p[1] - q[1])**2
+
+
+def _hull_points(points: Sequence[Point], hull: Sequence[int]) -> list[Point]:
+    if not hull:
+        raise ValueError("empty hull")
+    return [points[idx] for idx in hull]
+
+
+def diameter(points: Sequence[Point], hull: Sequence[int]) -> tuple[int, int]:
+    """Return the indices of two points at pairwise maximal distance.
+
+    For every hull edge, the calipers track the vertex farthest from the
+    line through it, and only such antipodal pairs are compared.
+
+    Complexity: O(h) where h is the number of hull vertices
+    """
+    ps = _hull_points(points, hull)
+    h = len(ps)
+    if h < 3:
+        return hull[0], hull[-1]
+
+    best = 0
+    out = None
+    j = 1
+    for i in range(h):
+        p = ps[i]
+        q = ps[(i + 1) % h]
+        while _cross(p, q, ps[(j + 1) % h]) > _cross(p, q, ps[j]):
+            j = (j + 1) % h
+        for k in i, (i + 1) % h:
+            distance = _squared_distance(ps[k], ps[j])
+            if distance > best:
+                best = distance
+                out = (hull[k], hull[j])
+    return out
+
+
+def minimum_width(points: Sequence[Point], hull: Sequence[int]) -> float:
+    """Return the smallest distance between two parallel lines enclosing the
+    points.
+
+    The minimum is attained with one line through a hull edge, and the other
+    through the vertex farthest from it.
+
+    Complexity: O(h) where h is the number of hull vertices
+    """
+    ps = _hull_points(points, hull)
+    h = len(ps)
+    if h < 3:
+        return 0.0
+
+    best = math.inf
+    j = 1
+    for i in range(h):
+        p = ps[i]
+        q = ps[(i + 1) % h]
+        while _cross(p, q, ps[(j + 1) % h]) > _cross(p, q, ps[j]):
+            j = (j + 1) % h
+        best = min(best, _cross(p, q, ps[j]) / math.dist(p, q))
+    return best
+
+
+def _rectangles(ps: list[Point]) -> Iterator[tuple[int, int, int, int]]:
+    """Yield for every hull edge i the positions of the vertices extreme
+    along its direction (minimum and maximum) and away from it.
+
+    Complexity: O(h) where h is the number of hull vertices
+    """
+    h = len(ps)
+    p, q = ps[0], ps[1 % h]
+    right = max(range(h), key=lambda k: _dot(p, q, ps[k]))
+    top = max(range(h), key=lambda k: _cross(p, q, ps[k]))
+    left = min(range(h), key=lambda k: _dot(p, q, ps[k]))
+
+    for i in range(h):
+        p, q = ps[i], ps[(i + 1) % h]
+        while _dot(p, q, ps[(right + 1) % h]) > _dot(p, q, ps[right]):
+            right = (right + 1) % h
+        while _cross(p, q, ps[(top + 1) % h]) > _cross(p, q, ps[top]):
+            top = (top + 1) % h
+        while _dot(p, q, ps[(left + 1) % h]) < _dot(p, q, ps[left]):
+            left = (left + 1) % h
+        yield i, left, right, top
+
+
+def _rectangle_corners(ps: list[Point], i: int, left: int, right: int,
+                       top: int) -> list[tuple[float, float]]:
+    p, q = ps[i], ps[(i + 1) % len(ps)]
+    length = math.dist(p, q)
+    ux = (q[0] - p[0]) / length
+    uy = (q[1] - p[1]) / length
+    lo = _dot(p, q, ps[left]) / length
+    hi = _dot(p, q, ps[right]) / length
+    height = _cross(p, q, ps[top]) / length
+    return [(p[0] + ux * lo, p[1] + uy * lo),
+            (p[0] + ux * hi, p[1] + uy * hi),
+            (p[0] + ux * hi - uy * height, p[1] + uy * hi + ux * height),
+            (p[0] + ux * lo - uy * height, p[1] + uy * lo + ux * height)]
+
+
+def _minimum_rectangle(points: Sequence[Point], hull: Sequence[int],
+                       perimeter: bool) -> list[tuple[float, float]]:
+    ps = _hull_points(points, hull)
+    if len(ps) == 1:
+        return [(float(ps[0][0]), float(ps[0][1]))] * 4
+
+    best = math.inf
+    out = None
+    for i, left, right, top in _rectangles(ps):
+        p, q = ps[i], ps[(i + 1) % len(ps)]
+        length = _dot(p, q, q)
+        extent = _dot(p, q, ps[right]) - _dot(p, q, ps[left])
+        height = _cross(p, q, ps[top])
+        if perimeter:
+            size = (extent + height) / math.sqrt(length)
+        else:
+            size = extent * height / length
+        if size < best:
+            best = size
+            out = (i, left, right, top)
+    return _rectangle_corners(ps, *out)
+
+
+def minimum_area_rectangle(points: Sequence[Point],
+                           hull: Sequence[int]) -> list[tuple[float, float]]:
+    """Return the corners, in counterclockwise order, of a rectangle of
+    minimal area enclosing the points.
+
+    The optimal rectangle has a side on a hull edge. For every edge in turn,
+    the calipers track the vertices extreme along and away from it.
+
+    Complexity: O(h) where h is the number of hull vertices
+    """
+    return _minimum_rectangle(points, hull, False)
+
+
+def minimum_perimeter_rectangle(
+        points: Sequence[Point],
+        hull: Sequence[int]) -> list[tuple[float, float]]:
+    """Return the corners, in counterclockwise order, of a rectangle of
+    minimal perimeter enclosing the points.
+
+    Like minimum_area_rectangle, the optimal rectangle has a side on a hull
+    edge.
+
+    Complexity: O(h) where h is the number of hull vertices
+    """
+    return _minimum_rectangle(points, hull, True)
@@ -0,0 +1,253 @@
+"""NumPy-vectorized algorithms for the closest pair in d dimensions.
+
+Where squaring would overflow or underflow, distances are computed
+hypot-style, scaling each difference vector by its largest component. Since
+vectorized and scalar distances may round differently, all pairs within a
+tiny relative tolerance of the minimum are kept as candidates, and the final
+choice among them is made with math.dist, as in closest_pair.
+
+Coordinates are converted to float64, which is exact for floats and for
+integers up to 2^53 in absolute value. If some coordinate is not exactly
+representable, such as a larger integer, both algorithms fall back to an
+O(d n^2) pure Python comparison of exact squared distances.
+"""
+
+import itertools
+import math
+from collections.abc import Sequence
+from fractions import Fraction
+from numbers import Real
+
+import numpy as np
+
+# relative tolerance between vectorized distances and math.dist
+_TOLERANCE = 1e-12
+# absolute tolerance for distances in the subnormal range
+_SLACK = 1e-320
+# squared distances below this may have lost precision to underflow
+_TINY = 1e-280
+
+
+def _as_columns(points: Sequence[Sequence[Real]]) -> np.ndarray:
+    """Return the coordinates as a d x n array, one row per axis."""
+    n = len(points)
+    if n < 2:
+        raise ValueError("input smaller than 2")
+    return np.asarray(points, dtype=np.float64).reshape(n, -1).T.copy()
+
+
+def _is_exact(points: Sequence[Sequence[Real]], columns: np.ndarray) -> bool:
+    """Return whether the float64 columns hold every coordinate exactly."""
+    if np.abs(columns).max() < 2.0**53:
+        return True
+    return all(float(c) == c for point in points for c in point)
+
+
+def _exact_brute_force(points: Sequence[Sequence[Real]]) -> tuple[int, int]:
+    """Return the indices of two points at pairwise minimal distance,
+    comparing exact squared distances.
+
+    Complexity: O(d n^2)
+    """
+    exact = [
+        tuple(c if isinstance(c, int) else Fraction(c) for c in point)
+        for point in points
+    ]
+    return min(itertools.combinations(range(len(exact)), 2),
+               key=lambda pair: sum((a - b)**2 for a, b in zip(
+                   exact[pair[0]], exact[pair[1]])))
+
+
+def _norms(diffs: Sequence[np.ndarray]) -> np.ndarray:
+    """Return the euclidean norms of the vectors whose components along each
+    axis are given by diffs."""
+    squares = diffs[0] * diffs[0]
+    for diff in diffs[1:]:
+        squares += diff * diff
+    if squares.max(initial=0) < np.inf:
+        tiny = (squares < _TINY if squares.min(initial=_TINY) < _TINY else
+                None)
+        if tiny is None or not any(np.any(diff[tiny]) for diff in diffs):
+            return np.sqrt(squares, out=squares)
+
+    # some squares of nonzero vectors under- or overflow, rescale each
+    # vector by its largest component like math.hypot does
+    scale = np.maximum.reduce([np.abs(diff) for diff in diffs])
+    safe_scale = np.where(scale > 0, scale, 1.0)
+    squares = sum((diff / safe_scale)**2 for diff in diffs)
+    return scale * np.sqrt(squares)
+
+
+def _threshold(distance: float) -> float:
+    return distance * (1 + _TOLERANCE) + _SLACK
+
+
+class _Candidates:
+    """Collects pairs whose distance may be minimal."""
+
+    __slots__ = ("best", "_batches")
+
+    def __init__(self):
+        self.best = math.inf
+        self._batches = []
+
+    def add(self, first: np.ndarray, second: np.ndarray,
+            distances: np.ndarray) -> None:
+        if not len(distances):
+            return
+        local_best = distances.min()
+        if local_best > _threshold(self.best):
+            return
+
+        self.best = min(self.best, local_best)
+        keep = distances <= _threshold(local_best)
+        self._batches.append((first[keep], second[keep], distances[keep]))
+
+    def closest(self, points: Sequence[Sequence[Real]]) -> tuple[int, int]:
+        limit = _threshold(self.best)
+        pairs = (
+            (i, j)
+            for first, second, distances in self._batches
+            for i, j in zip(first[distances <= limit].tolist(),
+                            second[distances <= limit].tolist()))
+        return min(pairs, key=lambda pair: math.dist(points[pair[0]],
+                                                     points[pair[1]]))
+
+
+def blocked_brute_force(points: Sequence[Sequence[Real]],
+                        block_size: int = 128) -> tuple[int, int]:
+    """Return the indices of two points at pairwise minimal distance.
+
+    Compares all pairs, a block_size x block_size tile of the distance matrix
+    at a time, so that memory use is O(d block_size^2) instead of O(n^2).
+
+    Complexity: O(d n^2)
+    """
+    columns = _as_columns(points)
+    if not _is_exact(points, columns):
+        return _exact_brute_force(points)
+    n = columns.shape[1]
+    candidates = _Candidates()
+    lower = np.tri(block_size, dtype=bool)
+
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        for tile_start in range(start, n, block_size):
+            tile_stop = min(tile_start + block_size, n)
+            distances = _norms([
+                np.subtract.outer(column[start:stop],
+                                  column[tile_start:tile_stop])
+                for column in columns
+            ])
+            if start == tile_start:
+                distances[lower[:stop - start, :stop - start]] = np.inf
+
+            local_best = distances.min()
+            if local_best <= _threshold(candidates.best):
+                first, second = np.nonzero(
+                    distances <= _threshold(local_best))
+                candidates.add(first + start, second + tile_start,
+                               distances[first, second])
+
+    return candidates.closest(points)
+
+
+def rabin_lipton_nd(points: Sequence[Sequence[Real]],
+                    max_pairs: int = 1 << 20) -> tuple[int, int]:
+    """Return the indices of two points at pairwise minimal distance.
+
+    Like rabin_lipton_2d, but for any number of dimensions d: the minimum
+    distance of n random pairs is used as grid unit, and points are compared
+    with the points in the same and the 3^d - 1 surrounding cells. Cell keys
+    are computed for all points at once, and cells are matched to their
+    neighbors by binary search over the sorted keys. At most max_pairs
+    distances are computed at a time.
+
+    Falls back to blocked_brute_force if the spread of the points exceeds
+    2^62 times the grid unit, since cell keys would overflow.
+
+    Complexity: O(3^d n) expected, O(d n^2) worst case
+    """
+    columns = _as_columns(points)
+    if not _is_exact(points, columns):
+        return _exact_brute_force(points)
+    dimension, n = columns.shape
+
+    rng = np.random.default_rng()
+    first = rng.integers(0, n, n)
+    second = rng.integers(0, n - 1, n)
+    second += second >= first
+    sample = _norms([column[first] - column[second]
+                     for column in columns])
+    best = int(sample.argmin())
+    if sample[best] == 0:
+        return int(first[best]), int(second[best])
+
+    grid_unit = sample[best] * (1 + 1e-9)
+    scaled = (columns - columns.min(axis=1)[:, None]) / grid_unit
+    if not np.all(scaled < 2.0**62):
+        return blocked_brute_force(points)
+    cells = np.floor(scaled).astype(np.int64).T
+
+    key_type = np.dtype((np.void, 8 * dimension))
+
+    def keys_of(cell_array: np.ndarray) -> np.ndarray:
+        return np.ascontiguousarray(cell_array).view(key_type).ravel()
+
+    # group the points by cell
+    order = np.argsort(keys_of(cells), kind="stable")
+    sorted_keys = keys_of(cells)[order]
+    is_start = np.ones(n, dtype=bool)
+    is_start[1:] = sorted_keys[1:] != sorted_keys[:-1]
+    starts = np.flatnonzero(is_start)
+    sizes = np.diff(np.append(starts, n))
+    cell_keys = sorted_keys[starts]
+    occupied = cells[order[starts]]
+
+    candidates = _Candidates()
+    # each unordered pair of neighboring cells is visited once, via the
+    # offsets whose first nonzero component is positive, or the zero offset
+    for offset in itertools.product((-1, 0, 1), repeat=dimension):
+        nonzero = [c for c in offset if c]
+        if nonzero and nonzero[0] < 0:
+            continue
+
+        neighbor_keys = keys_of(occupied + np.array(offset, dtype=np.int64))
+        positions = np.searchsorted(cell_keys, neighbor_keys)
+        positions[positions == len(cell_keys)] = 0
+        found = cell_keys[positions] == neighbor_keys
+        cell_a = np.flatnonzero(found)
+        cell_b = positions[found]
+
+        # enumerate all point pairs of the matched cells, in chunks
+        pair_counts = sizes[cell_a] * sizes[cell_b]
+        ends = np.cumsum(pair_counts)
+        chunk_start = 0
+        while chunk_start < len(cell_a):
+            offset_total = ends[chunk_start] - pair_counts[chunk_start]
+            chunk_stop = max(
+                chunk_start + 1,
+                int(np.searchsorted(ends, offset_total + max_pairs, "right")))
+            a = cell_a[chunk_start:chunk_stop]
+            b = cell_b[chunk_start:chunk_stop]
+            counts = pair_counts[chunk_start:chunk_stop]
+
+            pair_cell = np.repeat(np.arange(len(a)), counts)
+            local = np.arange(counts.sum()) - np.repeat(
+                np.cumsum(counts) - counts, counts)
+            b_sizes = sizes[b][pair_cell]
+            local_a = local // b_sizes
+            local_b = local % b_sizes
+            if not nonzero:
+                keep = local_a < local_b
+                pair_cell = pair_cell[keep]
+                local_a = local_a[keep]
+                local_b = local_b[keep]
+
+            i = order[starts[a][pair_cell] + local_a]
+            j = order[starts[b][pair_cell] + local_b]
+            distances = _norms([column[i] - column[j] for column in columns])
+            candidates.add(i, j, distances)
+            chunk_start = chunk_stop
+
+    return candidates.closest(points)
@@ -0,0 +1,113 @@
+"""Compressed sparse row (CSR) representation of graphs.
+
+The neighbors of vertex u are targets[offsets[u]:offsets[u + 1]]. Storing the
+graph in two flat arrays avoids the per-vertex list objects of an adjacency
+list, which both saves memory and makes the graph cheap to share with worker
+processes.
+"""
+
+import itertools
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import TypeAlias
+
+AdjacencyList: TypeAlias = list[list[int]]
+
+
+@dataclass(slots=True, frozen=True)
+class CSRGraph:
+    """Static graph stored as offset and target arrays."""
+
+    offsets: array
+    targets: array
+
+    @classmethod
+    def from_adjacency_list(cls, adj: AdjacencyList) -> "CSRGraph":
+        """Build a CSR graph with the same arcs as the given adjacency list.
+
+        Complexity: O(n + m)
+        """
+        offsets = array("q", [0])
+        targets = array("q")
+        for neighbors in adj:
+            targets.extend(neighbors)
+            offsets.append(len(targets))
+        return cls(offsets, targets)
+
+    @classmethod
+    def from_arcs(cls, n: int, tails: Iterable[int],
+                  heads: Iterable[int]) -> "CSRGraph":
+        """Build a CSR graph on n vertices with arcs tails[i] -> heads[i].
+
+        Arcs are bucketed by tail using a counting sort, so the order of the
+        arcs leaving each vertex matches their input order.
+
+        Complexity: O(n + m)
+        """
+        tails = array("q", tails)
+        heads = array("q", heads)
+        if len(tails) != len(heads):
+            raise ValueError("tails and heads differ in length")
+
+        offsets = array("q", [0]) * (n + 1)
+        for u in tails:
+            offsets[u + 1] += 1
+        for u in range(n):
+            offsets[u + 1] += offsets[u]
+
+        position = offsets[:n]
+        targets = array("q", [0]) * len(heads)
+        for u, v in zip(tails, heads):
+            targets[position[u]] = v
+            position[u] += 1
+        return cls(offsets, targets)
+
+    @classmethod
+    def from_edges(cls, n: int,
+                   edges: Iterable[tuple[int, ...]]) -> "CSRGraph":
+        """Build an undirected CSR graph on n vertices.
+
+        Each edge is given as a tuple starting with its two endpoints; any
+        further entries (such as weights) are ignored. Both directions of every
+        edge are stored.
+
+        Complexity: O(n + m)
+        """
+        tails = array("q")
+        heads = array("q")
+        for edge in edges:
+            tails.append(edge[0])
+            heads.append(edge[1])
+        return cls.from_edge_columns(n, tails, heads)
+
+    @classmethod
+    def from_edge_columns(cls, n: int, tails: Sequence[int],
+                          heads: Sequence[int]) -> "CSRGraph":
+        """Build an undirected CSR graph with edges {tails[i], heads[i]}.
+
+        Accepts any sequences of integers, such as the columns of a
+        MappedEdgeList. Both directions of every edge are stored.
+
+        Complexity: O(n + m)
+        """
+        return cls.from_arcs(n, itertools.chain(tails, heads),
+                             itertools.chain(heads, tails))
+
+    def neighbors(self, u: int) -> array:
+        """Return the targets of the arcs leaving u."""
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def degree(self, u: int) -> int:
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def max_degree(self) -> int:
+        offsets = self.offsets
+        return max((offsets[u + 1] - offsets[u] for u in range(len(self))),
+                   default=0)
+
+    def to_adjacency_list(self) -> AdjacencyList:
+        return [list(self.neighbors(u)) for u in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
@@ -0,0 +1,100 @@
+"""Offline algorithms for connectivity queries in graphs that change over time.
+
+The offline approach (sometimes called "segment tree over time") is described
+in, e.g., https://cp-algorithms.com/data_structures/deleting_in_log_n.html
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+
+from src.data_structures.union_find import RollbackUnionFind
+
+# An update (added, u, v) adds the edge {u, v} if added is True, and removes
+# one copy of it otherwise.
+Update = tuple[bool, int, int]
+# A query (t, u, v) asks whether u and v were connected after the first t
+# updates had been applied.
+Query = tuple[int, int, int]
+
+
+def offline_connectivity(n: int, updates: Sequence[Update],
+                         queries: Iterable[Query]) -> list[bool]:
+    """Answer connectivity queries over a log of edge additions and removals.
+
+    The graph has n vertices and starts without edges. Parallel edges are
+    allowed; each removal deletes the most recently added copy. Answers are
+    returned in query order.
+
+    Every edge is live during an interval of times, which is stored in the
+    O(lg T) nodes of a segment tree over time covering it. A depth-first
+    traversal of the tree merges the edges of each node into a union find,
+    answers the queries at each leaf and rolls the merges back on the way up.
+
+    Complexity: O(n + (U lg U + Q) lg n), for U updates and Q queries
+    """
+    times = len(updates) + 1
+
+    # intervals [start, stop) of times during which each edge is live
+    intervals = []
+    live = defaultdict(list)
+    for t, (added, u, v) in enumerate(updates, 1):
+        edge = (min(u, v), max(u, v))
+        if added:
+            live[edge].append(t)
+        elif live[edge]:
+            intervals.append((live[edge].pop(), t, edge))
+        else:
+            raise ValueError(f"update {t - 1} removes absent edge {edge}")
+    for edge, starts in live.items():
+        for start in starts:
+            intervals.append((start, times, edge))
+
+    tree_size = 1
+    while tree_size < times:
+        tree_size *= 2
+    node_edges = [[] for _ in range(2 * tree_size)]
+    for start, stop, edge in intervals:
+        # add the edge to the canonical nodes covering [start, stop)
+        lo = start + tree_size
+        hi = stop + tree_size
+        while lo < hi:
+            if lo & 1:
+                node_edges[lo].append(edge)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                node_edges[hi].append(edge)
+            lo //= 2
+            hi //= 2
+
+    queries = list(queries)
+    leaf_queries = defaultdict(list)
+    for idx, (t, u, v) in enumerate(queries):
+        if not 0 <= t < times:
+            raise IndexError(f"query time {t} out of range")
+        leaf_queries[t].append(idx)
+
+    answers = [False for _ in range(len(queries))]
+    components = RollbackUnionFind(n)
+
+    def visit(node: int, lo: int, hi: int) -> None:
+        if lo >= times:
+            return
+
+        token = components.snapshot()
+        for u, v in node_edges[node]:
+            components.merge(u, v)
+
+        if node >= tree_size:
+            for idx in leaf_queries.get(lo, ()):
+                _, u, v = queries[idx]
+                answers[idx] = components.find(u) == components.find(v)
+        else:
+            mid = (lo + hi) // 2
+            visit(2 * node, lo, mid)
+            visit(2 * node + 1, mid, hi)
+
+        components.rollback(token)
+
+    visit(1, 0, tree_size)
+    return answers
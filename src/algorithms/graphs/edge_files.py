@@ -0,0 +1,172 @@
+"""Compact binary file format for edge lists, read through memory mapping.
+
+A file consists of a 24 byte header followed by the edges in column order:
+all tail vertices, then all head vertices, then (if present) all weights.
+Vertices are stored as int32 if they fit, and as int64 otherwise. Weights are
+stored as float64. All values are little-endian.
+
+Header layout: magic b"EDGE", format version (uint8), bytes per vertex
+(uint8), flags (uint16, bit 0 set iff weights are present), vertex count
+(int64), edge count (int64).
+
+Since every column is stored contiguously, a reader can expose each of them
+as a memoryview of the mapped file, without copying or creating any Python
+objects per edge.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Optional
+
+_MAGIC = b"EDGE"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBHqq")
+_WEIGHTED = 1
+
+# array/memoryview format codes by number of bytes per vertex
+_VERTEX_FORMATS = {4: "i", 8: "q"}
+
+
+def write_edge_file(path: str,
+                    n: int,
+                    edges: Iterable[tuple[int, ...]],
+                    *,
+                    weighted: bool = True) -> int:
+    """Write a graph with n vertices and the given edges to a file.
+
+    Edges are (u, v, weight) tuples, or (u, v) tuples if weighted is False.
+    Returns the number of edges written.
+
+    Complexity: O(m)
+    """
+    vertex_format = "i" if n <= 2**31 - 1 else "q"
+    tails = array(vertex_format)
+    heads = array(vertex_format)
+    weights = array("d")
+    for edge in edges:
+        tails.append(edge[0])
+        heads.append(edge[1])
+        if weighted:
+            weights.append(edge[2])
+
+    m = len(tails)
+    header = _HEADER.pack(_MAGIC, _VERSION, tails.itemsize,
+                          _WEIGHTED if weighted else 0, n, m)
+
+    columns = [tails, heads, weights] if weighted else [tails, heads]
+    if sys.byteorder != "little":
+        for column in columns:
+            column.byteswap()
+
+    with open(path, "wb") as file:
+        file.write(header)
+        for column in columns:
+            column.tofile(file)
+    return m
+
+
+class MappedEdgeList:
+    """Read-only view of an edge file, backed by a memory mapping.
+
+    The columns tails, heads and weights are memoryviews into the mapping
+    (weights is None for unweighted files), so opening even a very large file
+    is cheap. They can be indexed like lists, and passed directly to e.g.
+    kruskal_columns, boruvka_columns and CSRGraph.from_edge_columns.
+
+    The mapping stays open until close is called, or the with block that
+    opened it is exited. Views derived from the columns must be released
+    before that.
+    """
+
+    __slots__ = ("n", "tails", "heads", "weights", "_file", "_mmap", "_view")
+
+    n: int
+    tails: Sequence[int]
+    heads: Sequence[int]
+    weights: Optional[Sequence[float]]
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(),
+                                   0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"{path} is not an edge file") from None
+        self._view = memoryview(self._mmap)
+
+        try:
+            self._read_columns(path)
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_columns(self, path: str) -> None:
+        if len(self._view) < _HEADER.size:
+            raise ValueError(f"{path} is not an edge file")
+        magic, version, vertex_size, flags, n, m = _HEADER.unpack_from(
+            self._view)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not an edge file")
+        if version != _VERSION:
+            raise ValueError(f"unsupported edge file version {version}")
+        if vertex_size not in _VERTEX_FORMATS:
+            raise ValueError(f"unsupported vertex size {vertex_size}")
+
+        weighted = bool(flags & _WEIGHTED)
+        column_sizes = [vertex_size * m, vertex_size * m]
+        formats = [_VERTEX_FORMATS[vertex_size]] * 2
+        if weighted:
+            column_sizes.append(8 * m)
+            formats.append("d")
+        if len(self._view) != _HEADER.size + sum(column_sizes):
+            raise ValueError(f"{path} is truncated or corrupt")
+
+        columns = []
+        start = _HEADER.size
+        for size, fmt in zip(column_sizes, formats):
+            raw = self._view[start:start + size]
+            if sys.byteorder == "little":
+                columns.append(raw.cast(fmt))
+            else:
+                # zero-copy views are impossible, fall back to arrays
+                column = array(fmt, raw)
+                column.byteswap()
+                columns.append(column)
+                raw.release()
+            start += size
+
+        self.n = n
+        self.tails = columns[0]
+        self.heads = columns[1]
+        self.weights = columns[2] if weighted else None
+
+    def close(self) -> None:
+        """Release the columns and close the underlying mapping."""
+        for name in ("tails", "heads", "weights"):
+            column = getattr(self, name, None)
+            if isinstance(column, memoryview):
+                column.release()
+            setattr(self, name, None)
+        self._view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "MappedEdgeList":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.tails)
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        """Iterate over the edges as (u, v, weight) or (u, v) tuples."""
+        if self.weights is None:
+            return zip(self.tails, self.heads)
+        return zip(self.tails, self.heads, self.weights)
@@ -1,10 +1,11 @@
 """A collection of algorithms for constructing minimum spanning forests for edge-weighted undirected graphs."""
 
 import heapq
+from array import array
 from typing import TypeVar
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
-from src.data_structures.union_find import UnionFind
+from src.data_structures.union_find import UnionFind, ArrayUnionFind
 
 Weight = TypeVar("Weight", float, int)
 Edge = tuple[int, int, Weight]
@@ -30,6 +31,29 @@ def kruskal(n: int, edges: Iterable[Edge]) -> list[Edge]:
     return result
 
 
+def kruskal_columns(n: int, tails: Sequence[int], heads: Sequence[int],
+                    weights: Sequence[Weight]) -> list[int]:
+    """Compute a minimum spanning forest using Kruskal's algorithm.
+
+    Edge i connects tails[i] and heads[i] and has weight weights[i]. Any
+    sequences can be used, such as the columns of a MappedEdgeList, and no
+    per-edge tuples are created. Returns the indices of the forest edges.
+
+    Complexity: O(E lg E) = O(E lg V)
+    """
+    components = ArrayUnionFind(n)
+    order = sorted(range(len(weights)), key=weights.__getitem__)
+
+    result = []
+    for i in order:
+        if components.merge(tails[i], heads[i]):
+            result.append(i)
+            if len(result) == n - 1:
+                break
+
+    return result
+
+
 def prim(n: int, edges: Iterable[Edge]) -> list[Edge]:
     """Compute a minimum spanning forest using Prim's algorithm.
 
@@ -86,7 +110,61 @@ def boruvka(n: int, edges: Iterable[Edge]) -> list[Edge]:
 
     Complexity: O(E lg V)
     """
-    pass  # TODO
+    tails = array('l')
+    heads = array('l')
+    weights = []
+    for u, v, weight in edges:
+        tails.append(u)
+        heads.append(v)
+        weights.append(weight)
+
+    return [(tails[i], heads[i], weights[i])
+            for i in boruvka_columns(n, tails, heads, weights)]
+
+
+def boruvka_columns(n: int, tails: Sequence[int], heads: Sequence[int],
+                    weights: Sequence[Weight]) -> list[int]:
+    """Compute a minimum spanning forest using Borůvka's algorithm.
+
+    Takes edges as columns and returns edge indices, like kruskal_columns.
+    Ties between equal weights are broken by edge index.
+
+    Complexity: O(E lg V)
+    """
+    components = ArrayUnionFind(n)
+    cheapest = array('l', [-1]) * n
+    alive = array('l', range(len(weights)))
+
+    result = []
+    while True:
+        # find the cheapest edge leaving every component
+        roots = []
+        remaining = array('l')
+        for i in alive:
+            u = components.find(tails[i])
+            v = components.find(heads[i])
+            if u == v:
+                continue
+            remaining.append(i)
+
+            weight = weights[i]
+            for root in u, v:
+                j = cheapest[root]
+                if j == -1:
+                    roots.append(root)
+                    cheapest[root] = i
+                elif weight < weights[j] or (weight == weights[j] and i < j):
+                    cheapest[root] = i
+
+        if not remaining:
+            return result
+
+        for root in roots:
+            i = cheapest[root]
+            if components.merge(tails[i], heads[i]):
+                result.append(i)
+            cheapest[root] = -1
+        alive = remaining
 
 
 def chazelle(n: int, edges: Iterable[Edge]) -> list[Edge]:
@@ -0,0 +1,170 @@
+"""Shortest path algorithms for unweighted and 0/1-weighted graphs.
+
+Like dijkstra_one_to_all, these return a list of distances, with unreachable
+vertices assigned a distance of float('inf'). Since all distances are
+integers, they need neither a priority queue nor queue items.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from typing import TypeAlias, Optional
+
+from src.algorithms.graphs.shortest_paths.dijkstra import AdjacencyList
+
+UnweightedAdjacencyList: TypeAlias = list[list[int]]
+
+
+def bfs(graph: UnweightedAdjacencyList, source: int = 0) -> list[float]:
+    """Return the list of distances from all vertices to the source vertex.
+
+    Unreachable vertices will be assigned a distance of float('inf').
+
+    Complexity: O(n + m)
+    """
+    return multi_source_bfs(graph, (source, ))
+
+
+def multi_source_bfs(graph: UnweightedAdjacencyList,
+                     sources: Iterable[int]) -> list[float]:
+    """Return the list of distances from all vertices to the nearest source.
+
+    Unreachable vertices will be assigned a distance of float('inf').
+
+    Complexity: O(n + m)
+    """
+    n = len(graph)
+    distances = [float('inf') for _ in range(n)]
+
+    frontier = []
+    for source in sources:
+        if distances[source] != 0:
+            distances[source] = 0
+            frontier.append(source)
+
+    level = 0
+    while frontier:
+        level += 1
+        next_frontier = []
+        for u in frontier:
+            for v in graph[u]:
+                if distances[v] > level:
+                    distances[v] = level
+                    next_frontier.append(v)
+        frontier = next_frontier
+
+    return distances
+
+
+def zero_one_bfs(graph: AdjacencyList, source: int = 0) -> list[float]:
+    """Return the list of distances from all vertices to the source vertex.
+
+    All arc weights must be 0 or 1. Vertices reached through an arc of
+    weight 0 are pushed to the front of a deque, others to the back, so
+    vertices leave the deque in order of distance.
+
+    Unreachable vertices will be assigned a distance of float('inf').
+
+    Complexity: O(n + m)
+    """
+    n = len(graph)
+    distances = [float('inf') for _ in range(n)]
+    distances[source] = 0
+    done = [False for _ in range(n)]
+
+    queue = deque([source])
+    while queue:
+        u = queue.popleft()
+        if done[u]:
+            continue
+        done[u] = True
+
+        distance = distances[u]
+        for v, arc_weight in graph[u]:
+            if arc_weight == 0:
+                if distance < distances[v]:
+                    distances[v] = distance
+                    queue.appendleft(v)
+            elif arc_weight == 1:
+                if distance + 1 < distances[v]:
+                    distances[v] = distance + 1
+                    queue.append(v)
+            else:
+                raise ValueError(f"arc {u} -> {v} has weight {arc_weight}, "
+                                 f"but weights must be 0 or 1")
+
+    return distances
+
+
+def direction_optimizing_bfs(
+        graph: UnweightedAdjacencyList,
+        source: int = 0,
+        reverse: Optional[UnweightedAdjacencyList] = None,
+        *,
+        alpha: float = 14,
+        beta: float = 24) -> list[float]:
+    """Return the list of distances from all vertices to the source vertex.
+
+    Alternates between top-down steps, which scan the arcs leaving the
+    frontier, and bottom-up steps, which let every unvisited vertex look for
+    a parent in the frontier and stop at the first one found. Bottom-up steps
+    are used while the frontier is large, which on low-diameter graphs
+    skips most arcs.
+
+    reverse must contain the in-neighbors of every vertex. If it is omitted,
+    the graph is assumed to be undirected (symmetric). The switching
+    thresholds alpha and beta are those of the paper:
+    https://doi.org/10.1109/SC.2012.50
+
+    Unreachable vertices will be assigned a distance of float('inf').
+
+    Complexity: O(n + m), plus O(n + m) per bottom-up step
+    """
+    n = len(graph)
+    if reverse is None:
+        reverse = graph
+
+    distances = [float('inf') for _ in range(n)]
+    distances[source] = 0
+
+    frontier = [source]
+    # only kept up to date during bottom-up steps
+    unvisited = range(n)
+    # number of arcs leaving the frontier and the unvisited vertices
+    frontier_arcs = len(graph[source])
+    unvisited_arcs = sum(map(len, graph)) - frontier_arcs
+
+    level = 0
+    bottom_up = False
+    while frontier:
+        if bottom_up:
+            bottom_up = len(frontier) >= n / beta
+        else:
+            bottom_up = frontier_arcs > unvisited_arcs / alpha
+
+        next_frontier = []
+        if bottom_up:
+            still_unvisited = []
+            for v in unvisited:
+                if distances[v] <= level:
+                    continue
+                for u in reverse[v]:
+                    if distances[u] == level:
+                        distances[v] = level + 1
+                        next_frontier.append(v)
+                        break
+                else:
+                    still_unvisited.append(v)
+            unvisited = still_unvisited
+        else:
+            for u in frontier:
+                for v in graph[u]:
+                    if distances[v] > level + 1:
+                        distances[v] = level + 1
+                        next_frontier.append(v)
+
+        level += 1
+        frontier = next_frontier
+        frontier_arcs = sum(len(graph[u]) for u in frontier)
+        unvisited_arcs -= frontier_arcs
+
+    return distances
@@ -0,0 +1,189 @@
+"""Algorithms for finding the k shortest loopless paths between vertices."""
+
+import heapq
+from collections.abc import Sequence
+from numbers import Real
+from typing import Optional
+
+from src.algorithms.graphs.shortest_paths.dijkstra import AdjacencyList
+
+Path = tuple[Real, list[int]]
+
+
+def _shortest_path_tree(graph: AdjacencyList,
+                        source: int) -> tuple[list[Real], list[int]]:
+    """Return distances from source and the parent of every vertex.
+
+    Unreachable vertices (and the source) have parent -1.
+    """
+    n = len(graph)
+    distances = [float('inf') for _ in range(n)]
+    distances[source] = 0
+    parents = [-1 for _ in range(n)]
+
+    queue = [(0, source)]
+    while queue:
+        distance, u = heapq.heappop(queue)
+        if distance != distances[u]:
+            continue
+
+        for v, arc_weight in graph[u]:
+            if distance + arc_weight < distances[v]:
+                distances[v] = distance + arc_weight
+                parents[v] = u
+                heapq.heappush(queue, (distances[v], v))
+
+    return distances, parents
+
+
+def _arc_weight(graph: AdjacencyList, u: int, v: int) -> Real:
+    return min(weight for w, weight in graph[u] if w == v)
+
+
+def yen(graph: AdjacencyList, source: int, target: int,
+        k: int) -> list[Path]:
+    """Return up to k shortest loopless paths from source to target.
+
+    Paths are returned as (length, vertices) tuples, in order of length.
+    Arc weights must be non-negative.
+
+    Follows Yen's algorithm, which derives each next path by deviating from
+    a previous one at some spur vertex. Instead of running Dijkstra's
+    algorithm from scratch for every spur vertex, a single run on the reverse
+    graph yields the shortest path tree towards target, which is reused by
+    all spur searches:
+    - The tree distances serve as A* heuristic, which stays consistent since
+      removing vertices and arcs never shortens paths.
+    - A search stops as soon as it reaches a vertex whose tree path avoids
+      the root of the deviation, and completes the spur path along the tree.
+    Search state is kept in dicts, so a spur search costs time in the number
+    of vertices it visits rather than in n.
+
+    https://doi.org/10.1287/mnsc.17.11.712
+
+    Complexity: O(k n (m + n lg n)) in the worst case
+    """
+    n = len(graph)
+    reverse = [[] for _ in range(n)]
+    for u in range(n):
+        for v, arc_weight in graph[u]:
+            reverse[v].append((u, arc_weight))
+
+    to_target, successors = _shortest_path_tree(reverse, target)
+    if k <= 0 or to_target[source] == float('inf'):
+        return []
+
+    def tree_path(u: int) -> list[int]:
+        path = [u]
+        while u != target:
+            u = successors[u]
+            path.append(u)
+        return path
+
+    def search(previous: list[int], positions: dict[int, int], i: int,
+               blocked_arcs: set[int],
+               first_hits: dict[int, int]) -> Optional[list[int]]:
+        """Return a shortest path from previous[i] to target that avoids
+        previous[:i] and the blocked arcs leaving previous[i], where
+        positions maps each vertex of previous to its index."""
+        spur = previous[i]
+
+        distances = {spur: 0}
+        parents = {spur: -1}
+        queue = [(to_target[spur], 0, spur)]
+        while queue:
+            _, distance, u = heapq.heappop(queue)
+            if distance != distances[u]:
+                continue
+
+            if u != spur and first_hit(previous, positions, u,
+                                       first_hits) > i:
+                # the tree path from u is a valid continuation, and it is
+                # optimal since the heuristic is exact for it
+                path = []
+                while u != -1:
+                    path.append(u)
+                    u = parents[u]
+                path.reverse()
+                return path + tree_path(path[-1])[1:]
+
+            for v, arc_weight in graph[u]:
+                if (positions.get(v, i) < i
+                        or to_target[v] == float('inf')
+                        or (u == spur and v in blocked_arcs)):
+                    continue
+                if distance + arc_weight < distances.get(v, float('inf')):
+                    distances[v] = distance + arc_weight
+                    parents[v] = u
+                    heapq.heappush(queue,
+                                   (distances[v] + to_target[v], distances[v],
+                                    v))
+        return None
+
+    def first_hit(previous: list[int], positions: dict[int, int], u: int,
+                  first_hits: dict[int, int]) -> int:
+        """Return the smallest index j such that the tree path from u passes
+        previous[j], or len(previous) if there is none."""
+        path = []
+        while u not in first_hits:
+            path.append(u)
+            if u == target:
+                break
+            u = successors[u]
+        hit = first_hits.get(u, len(previous))
+        for w in reversed(path):
+            hit = min(hit, positions.get(w, len(previous)))
+            first_hits[w] = hit
+        return hit
+
+    def prefix_lengths(path: Sequence[int]) -> list[Real]:
+        lengths = [0]
+        for u, v in zip(path, path[1:]):
+            lengths.append(lengths[-1] + _arc_weight(graph, u, v))
+        return lengths
+
+    first = tree_path(source)
+    result = [(prefix_lengths(first)[-1], first)]
+    candidates = []
+    seen = {tuple(first)}
+
+    while len(result) < k:
+        _, previous = result[-1]
+        previous_positions = {u: j for j, u in enumerate(previous)}
+        lengths = prefix_lengths(previous)
+
+        # length of the common prefix of each found path with previous
+        common_prefixes = []
+        for _, path in result:
+            common = 0
+            for u, v in zip(path, previous):
+                if u != v:
+                    break
+                common += 1
+            common_prefixes.append((common, path))
+
+        first_hits = {}
+        for i in range(len(previous) - 1):
+            blocked_arcs = {
+                path[i + 1]
+                for common, path in common_prefixes
+                if common > i and len(path) > i + 1
+            }
+
+            spur_path = search(previous, previous_positions, i, blocked_arcs,
+                               first_hits)
+            if spur_path is None:
+                continue
+
+            path = previous[:i] + spur_path
+            key = tuple(path)
+            if key not in seen:
+                seen.add(key)
+                length = lengths[i] + prefix_lengths(spur_path)[-1]
+                heapq.heappush(candidates, (length, path))
+
+        if not candidates:
+            break
+        result.append(heapq.heappop(candidates))
+
+    return result
@@ -0,0 +1,179 @@
+"""Algorithms for strongly connected components and topological orders.
+
+All algorithms accept either an adjacency list or a CSRGraph, and use explicit
+stacks instead of recursion, so they work on graphs of any size.
+"""
+
+from array import array
+from typing import TypeAlias
+
+from src.algorithms.graphs.csr import CSRGraph
+
+AdjacencyList: TypeAlias = list[list[int]]
+
+
+def tarjan(graph: AdjacencyList | CSRGraph) -> array:
+    """Return the strongly connected component of every vertex.
+
+    Components are numbered 0, 1, ... in topological order, i.e. for every
+    arc u -> v the component of u is at most the component of v.
+
+    Based on Tarjan's algorithm: https://doi.org/10.1137/0201010
+
+    Complexity: O(n + m)
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency_list(graph)
+
+    n = len(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+
+    index = array('l', [-1]) * n
+    low = array('l', [0]) * n
+    components = array('l', [-1]) * n
+    # position of the next arc to examine, for vertices on the call stack
+    next_arc = array('q', [0]) * n
+
+    # vertices that have been visited, but not assigned a component yet
+    stack = array('l')
+    call_stack = array('l')
+    counter = 0
+    component_count = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        call_stack.append(root)
+        next_arc[root] = offsets[root]
+
+        while call_stack:
+            u = call_stack[-1]
+            arc = next_arc[u]
+            stop = offsets[u + 1]
+            while arc < stop:
+                v = targets[arc]
+                arc += 1
+                if index[v] == -1:
+                    break
+                if components[v] == -1 and index[v] < low[u]:
+                    low[u] = index[v]
+            else:
+                # all arcs of u have been examined
+                call_stack.pop()
+                if call_stack and low[u] < low[call_stack[-1]]:
+                    low[call_stack[-1]] = low[u]
+
+                if low[u] == index[u]:
+                    while True:
+                        w = stack.pop()
+                        components[w] = component_count
+                        if w == u:
+                            break
+                    component_count += 1
+                continue
+
+            # descend into v
+            next_arc[u] = arc
+            index[v] = low[v] = counter
+            counter += 1
+            stack.append(v)
+            call_stack.append(v)
+            next_arc[v] = offsets[v]
+
+    # Tarjan's algorithm finds components in reverse topological order
+    last = component_count - 1
+    for u in range(n):
+        components[u] = last - components[u]
+
+    return components
+
+
+def topological_sort(graph: AdjacencyList | CSRGraph) -> array:
+    """Return the vertices of a directed acyclic graph in topological order.
+
+    Raises a ValueError if the graph contains a cycle.
+
+    Based on Kahn's algorithm: https://doi.org/10.1145/368996.369025
+
+    Complexity: O(n + m)
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency_list(graph)
+
+    n = len(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+
+    in_degrees = array('l', [0]) * n
+    for v in targets:
+        in_degrees[v] += 1
+
+    # the order doubles as the queue of vertices without remaining in-arcs
+    order = array('l', (u for u in range(n) if not in_degrees[u]))
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            in_degrees[v] -= 1
+            if not in_degrees[v]:
+                order.append(v)
+
+    if len(order) != n:
+        raise ValueError("graph contains a cycle")
+    return order
+
+
+def condensation(
+        graph: AdjacencyList | CSRGraph) -> tuple[array, CSRGraph]:
+    """Return the strongly connected components and the condensation DAG.
+
+    The first element is the component of every vertex, as returned by
+    tarjan. The condensation has a vertex for every component, and a single
+    arc c -> d whenever some arc leads from component c to a different
+    component d. Arcs are sorted by component, so that range(k) is a
+    topological order of the condensation.
+
+    Complexity: O(n + m)
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency_list(graph)
+
+    n = len(graph)
+    offsets = graph.offsets
+    targets = graph.targets
+    components = tarjan(graph)
+    k = max(components, default=-1) + 1
+
+    # group the vertices by component using a counting sort
+    starts = array('q', [0]) * (k + 1)
+    for c in components:
+        starts[c + 1] += 1
+    for c in range(k):
+        starts[c + 1] += starts[c]
+    members = array('l', [0]) * n
+    position = starts[:k]
+    for u in range(n):
+        members[position[components[u]]] = u
+        position[components[u]] += 1
+
+    dag_offsets = array('q', [0])
+    dag_targets = array('l')
+    # last_seen[d] == c iff the arc c -> d has already been added
+    last_seen = array('l', [-1]) * k
+    for c in range(k):
+        last_seen[c] = c
+        for u in members[starts[c]:starts[c + 1]]:
+            for v in targets[offsets[u]:offsets[u + 1]]:
+                d = components[v]
+                if last_seen[d] != c:
+                    last_seen[d] = c
+                    dag_targets.append(d)
+        dag_offsets.append(len(dag_targets))
+
+    return components, CSRGraph(dag_offsets, dag_targets)
@@ -1,7 +1,15 @@
 """Exact and approximate algorithms for vertex coloring."""
 
+import heapq
+import multiprocessing
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from typing import TypeAlias, Optional
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+
+from src.algorithms.graphs.csr import CSRGraph
 
 AdjacencyList: TypeAlias = list[list[int]]
 
@@ -22,11 +30,352 @@ def color_greedy(adj: AdjacencyList,
     if order is None:
         order = range(n)
 
+    # marks[c] == u iff color c is used by a neighbor of u. Uncolored
+    # neighbors stamp the sentinel slot marks[-1], which is never probed since
+    # a vertex of degree d always gets a color below d + 1 <= n.
+    marks = [-1 for _ in range(n + 1)]
     for u in order:
-        neighbor_colors = set(colors[v] for v in adj[u])
+        for v in adj[u]:
+            marks[colors[v]] = u
+        color = 0
+        while marks[color] == u:
+            color += 1
+        colors[u] = color
+
+    return colors
+
+
+def smallest_last_ordering(adj: AdjacencyList) -> list[int]:
+    """Return a smallest-last (degeneracy) ordering of the vertices.
+
+    Vertices are repeatedly removed with minimal degree in the remaining
+    graph, and returned in reverse order of removal. Coloring greedily in this
+    order uses at most k + 1 colors, where k is the degeneracy of the graph.
+    Repeated neighbors count towards the degree once per occurrence.
+
+    Based on the bucket queue approach of Matula and Beck:
+    https://doi.org/10.1145/2402.322385
+
+    Complexity: O(n + m)
+    """
+    n = len(adj)
+    degrees = [len(neighbors) for neighbors in adj]
+    removed = [False for _ in range(n)]
+
+    # buckets may contain stale entries, which are skipped when popped
+    buckets = [[] for _ in range(max(degrees, default=0) + 1)]
+    for u in range(n):
+        buckets[degrees[u]].append(u)
+
+    order = []
+    min_degree = 0
+    while len(order) < n:
+        while not buckets[min_degree]:
+            min_degree += 1
+
+        u = buckets[min_degree].pop()
+        if removed[u] or degrees[u] != min_degree:
+            continue
+
+        removed[u] = True
+        order.append(u)
+        for v in adj[u]:
+            if not removed[v]:
+                degrees[v] -= 1
+                buckets[degrees[v]].append(v)
+                min_degree = min(min_degree, degrees[v])
+
+    order.reverse()
+    return order
+
+
+def color_dsatur(adj: AdjacencyList) -> list[int]:
+    """Return a coloring of the vertices using Brélaz's DSatur heuristic.
+
+    The next vertex to be colored is always one with the largest number of
+    distinct colors among its neighbors, with ties broken by the largest
+    degree among uncolored vertices. Colors bipartite graphs optimally.
+
+    https://doi.org/10.1145/359094.359101
+
+    Complexity: O((n + m) lg n)
+    """
+    n = len(adj)
+    colors = [-1 for _ in range(n)]
+    neighbor_colors = [set() for _ in range(n)]
+    degrees = [len(neighbors) for neighbors in adj]
+
+    # heap entries are (-saturation, -degree, vertex), stale ones are skipped
+    queue = [(0, -degrees[u], u) for u in range(n)]
+    heapq.heapify(queue)
+
+    while queue:
+        neg_saturation, neg_degree, u = heapq.heappop(queue)
+        if (colors[u] != -1 or -neg_saturation != len(neighbor_colors[u])
+                or -neg_degree != degrees[u]):
+            continue
+
+        used = neighbor_colors[u]
         color = 0
-        while color in neighbor_colors:
+        while color in used:
             color += 1
         colors[u] = color
 
+        for v in adj[u]:
+            if colors[v] == -1:
+                neighbor_colors[v].add(color)
+                degrees[v] -= 1
+                heapq.heappush(
+                    queue, (-len(neighbor_colors[v]), -degrees[v], v))
+
     return colors
+
+
+def _greedy_clique(neighbors: list[int]) -> list[int]:
+    """Return a large clique found by greedy extension from every vertex."""
+    best = []
+    for u in range(len(neighbors)):
+        clique = [u]
+        candidates = neighbors[u]
+        while candidates:
+            # extend by the candidate keeping the most candidates alive
+            v = max(_bits(candidates),
+                    key=lambda w: (neighbors[w] & candidates).bit_count())
+            clique.append(v)
+            candidates &= neighbors[v]
+        if len(clique) > len(best):
+            best = clique
+    return best
+
+
+def _bits(mask: int) -> Iterable[int]:
+    """Yield the positions of the set bits of mask in increasing order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def color_exact(adj: AdjacencyList,
+                time_limit: Optional[float] = None) -> tuple[list[int], bool]:
+    """Return a coloring with the minimal number of colors.
+
+    Uses a DSatur-based branch and bound, which always branches on the
+    uncolored vertex with the most distinct neighbor colors. Adjacency, color
+    classes and forbidden colors are all stored as int bitsets. The search
+    starts from the DSatur coloring as upper bound, and precolors a greedily
+    found clique as lower bound.
+
+    If time_limit (in seconds) runs out, the best coloring found so far is
+    returned. The second element of the result is True iff the coloring is
+    known to be optimal.
+
+    https://doi.org/10.1145/359094.359101
+
+    Complexity: exponential in the worst case
+    """
+    n = len(adj)
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+
+    neighbors = [0 for _ in range(n)]
+    for u in range(n):
+        for v in adj[u]:
+            if v != u:
+                neighbors[u] |= 1 << v
+
+    best_colors = color_dsatur(adj)
+    best_count = max(best_colors, default=-1) + 1
+
+    clique = _greedy_clique(neighbors)
+    if len(clique) >= best_count:
+        return best_colors, True
+
+    colors = [-1 for _ in range(n)]
+    # forbidden[u] has bit c set iff a neighbor of u has color c
+    forbidden = [0 for _ in range(n)]
+    uncolored = (1 << n) - 1
+    for color, u in enumerate(clique):
+        colors[u] = color
+        uncolored ^= 1 << u
+        for v in _bits(neighbors[u]):
+            forbidden[v] |= 1 << color
+
+    timed_out = False
+    nodes = 0
+
+    def search(uncolored: int, used: int) -> None:
+        nonlocal best_colors, best_count, timed_out, nodes
+
+        if not uncolored:
+            best_colors = colors[:]
+            best_count = used
+            return
+
+        nodes += 1
+        if deadline is not None and nodes % 1024 == 0:
+            if time.monotonic() > deadline:
+                timed_out = True
+        if timed_out:
+            return
+
+        # colors 0..limit - 1 may be used without reaching best_count
+        limit = min(used + 1, best_count - 1)
+        allowed = (1 << limit) - 1
+
+        # order by saturation, then by degree among uncolored vertices
+        u = -1
+        key = (-1, -1)
+        for v in _bits(uncolored):
+            saturation = (forbidden[v] & allowed).bit_count()
+            if saturation == limit:
+                return
+            v_key = (saturation, (neighbors[v] & uncolored).bit_count())
+            if v_key > key:
+                u = v
+                key = v_key
+
+        uncolored ^= 1 << u
+        uncolored_neighbors = neighbors[u] & uncolored
+        for color in _bits(allowed & ~forbidden[u]):
+            if color >= best_count - 1:
+                break
+
+            bit = 1 << color
+            changed = [v for v in _bits(uncolored_neighbors)
+                       if not forbidden[v] & bit]
+            for v in changed:
+                forbidden[v] |= bit
+            colors[u] = color
+
+            search(uncolored, max(used, color + 1))
+
+            for v in changed:
+                forbidden[v] ^= bit
+            if timed_out or best_count == len(clique):
+                break
+        colors[u] = -1
+
+    search(uncolored, len(clique))
+
+    return best_colors, not timed_out
+
+
+# State of the speculative coloring, set per process by _init_color_worker.
+# Colors are stored shifted up by one, so that 0 means uncolored. A color is
+# taken by a neighbor of the vertex being colored iff its mark equals the
+# current stamp, which is fresh for every vertex colored by the process.
+_worker_graph: Optional[CSRGraph] = None
+_worker_colors: Optional[Sequence[int]] = None
+_worker_marks: Optional[list[int]] = None
+_worker_stamp: int = 0
+
+
+def _init_color_worker(graph: CSRGraph, colors: Sequence[int],
+                       max_degree: int) -> None:
+    global _worker_graph, _worker_colors, _worker_marks, _worker_stamp
+    _worker_graph = graph
+    _worker_colors = colors
+    _worker_marks = [0 for _ in range(max_degree + 2)]
+    _worker_stamp = 0
+
+
+def _color_partition(vertices: Sequence[int]) -> None:
+    global _worker_stamp
+    offsets = _worker_graph.offsets
+    targets = _worker_graph.targets
+    colors = _worker_colors
+    marks = _worker_marks
+
+    stamp = _worker_stamp
+    for u in vertices:
+        stamp += 1
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            marks[colors[v]] = stamp
+        color = 1
+        while marks[color] == stamp:
+            color += 1
+        colors[u] = color
+    _worker_stamp = stamp
+
+
+def _find_conflicts(vertices: Sequence[int]) -> list[int]:
+    offsets = _worker_graph.offsets
+    targets = _worker_graph.targets
+    colors = _worker_colors
+
+    conflicts = []
+    for u in vertices:
+        color = colors[u]
+        for v in targets[offsets[u]:offsets[u + 1]]:
+            if v < u and colors[v] == color:
+                conflicts.append(u)
+                break
+    return conflicts
+
+
+def color_speculative(
+        graph: AdjacencyList | CSRGraph,
+        processes: Optional[int] = None,
+        partitions_per_process: int = 4) -> tuple[list[int], list[int]]:
+    """Return a coloring computed in parallel, and the conflicts per round.
+
+    In each round, the vertices still to be colored are split into contiguous
+    partitions, which worker processes color greedily against a shared color
+    array without synchronization. Afterwards, of every edge whose endpoints
+    received the same color, the endpoint with larger index is uncolored and
+    retried in the next round. The second element of the result lists the
+    number of such conflicts for each round, so its last entry is always 0.
+
+    Like color_greedy, uses at most D + 1 colors, where D is the maximum
+    vertex degree. If processes is 1, no worker processes are started.
+
+    Based on the scheme of Gebremedhin and Manne:
+    https://doi.org/10.1002/1096-9128(200010)12:12<1131::AID-CPE528>3.0.CO;2-2
+
+    Complexity: O(n + m) work per round
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency_list(graph)
+
+    n = len(graph)
+    if processes is None:
+        processes = os.cpu_count() or 1
+    max_degree = graph.max_degree()
+
+    if processes == 1:
+        colors = array("q", [0]) * n
+        _init_color_worker(graph, colors, max_degree)
+        executor = None
+        map_partitions = map
+    else:
+        colors = multiprocessing.RawArray("q", n)
+        executor = ProcessPoolExecutor(processes,
+                                       initializer=_init_color_worker,
+                                       initargs=(graph, colors, max_degree))
+        map_partitions = executor.map
+
+    conflicts_per_round = []
+    try:
+        worklist = array("q", range(n))
+        while worklist:
+            size = -(-len(worklist) // (processes * partitions_per_process))
+            partitions = [
+                worklist[i:i + size] for i in range(0, len(worklist), size)
+            ]
+
+            for _ in map_partitions(_color_partition, partitions):
+                pass
+
+            worklist = array("q")
+            for conflicts in map_partitions(_find_conflicts, partitions):
+                worklist.extend(conflicts)
+            for u in worklist:
+                colors[u] = 0
+
+            conflicts_per_round.append(len(worklist))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        _init_color_worker(None, None, -1)
+
+    return [color - 1 for color in colors], conflicts_per_round
@@ -1,5 +1,19 @@
 """Algorithms for decomposing an integer into prime factors."""
 
+import bisect
+import itertools
+import math
+import os
+import random
+from array import array
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from src.algorithms.number_theory.primality import miller_rabin
+from src.algorithms.number_theory.sieve import segmented_sieve
+
 
 def trial_division(n: int) -> list[tuple[int, int]]:
     """Factor an integer using trial division.
@@ -26,3 +40,601 @@ def trial_division(n: int) -> list[tuple[int, int]]:
     if n != 1:
         factors.append((n, 1))
     return factors
+
+
+def pollard_brent(n: int, batch_size: int = 128) -> int:
+    """Return a nontrivial factor of a composite integer.
+
+    Brent's variant of Pollard's rho method iterates x -> x^2 + c mod n,
+    comparing x with the last power-of-two-indexed iterate. Instead of
+    taking a gcd per step, it multiplies batch_size differences mod n and
+    takes one gcd per batch, backtracking step by step if a batch collapses
+    to n. If the cycle closes without a factor, it restarts with another c.
+
+    Complexity: O(n^(1/4)) expected multiplications mod n
+    """
+    if n % 2 == 0:
+        return 2
+    return _rho(n, batch_size)
+
+
+def _rho(n: int,
+         batch_size: int = 128,
+         max_steps: Optional[int] = None) -> Optional[int]:
+    """Run pollard_brent on odd n, giving up and returning None once a cycle
+    would need more than max_steps iterations."""
+    while True:
+        c = random.randrange(1, n - 1)
+        y = random.randrange(n)
+        r = 1
+        q = 1
+        g = 1
+        while g == 1:
+            if max_steps is not None and r > max_steps:
+                return None
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(batch_size, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += batch_size
+            r *= 2
+
+        if g == n:
+            # the batch overshot, redo it one gcd at a time
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = math.gcd(abs(x - saved), n)
+
+        if g != n:
+            return g
+
+
+# primes below 1000, tried before the rho engine
+_TRIAL_PRIMES = [p for p in range(2, 1000) if all(p % q for q in range(2, p))]
+
+# cofactors of at least _SIQS_BITS bits get _RHO_STEPS iterations of rho
+# before siqs takes over
+_SIQS_BITS = 100
+_RHO_STEPS = 1 << 16
+
+
+def factor(n: int) -> list[tuple[int, int]]:
+    """Factor an integer.
+
+    Divides out the primes below 1000 by trial division, then splits the
+    remaining cofactor with pollard_brent, testing each part for primality
+    with miller_rabin. Parts of 100 bits or more that rho does not split
+    within 2^16 iterations go to siqs, whose running time does not depend
+    on the size of the smallest factor.
+
+    Result will be a list of (prime, exponent) tuples, ordered by prime.
+
+    Complexity: O(n^(1/4)) expected multiplications mod n, and
+    exp((1 + o(1)) sqrt(ln n ln ln n)) for parts of 100 bits or more
+    """
+    if n < 2:
+        raise ValueError("input must be an integer larger than 1")
+
+    factors = Counter()
+    for p in _TRIAL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] += 1
+            n //= p
+
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if miller_rabin(m):
+            factors[m] += 1
+            continue
+
+        root = math.isqrt(m)
+        if root * root == m:
+            stack += [root, root]
+            continue
+
+        if m.bit_length() < _SIQS_BITS:
+            d = pollard_brent(m)
+        else:
+            d = _rho(m, max_steps=_RHO_STEPS) or siqs(m)
+        stack += [d, m // d]
+
+    return sorted(factors.items())
+
+
+class Factorizer:
+    """Smallest-prime-factor table for fast factorization of many integers up
+    to a fixed limit.
+
+    The table is an array('I') holding for every composite n <= limit its
+    smallest prime factor, and 0 for primes. It is built block by block,
+    block_size entries at a time, so that each block stays in cache while
+    every prime up to sqrt(limit) crosses off its multiples in it. Going
+    through the primes in decreasing order, with one slice assignment each,
+    leaves the smallest prime factor in every entry.
+
+    The table takes 4 (limit + 1) bytes and is only built on the first call
+    to factor or factor_all. primes() never uses it, and sieves one block at
+    a time with segmented_sieve instead.
+    """
+
+    __slots__ = ("_limit", "_block_size", "_table")
+
+    _limit: int
+    _block_size: int
+    _table: Optional[array]
+
+    def __init__(self, limit: int, block_size: int = 1 << 16):
+        """Prepare a factorizer for all integers up to limit.
+
+        The default block size of 2^16 four-byte entries fills 256 KiB, a
+        typical L2 cache.
+
+        Complexity: O(1)
+        """
+        if limit < 1:
+            raise ValueError("limit must be positive")
+        if block_size < 1:
+            raise ValueError("block size must be positive")
+
+        self._limit = limit
+        self._block_size = block_size
+        self._table = None
+
+    def _build(self) -> array:
+        """Build the smallest-prime-factor table.
+
+        Complexity: O(n lg lg n)
+        """
+        limit = self._limit
+        block_size = self._block_size
+        root = math.isqrt(limit)
+        is_composite = bytearray(root + 1)
+        base_primes = []
+        for p in range(2, root + 1):
+            if not is_composite[p]:
+                base_primes.append(p)
+                is_composite[p * p::p] = b"\1" * len(
+                    range(p * p, root + 1, p))
+        base_primes.reverse()
+
+        table = array("I", [0]) * (limit + 1)
+        for lo in range(0, limit + 1, block_size):
+            hi = min(lo + block_size, limit + 1)
+            for p in base_primes:
+                start = max(p * p, -(-lo // p) * p)
+                if start < hi:
+                    table[start:hi:p] = array("I", [p]) * len(
+                        range(start, hi, p))
+
+        self._table = table
+        return table
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def factor(self, n: int) -> list[tuple[int, int]]:
+        """Factor an integer up to the limit.
+
+        Result will be a list of (prime, exponent) tuples, ordered by prime.
+
+        Complexity: O(lg n), after building the table in O(limit lg lg limit)
+        """
+        if n < 2:
+            raise ValueError("input must be an integer larger than 1")
+        if n > self._limit:
+            raise ValueError(f"input exceeds limit {self._limit}")
+
+        table = self._table
+        if table is None:
+            table = self._build()
+        factors = []
+        while n > 1:
+            p = table[n] or n
+            count = 0
+            while n % p == 0:
+                n //= p
+                count += 1
+            factors.append((p, count))
+        return factors
+
+    def factor_all(self,
+                   numbers: Iterable[int]) -> list[list[tuple[int, int]]]:
+        """Factor every integer in numbers, as with factor.
+
+        Complexity: O(k lg n) for k integers up to n
+        """
+        return [self.factor(n) for n in numbers]
+
+    def primes(self) -> Iterator[int]:
+        """Yield the primes up to the limit in increasing order.
+
+        Uses segmented_sieve with segments of 30 block_size / 2 integers,
+        which take 4 block_size bytes like a block of the table, so memory
+        use is O(block_size + sqrt(limit)) whether or not the table exists.
+
+        Complexity: O(n lg lg n)
+        """
+        return segmented_sieve(2, self._limit + 1,
+                               max(self._block_size // 2, 1))
+
+
+def _sqrt_mod(a: int, p: int) -> int:
+    """Return an x with x^2 = a mod p, for an odd prime p and a quadratic
+    residue a, using the Tonelli-Shanks algorithm."""
+    a %= p
+    if a == 0:
+        return 0
+    if p % 4 == 3:
+        return pow(a, (p + 1) // 4, p)
+
+    q = p - 1
+    s = (q & -q).bit_length() - 1
+    q >>= s
+    z = 2
+    while pow(z, (p - 1) // 2, p) != p - 1:
+        z += 1
+    c = pow(z, q, p)
+    x = pow(a, (q + 1) // 2, p)
+    t = pow(a, q, p)
+    while t != 1:
+        i = 0
+        t2 = t
+        while t2 != 1:
+            t2 = t2 * t2 % p
+            i += 1
+        b = pow(c, 1 << (s - i - 1), p)
+        x = x * b % p
+        c = b * b % p
+        t = t * c % p
+        s = i
+    return x
+
+
+def _integer_root(n: int, k: int) -> int:
+    """Return floor(n^(1/k)) for positive n, using Newton's method."""
+    x = 1 << -(-n.bit_length() // k)
+    while True:
+        y = ((k - 1) * x + n // x ** (k - 1)) // k
+        if y >= x:
+            return x
+        x = y
+
+
+# (digits, factor base size, sieve half-width), interpolated by digit count
+_SIQS_PARAMETERS = [
+    (20, 100, 1 << 15),
+    (30, 200, 1 << 15),
+    (40, 500, 1 << 16),
+    (50, 1500, 1 << 18),
+    (60, 3000, 1 << 19),
+    (70, 5500, 1 << 19),
+    (80, 9000, 3 << 18),
+]
+
+# _ADD_LOG[k] maps every byte b to min(b + k, 255), for bytes.translate
+_ADD_LOG = [bytes(min(b + k, 255) for b in range(256)) for k in range(64)]
+
+
+def _siqs_parameters(n: int) -> tuple[int, int]:
+    digits = math.log10(n)
+    for (d0, f0, m0), (d1, f1, m1) in itertools.pairwise(_SIQS_PARAMETERS):
+        if digits < d1:
+            break
+    t = min(max((digits - d0) / (d1 - d0), 0), 1)
+    return round(f0 + t * (f1 - f0)), m0 if t < 0.5 else m1
+
+
+class _QuadraticSieve:
+    """Factor base and sieving state of the self-initializing quadratic
+    sieve for one n.
+
+    A relation is a pair (u, w) with u^2 = w mod n, where w factors over the
+    factor base, apart from at most one large prime. Its vector has bit 0
+    set if w < 0, and bit j + 1 set if the j-th prime divides w to an odd
+    power.
+    """
+
+    __slots__ = ("n", "primes", "roots", "logs", "half_width",
+                 "large_prime_bound", "threshold_table", "divisor")
+
+    n: int
+    primes: list[int]
+    roots: list[int]
+    logs: bytes
+    half_width: int
+    large_prime_bound: int
+    threshold_table: bytes
+    divisor: int
+
+    def __init__(self, n: int, size: int, half_width: int):
+        self.n = n
+        self.half_width = half_width
+        # 2 always belongs to the factor base, and odd primes p do if n is a
+        # quadratic residue mod p
+        self.primes = [2]
+        self.roots = [n % 2]
+        self.divisor = 0
+        for p in segmented_sieve(3, 1 << 32):
+            if len(self.primes) == size:
+                break
+            residue = pow(n, (p - 1) // 2, p)
+            if residue == 0:
+                self.divisor = p
+                return
+            if residue == 1:
+                self.primes.append(p)
+                self.roots.append(_sqrt_mod(n, p))
+        self.logs = bytes(round(math.log2(p)) for p in self.primes)
+
+        # sieve values are at most about half_width sqrt(n / 2); those that
+        # are within a large prime of it are candidates, with some slack for
+        # rounding, prime powers and the primes that aren't sieved
+        largest = self.primes[-1]
+        self.large_prime_bound = largest * 128
+        threshold = round(
+            math.log2(half_width) + (n.bit_length() - 1) / 2 -
+            math.log2(self.large_prime_bound) - 3)
+        self.threshold_table = bytes(b >= threshold for b in range(256))
+
+    def _choose_a(self, rng: random.Random) -> list[int]:
+        """Return the factor base indices of the primes q whose product A
+        is close to sqrt(2 n) / half_width."""
+        primes = self.primes
+        target = math.isqrt(2 * self.n) // self.half_width
+        preferred = min(2000, primes[len(primes) * 2 // 3])
+        s = max(1, round(math.log(target) / math.log(preferred)))
+        q0 = target**(1 / s)
+        lo = max(bisect.bisect_left(primes, q0 / 2), 3)
+        hi = bisect.bisect_right(primes, q0 * 2)
+        if hi - lo < s + 2:
+            lo, hi = 3, len(primes)
+
+        chosen = rng.sample(range(lo, hi), s - 1)
+        rest = target // math.prod(primes[j] for j in chosen)
+        k = bisect.bisect_left(primes, rest)
+        k = min(k, len(primes) - 1)
+        last = min((j for j in range(max(k - s - 1, 3), k + s + 1)
+                    if j < len(primes) and j not in chosen),
+                   key=lambda j: abs(primes[j] - rest))
+        return chosen + [last]
+
+    def relations(
+        self, seed: int
+    ) -> tuple[list[tuple[int, int, int]], list[tuple[int, int, int, int]]]:
+        """Sieve all polynomials of one randomly chosen A, and return the
+        full relations as (u, w, vector) and the partial relations as
+        (u, w, vector, large prime)."""
+        n, primes, roots, m = self.n, self.primes, self.roots, self.half_width
+        qs = self._choose_a(random.Random(seed))
+        a = math.prod(primes[j] for j in qs)
+
+        # B = sum of +-B_l, with B_l = 0 mod q_k for k != l and B_l^2 = n
+        # mod q_l, so that B^2 = n mod A
+        bs = []
+        for j in qs:
+            q = primes[j]
+            aq = a // q
+            gamma = roots[j] * pow(aq, -1, q) % q
+            bs.append(aq * min(gamma, q - gamma))
+        b = sum(bs)
+
+        # the primes dividing A, and 2, are not sieved
+        sieved = [j for j in range(1, len(primes)) if a % primes[j]]
+        ps = [primes[j] for j in sieved]
+        logs = [_ADD_LOG[self.logs[j]] for j in sieved]
+        a_inverses = [pow(a, -1, p) for p in ps]
+        # the roots of A x^2 + 2 B x + C mod p are (+-t - B) / A, and
+        # flipping the sign of B_l moves them by 2 B_l / A
+        deltas = [[2 * bl * ai % p
+                   for ai, p in zip(a_inverses, ps)]
+                  for bl in bs]
+        roots1 = [ai * (roots[j] - b) % p
+                  for ai, j, p in zip(a_inverses, sieved, ps)]
+        roots2 = [ai * (-roots[j] - b) % p
+                  for ai, j, p in zip(a_inverses, sieved, ps)]
+
+        full = []
+        partial = []
+        hits_table = self.threshold_table
+        for i in range(1 << (len(bs) - 1)):
+            if i:
+                # step through the signs of B_0 .. B_{s-2} in Gray code
+                # order, flipping one sign per polynomial
+                l = (i & -i).bit_length() - 1
+                delta = deltas[l]
+                if (i ^ (i >> 1)) >> l & 1:
+                    b -= 2 * bs[l]
+                    roots1 = [(r + d) % p
+                              for r, d, p in zip(roots1, delta, ps)]
+                    roots2 = [(r + d) % p
+                              for r, d, p in zip(roots2, delta, ps)]
+                else:
+                    b += 2 * bs[l]
+                    roots1 = [(r - d) % p
+                              for r, d, p in zip(roots1, delta, ps)]
+                    roots2 = [(r - d) % p
+                              for r, d, p in zip(roots2, delta, ps)]
+
+            sieve = bytearray(2 * m)
+            for p, table, r1, r2 in zip(ps, logs, roots1, roots2):
+                start = (r1 + m) % p
+                sieve[start::p] = sieve[start::p].translate(table)
+                start = (r2 + m) % p
+                sieve[start::p] = sieve[start::p].translate(table)
+
+            hits = sieve.translate(hits_table)
+            k = hits.find(1)
+            while k >= 0:
+                u = a * (k - m) + b
+                relation = self._trial_divide(u, u * u - n)
+                if relation is not None:
+                    (full if len(relation) == 3 else partial).append(relation)
+                k = hits.find(1, k + 1)
+
+        return full, partial
+
+    def _trial_divide(self, u: int, w: int) -> Optional[tuple[int, ...]]:
+        vector = int(w < 0)
+        rest = abs(w)
+        for j, p in enumerate(self.primes):
+            if rest % p == 0:
+                rest //= p
+                odd = True
+                while rest % p == 0:
+                    rest //= p
+                    odd = not odd
+                if odd:
+                    vector |= 2 << j
+        if rest == 1:
+            return u, w, vector
+        if rest < self.large_prime_bound:
+            return u, w, vector, rest
+        return None
+
+
+def _gf2_dependencies(rows: list[int]) -> Iterator[int]:
+    """Yield bitmasks of subsets of rows that sum to zero over GF(2).
+
+    Each row is a bit vector packed into an int. Gaussian elimination keeps
+    a pivot row for every lowest set bit, and reduces each new row by the
+    pivots until it becomes zero or gets a new lowest bit. Alongside, it
+    tracks which original rows were summed.
+
+    Complexity: O(r c^2 / w) for r rows of c bits and w bit machine words
+    """
+    pivots = {}
+    for i, row in enumerate(rows):
+        history = 1 << i
+        while row:
+            low = row & -row
+            pivot = pivots.get(low)
+            if pivot is None:
+                pivots[low] = row, history
+                break
+            row ^= pivot[0]
+            history ^= pivot[1]
+        else:
+            yield history
+
+
+_worker_sieve: Optional[_QuadraticSieve] = None
+
+
+def _init_siqs_worker(n: int, size: int, half_width: int) -> None:
+    global _worker_sieve
+    _worker_sieve = _QuadraticSieve(n, size, half_width)
+
+
+def _siqs_relations(seed: int) -> tuple[list, list]:
+    return _worker_sieve.relations(seed)
+
+
+def siqs(n: int, processes: Optional[int] = 1) -> int:
+    """Return a nontrivial factor of a composite integer, using the
+    self-initializing quadratic sieve.
+
+    Primes are rejected with miller_rabin, and perfect powers n = r^k are
+    recognized up front, returning the smallest such r, since the sieve
+    never splits a prime power.
+
+    The sieve looks for x where (A x + B)^2 - n factors over a base of small
+    primes p modulo which n is a square. A is a product of factor base
+    primes close to sqrt(2 n) / M, and each A gives 2^(s - 1) values of B
+    for its s primes, so that (A x + B)^2 - n = A (A x^2 + 2 B x + C) for
+    integer C. Switching B only costs one update of the roots mod each p.
+
+    For each polynomial, the sieve adds the rounded base 2 logarithm of p to
+    the bytearray positions in [-M, M) where p divides it, one slice per
+    root, using bytes.translate. The positions that come within a large
+    prime of the log of the polynomial values are trial divided. Relations
+    with one large prime left over are kept until another relation with the
+    same large prime comes along, and the two are combined.
+
+    Once there are more relations than factor base primes, Gaussian
+    elimination over GF(2) finds subsets whose product is a square y^2 with
+    u^2 = y^2 mod n, where u is the product of their A x + B, and
+    gcd(u - y, n) is a nontrivial factor with probability at least 1/2.
+
+    If processes is not 1, worker processes sieve different values of A in
+    parallel. If processes is None, uses one process per CPU.
+
+    Based on Contini's thesis "Factoring integers with the self-initializing
+    quadratic sieve": https://math.dartmouth.edu/~carlp/PDF/siqs.pdf
+
+    Complexity: exp((1 + o(1)) sqrt(ln n ln ln n))
+    """
+    if n < 4 or miller_rabin(n):
+        raise ValueError("input must be composite")
+    if n % 2 == 0:
+        return 2
+    for k in range(n.bit_length() - 1, 1, -1):
+        root = _integer_root(n, k)
+        if root ** k == n:
+            return root
+    if n.bit_length() < 64:
+        return pollard_brent(n)
+
+    size, half_width = _siqs_parameters(n)
+    sieve = _QuadraticSieve(n, size, half_width)
+    if sieve.divisor:
+        return sieve.divisor
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes == 1:
+        executor = None
+    else:
+        executor = ProcessPoolExecutor(processes,
+                                       initializer=_init_siqs_worker,
+                                       initargs=(n, size, half_width))
+
+    # relations by u, and partial relations by their large prime
+    relations = {}
+    partials = {}
+    needed = len(sieve.primes) + 10
+    rng = random.Random()
+    pending = deque()
+    try:
+        while True:
+            while len(relations) < needed:
+                if executor is None:
+                    full, partial = sieve.relations(rng.getrandbits(64))
+                else:
+                    while len(pending) < 2 * processes:
+                        pending.append(
+                            executor.submit(_siqs_relations,
+                                            rng.getrandbits(64)))
+                    full, partial = pending.popleft().result()
+
+                for u, w, vector in full:
+                    relations[u] = w, vector
+                for u, w, vector, large in partial:
+                    other = partials.setdefault(large, (u, w, vector))
+                    if other[0] != u:
+                        relations[u * other[0] % n] = (w * other[1],
+                                                       vector ^ other[2])
+
+            us = list(relations)
+            rows = [relations[u][1] for u in us]
+            for dependency in _gf2_dependencies(rows):
+                chosen = [us[i] for i in range(len(us)) if dependency >> i & 1]
+                x = math.prod(chosen) % n
+                y = math.isqrt(math.prod(relations[u][0] for u in chosen)) % n
+                d = math.gcd(x - y, n)
+                if 1 < d < n:
+                    return d
+            needed += 10
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
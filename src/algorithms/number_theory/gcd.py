@@ -39,3 +39,245 @@ def binary_euclidean(a: int, b: int) -> int:
             return b << min(a_trailing_zeros, b_trailing_zeros)
 
         a >>= (a & -a).bit_length() - 1
+
+
+# Lehmer's algorithm simulates the Euclidean algorithm on the leading word of
+# its operands
+_WORD_BITS = 64
+# below this many bits, the half-gcd recursion falls back to Lehmer's
+# algorithm
+_HGCD_THRESHOLD = 2048
+
+# the matrix (A, B, C, D) maps (a, b) to (A a + B b, C a + D b)
+_Matrix = tuple[int, int, int, int]
+_IDENTITY = (1, 0, 0, 1)
+_SWAP = (0, 1, 1, 0)
+
+
+def _compose(m: _Matrix, n: _Matrix) -> _Matrix:
+    """Return the matrix that applies n, then m."""
+    return (m[0] * n[0] + m[1] * n[2], m[0] * n[1] + m[1] * n[3],
+            m[2] * n[0] + m[3] * n[2], m[2] * n[1] + m[3] * n[3])
+
+
+def _lehmer_matrix(a: int, b: int) -> _Matrix:
+    """Return the matrix of the Euclidean steps on a >= b > 0 that are
+    determined by their leading word, which has B = 0 if there are none.
+
+    The quotients of the leading words, rounded towards each end of the
+    range that the discarded low bits allow, agree exactly as long as they
+    are the quotients of a and b themselves (Knuth, TAOCP 4.5.2, algorithm
+    L).
+    """
+    shift = max(a.bit_length() - _WORD_BITS, 0)
+    x = a >> shift
+    y = b >> shift
+    A, B, C, D = _IDENTITY
+    while y + C and y + D:
+        q = (x + A) // (y + C)
+        if q != (x + B) // (y + D):
+            break
+        A, B, C, D = C, D, A - q * C, B - q * D
+        x, y = y, x - q * y
+    return A, B, C, D
+
+
+def lehmer(a: int, b: int) -> int:
+    """Return the greatest common divisor of a and b.
+
+    Each round runs the Euclidean algorithm on the leading 64 bits of the
+    operands only, for as many steps as their quotients are certain to be
+    right, then applies all of those steps to the full operands at once.
+    This replaces a multi-precision division per step by a few
+    multiplications per round of many steps.
+
+    Complexity: O(n^2) for n bit operands, with a small constant
+    """
+    a = abs(a)
+    b = abs(b)
+    if a < b:
+        a, b = b, a
+
+    while b >> _WORD_BITS:
+        A, B, C, D = _lehmer_matrix(a, b)
+        if B == 0:
+            a, b = b, a % b
+        else:
+            a, b = A * a + B * b, C * a + D * b
+
+    return euclidean(a, b)
+
+
+def extended_lehmer(a: int, b: int) -> tuple[int, int, int]:
+    """Return (g, x, y) such that g is the greatest common divisor of a and b,
+    and a x + b y = g.
+
+    Like lehmer, tracking the coefficient of a alongside the remainders.
+
+    Complexity: O(n^2) for n bit operands, with a small constant
+    """
+    r0, r1 = abs(a), abs(b)
+    # r0 = u0 |a| mod |b| and r1 = u1 |a| mod |b|
+    u0, u1 = 1, 0
+    if r0 < r1:
+        r0, r1 = r1, r0
+        u0, u1 = u1, u0
+
+    while r1:
+        A, B, C, D = _lehmer_matrix(r0, r1) if r1 >> _WORD_BITS else _IDENTITY
+        if B == 0:
+            q, r = divmod(r0, r1)
+            r0, r1 = r1, r
+            u0, u1 = u1, u0 - q * u1
+        else:
+            r0, r1 = A * r0 + B * r1, C * r0 + D * r1
+            u0, u1 = A * u0 + B * u1, C * u0 + D * u1
+
+    if a < 0:
+        u0 = -u0
+    return r0, u0, (r0 - a * u0) // b if b else 0
+
+
+def _reducible(a: int, b: int, s: int) -> bool:
+    return bool(min(a, b) >> s and abs(a - b) >> s)
+
+
+def _reduce(a: int, b: int, s: int) -> tuple[int, int, _Matrix]:
+    """Return (a', b', M) with a' >= b', where M maps a and b to a' and b'.
+
+    Each step replaces the larger of the two by the smallest value >= 2^s
+    that it is congruent to modulo the smaller, until a' - b' < 2^s or
+    b' < 2^s.
+
+    Each step stays at or above 2^s, which is what lets a reduction of
+    leading bits carry over to the full operands in _hgcd. As long as that
+    holds, whole Lehmer rounds are taken at once.
+    """
+    m = _IDENTITY
+    while True:
+        if a < b:
+            a, b = b, a
+            m = _compose(_SWAP, m)
+        if not _reducible(a, b, s):
+            return a, b, m
+
+        if b >> _WORD_BITS:
+            step = _lehmer_matrix(a, b)
+            A, B, C, D = step
+            if B:
+                a_next, b_next = A * a + B * b, C * a + D * b
+                if b_next >> s and (a_next - b_next) >> s:
+                    a, b = a_next, b_next
+                    m = _compose(step, m)
+                    continue
+
+        q = (a - (1 << s)) // b
+        a, b = b, a - q * b
+        m = _compose((0, 1, 1, -q), m)
+
+
+def _lift(m: _Matrix, a: int, b: int, high_a: int, high_b: int,
+          shift: int) -> tuple[int, int]:
+    """Return the result of applying m to a and b, given the results of
+    applying it to a >> shift and b >> shift."""
+    mask = (1 << shift) - 1
+    low_a = a & mask
+    low_b = b & mask
+    return ((high_a << shift) + m[0] * low_a + m[1] * low_b,
+            (high_b << shift) + m[2] * low_a + m[3] * low_b)
+
+
+def _hgcd(a: int, b: int) -> tuple[int, int, _Matrix]:
+    """Return _reduce(a, b, s) with s = floor(n / 2) + 1 for a and b of at
+    most n bits, up to the choice of steps.
+
+    A reduction of the leading n - p bits of a and b with the corresponding
+    s' carries over to a and b, and reduces them to about s' + p bits. So a
+    recursive call on the leading half reduces a and b to three quarters of
+    their size, and another one on the leading 2 (n' - s) bits of what is
+    left reduces them to s + 1 bits.
+
+    Complexity: O(M(n) lg n) where M(n) is the cost of multiplying n bit
+    integers
+    """
+    n = max(a.bit_length(), b.bit_length())
+    s = n // 2 + 1
+    if n <= _HGCD_THRESHOLD or not _reducible(a, b, s):
+        return _reduce(a, b, s)
+
+    high_a, high_b, m = _hgcd(a >> s, b >> s)
+    a, b = _lift(m, a, b, high_a, high_b, s)
+
+    if _reducible(a, b, s):
+        # one step, so that a and b are down to about three quarters of
+        # their size even if b was too small for the recursive call
+        if a < b:
+            a, b = b, a
+            m = _compose(_SWAP, m)
+        q = (a - (1 << s)) // b
+        a, b = b, a - q * b
+        m = _compose((0, 1, 1, -q), m)
+
+    if _reducible(a, b, s):
+        shift = 2 * s - max(a.bit_length(), b.bit_length())
+        high_a, high_b, step = _hgcd(a >> shift, b >> shift)
+        a, b = _lift(step, a, b, high_a, high_b, shift)
+        m = _compose(step, m)
+
+    a, b, step = _reduce(a, b, s)
+    return a, b, _compose(step, m)
+
+
+def half_gcd(a: int, b: int) -> int:
+    """Return the greatest common divisor of a and b.
+
+    Halves the size of the operands with the recursive half-gcd algorithm,
+    which finds the Euclidean steps from the leading half of the operands,
+    until they are small enough for Lehmer's algorithm. Python multiplies
+    large integers with Karatsuba's algorithm in O(n^1.58), which bounds
+    the complexity.
+
+    Based on Möller's "On Schönhage's algorithm and subquadratic integer gcd
+    computation": https://doi.org/10.1090/S0025-5718-07-02017-0
+
+    Complexity: O(n^1.58 lg n) for n bit operands
+    """
+    a = abs(a)
+    b = abs(b)
+    if a < b:
+        a, b = b, a
+
+    while b >> _HGCD_THRESHOLD:
+        a, b, _ = _hgcd(a, b)
+        a, b = b, a % b
+
+    return lehmer(a, b)
+
+
+def extended_half_gcd(a: int, b: int) -> tuple[int, int, int]:
+    """Return (g, x, y) such that g is the greatest common divisor of a and b,
+    and a x + b y = g.
+
+    Like half_gcd, multiplying together the matrices of the steps.
+
+    Complexity: O(n^1.58 lg n) for n bit operands
+    """
+    r0, r1 = abs(a), abs(b)
+    m = _IDENTITY
+    if r0 < r1:
+        r0, r1 = r1, r0
+        m = _SWAP
+
+    while r1 >> _HGCD_THRESHOLD:
+        r0, r1, step = _hgcd(r0, r1)
+        q, r = divmod(r0, r1)
+        r0, r1 = r1, r
+        m = _compose((0, 1, 1, -q), _compose(step, m))
+
+    g, x, y = extended_lehmer(r0, r1)
+    x, y = x * m[0] + y * m[2], x * m[1] + y * m[3]
+    if a < 0:
+        x = -x
+    if b < 0:
+        y = -y
+    return g, x, y
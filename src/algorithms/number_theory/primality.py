@@ -0,0 +1,65 @@
+"""Algorithms for testing whether an integer is prime."""
+
+import random
+
+# (bound, bases) such that testing the bases decides primality for all
+# n < bound
+_WITNESS_SETS = [
+    (2047, (2,)),
+    (1373653, (2, 3)),
+    (25326001, (2, 3, 5)),
+    (3215031751, (2, 3, 5, 7)),
+    (2152302898747, (2, 3, 5, 7, 11)),
+    (3474749660383, (2, 3, 5, 7, 11, 13)),
+    (341550071728321, (2, 3, 5, 7, 11, 13, 17)),
+    (3825123056546413051, (2, 3, 5, 7, 11, 13, 17, 19, 23)),
+    (318665857834031151167461, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)),
+    (3317044064679887385961981,
+     (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)),
+]
+_SMALL_PRIMES = _WITNESS_SETS[-1][1]
+
+
+def _is_strong_probable_prime(n: int, d: int, s: int, base: int) -> bool:
+    """Return whether n - 1 = d 2^s passes the strong probable prime test to
+    the given base."""
+    x = pow(base, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def miller_rabin(n: int, rounds: int = 20) -> bool:
+    """Return whether n is prime.
+
+    For n < 3.3 10^24, tests a fixed set of bases that is known to have no
+    strong pseudoprimes below n, so the result is exact. For larger n, tests
+    the same bases plus the given number of random ones. The fixed bases
+    give no probabilistic guarantee, so a composite is reported prime with
+    probability at most 4^-rounds.
+
+    Complexity: O(k lg n) multiplications of lg n bit integers, where k is
+    the number of bases
+    """
+    if n < 2:
+        return False
+    for p in _SMALL_PRIMES:
+        if n % p == 0:
+            return n == p
+
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    for bound, bases in _WITNESS_SETS:
+        if n < bound:
+            break
+    else:
+        bases = _SMALL_PRIMES + tuple(
+            random.randrange(2, n - 1) for _ in range(rounds))
+
+    return all(_is_strong_probable_prime(n, d, s, base) for base in bases)
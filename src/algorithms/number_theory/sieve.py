@@ -0,0 +1,186 @@
+"""Sieves for generating prime numbers."""
+
+import bisect
+import itertools
+import math
+import os
+from array import array
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# the residues mod 30 of integers coprime to 2, 3 and 5
+_WHEEL = (1, 7, 11, 13, 17, 19, 23, 29)
+
+
+def _small_primes(n: int) -> list[int]:
+    """Return the primes below n, using a sieve over the odd numbers."""
+    if n <= 2:
+        return []
+    # is_odd_prime[i] represents 2i + 1
+    is_odd_prime = bytearray([1]) * (n // 2)
+    is_odd_prime[0] = 0
+    for i in range(1, (math.isqrt(n - 1) + 1) // 2):
+        if is_odd_prime[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            is_odd_prime[start::p] = bytes(len(range(start, n // 2, p)))
+    return [2] + [2 * i + 1 for i in itertools.compress(
+        range(n // 2), is_odd_prime)]
+
+
+def _wheel_offsets(p: int) -> list[int]:
+    """Return for each wheel residue r the q mod 30 for which p q = r mod 30.
+    """
+    inverse = pow(p, -1, 30)
+    return [r * inverse % 30 for r in _WHEEL]
+
+
+def _first_multiple(p: int, w: int, offset: Sequence[int], base: int) -> int:
+    """Return the position, among the integers from base with residue
+    _WHEEL[w] mod 30, of the first multiple of p at least max(p^2, base)."""
+    # the first multiple p q >= max(p^2, base) with p q = _WHEEL[w] mod 30
+    q = max(p, -(-base // p))
+    q += (offset[w] - q) % 30
+    return (p * q - base) // 30
+
+
+def _bucket(buckets: dict[int, list[list[int]]], s: int) -> list[list[int]]:
+    bucket = buckets.get(s)
+    if bucket is None:
+        bucket = buckets[s] = [[] for _ in _WHEEL]
+    return bucket
+
+
+def _sieve_range(lo: int, hi: int, segment_size: int,
+                 base_primes: Sequence[int],
+                 offsets: Sequence[Sequence[int]]) -> Iterator[list[int]]:
+    """Yield the primes in [lo, hi) that are at least 7, one segment of
+    30 segment_size integers at a time, given the primes from 7 up to the
+    square root of hi and their wheel offsets.
+
+    The candidates of a segment with residue r mod 30 are the bytes of one
+    bytearray, in which the multiples of p with that residue are p apart. A
+    prime below segment_size crosses off its multiples with one slice
+    assignment per residue. Larger primes hit a segment at most once per
+    residue, so each of their multiples waits in the bucket of the segment
+    it falls in, and moves on to a later bucket when crossed off. This way
+    a segment only costs time for the large primes that hit it.
+    """
+    base = lo - lo % 30
+    total = -(-(hi - base) // 30)
+    split = bisect.bisect_left(base_primes, segment_size)
+    small = list(zip(base_primes[:split], offsets[:split]))
+
+    # buckets[s][w] holds the flattened (position, prime) pairs of the
+    # multiples with residue _WHEEL[w] in segment s, where positions count
+    # from base
+    buckets = {}
+    for p, offset in zip(base_primes[split:], offsets[split:]):
+        for w in range(len(_WHEEL)):
+            m = _first_multiple(p, w, offset, base)
+            if m < total:
+                _bucket(buckets, m // segment_size)[w] += m, p
+
+    for s, start in enumerate(range(0, total, segment_size)):
+        length = min(segment_size, total - start)
+        end = base + 30 * (start + length)
+        segment_base = base + 30 * start
+        bucket = buckets.pop(s, None) or [()] * len(_WHEEL)
+        candidates = []
+        for w, r in enumerate(_WHEEL):
+            flags = bytearray([1]) * length
+            for p, offset in small:
+                if p * p >= end:
+                    break
+                m = _first_multiple(p, w, offset, segment_base)
+                if m < length:
+                    flags[m::p] = bytes(len(range(m, length, p)))
+            pairs = bucket[w]
+            for i in range(0, len(pairs), 2):
+                m, p = pairs[i], pairs[i + 1]
+                flags[m - start] = 0
+                m += p
+                if m < total:
+                    _bucket(buckets, m // segment_size)[w] += m, p
+            if segment_base == 0 and r == 1:
+                flags[0] = 0
+            candidates += itertools.compress(range(segment_base + r, end, 30),
+                                             flags)
+        candidates.sort()
+        first = bisect.bisect_left(candidates, lo)
+        yield candidates[first:bisect.bisect_left(candidates, hi, first)]
+
+
+_worker_base_primes = None
+_worker_offsets = None
+
+
+def _init_sieve_worker(base_primes: Sequence[int],
+                       offsets: Sequence[Sequence[int]]) -> None:
+    global _worker_base_primes, _worker_offsets
+    _worker_base_primes = base_primes
+    _worker_offsets = offsets
+
+
+def _sieve_chunk(lo: int, hi: int, segment_size: int) -> array:
+    primes = array("q")
+    for segment in _sieve_range(lo, hi, segment_size, _worker_base_primes,
+                                _worker_offsets):
+        primes.extend(segment)
+    return primes
+
+
+def segmented_sieve(lo: int,
+                    hi: int,
+                    segment_size: int = 1 << 15,
+                    processes: Optional[int] = 1) -> Iterator[int]:
+    """Yield the primes in [lo, hi) in increasing order.
+
+    Sieves one segment of 30 segment_size integers at a time, using a mod 30
+    wheel, so that each segment takes 8 bytearrays of segment_size bytes.
+    The default keeps a segment at 256 KiB. Apart from the segment, memory
+    use is O(sqrt(hi) / lg hi) for the primes up to sqrt(hi).
+
+    If processes is not 1, worker processes sieve chunks of segments in
+    parallel, with up to two chunks per process in flight. If processes is
+    None, uses one process per CPU.
+
+    Complexity: O((hi - lo) lg lg hi + sqrt(hi))
+    """
+    if segment_size < 1:
+        raise ValueError("segment size must be positive")
+    lo = max(lo, 0)
+    if lo >= hi:
+        return
+
+    yield from (p for p in (2, 3, 5) if lo <= p < hi)
+
+    base_primes = _small_primes(math.isqrt(hi - 1) + 1)[3:]
+    offsets = [_wheel_offsets(p) for p in base_primes]
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes == 1:
+        for primes in _sieve_range(lo, hi, segment_size, base_primes,
+                                   offsets):
+            yield from primes
+        return
+
+    chunk_size = 30 * segment_size * 8
+    chunks = ((start, min(start + chunk_size, hi))
+              for start in range(lo, hi, chunk_size))
+    with ProcessPoolExecutor(processes,
+                             initializer=_init_sieve_worker,
+                             initargs=(base_primes, offsets)) as executor:
+        pending = deque()
+        for start, stop in itertools.islice(chunks, 2 * processes):
+            pending.append(
+                executor.submit(_sieve_chunk, start, stop, segment_size))
+        while pending:
+            primes = pending.popleft().result()
+            for start, stop in itertools.islice(chunks, 1):
+                pending.append(
+                    executor.submit(_sieve_chunk, start, stop, segment_size))
+            yield from primes
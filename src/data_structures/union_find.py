@@ -3,10 +3,17 @@
 Implemented from memory, but most likely based on Wikipedia's presentation:
 https://en.wikipedia.org/wiki/Disjoint-set_data_structure
 
-Current implementation uses union by rank with path halving.
+UnionFind uses union by rank with path halving. ArrayUnionFind stores its
+state in typed arrays instead of lists, uses union by size, and additionally
+keeps track of set sizes and the number of sets. RollbackUnionFind supports
+undoing merges, and WeightedUnionFind keeps track of differences between the
+values of elements in the same set.
 """
 
-# TODO: maybe use array for ranks, since the values are at most logarithmic
+from array import array
+from collections.abc import Iterable
+from numbers import Real
+from typing import Optional
 
 
 class UnionFind:
@@ -74,3 +81,366 @@ class UnionFind:
 
     def __len__(self) -> int:
         return len(self._parents)
+
+
+class ArrayUnionFind:
+    """Union find with array storage, set sizes and bulk operations.
+
+    Uses about 16 bytes per element, compared to around 50 for UnionFind.
+    """
+
+    __slots__ = ('_parents', '_sizes', '_count')
+
+    _parents: array
+    _sizes: array
+    _count: int
+
+    def __init__(self, size: int):
+        """Initialize a partition with size singleton sets.
+
+        Complexity: O(size)
+        """
+        self._parents = array('l', range(size))
+        self._sizes = array('l', [1]) * size
+        self._count = size
+
+    def make_set(self) -> int:
+        """Create a new singleton set and return its index.
+
+        Complexity: O(1) amortized
+        """
+        x = len(self._parents)
+        self._parents.append(x)
+        self._sizes.append(1)
+        self._count += 1
+        return x
+
+    def find(self, x: int) -> int:
+        """Find the current representative of the set containing x.
+
+        Complexity: O(iAck(size)) amortized
+        """
+        parents = self._parents
+        while x != parents[x]:
+            # path halving
+            parents[x] = parents[parents[x]]
+            x = parents[x]
+        return x
+
+    def merge(self, x: int, y: int) -> bool:
+        """Merge the set containing x with the set containing y.
+
+        If x and y were originally in different sets, return True.
+        Otherwise, return False.
+
+        Complexity: O(iAck(size)) amortized
+        """
+        x = self.find(x)
+        y = self.find(y)
+
+        if x != y:
+            # union by size
+            sizes = self._sizes
+            if sizes[x] > sizes[y]:
+                x, y = y, x
+
+            sizes[y] += sizes[x]
+            self._parents[x] = y
+            self._count -= 1
+            return True
+        return False
+
+    def merge_many(self, pairs: Iterable[tuple[int, int]]) -> int:
+        """Merge the sets of each given pair and return the number of merges.
+
+        Equivalent to calling merge on each pair, but avoids the method call
+        overhead, which dominates the running time for long edge streams.
+
+        Complexity: O(k iAck(size)) amortized, for k pairs
+        """
+        parents = self._parents
+        sizes = self._sizes
+        merges = 0
+        for x, y in pairs:
+            while x != parents[x]:
+                parents[x] = parents[parents[x]]
+                x = parents[x]
+            while y != parents[y]:
+                parents[y] = parents[parents[y]]
+                y = parents[y]
+
+            if x != y:
+                if sizes[x] > sizes[y]:
+                    x, y = y, x
+                sizes[y] += sizes[x]
+                parents[x] = y
+                merges += 1
+
+        self._count -= merges
+        return merges
+
+    def components(self) -> array:
+        """Return an array mapping each element to the label of its set.
+
+        Labels are 0, 1, ..., set_count() - 1, numbered in order of the first
+        element of each set.
+
+        Complexity: O(size iAck(size))
+        """
+        n = len(self._parents)
+        labels = array('l', [-1]) * n
+        next_label = 0
+        for x in range(n):
+            root = self.find(x)
+            if labels[root] == -1:
+                labels[root] = next_label
+                next_label += 1
+            labels[x] = labels[root]
+        return labels
+
+    def set_size(self, x: int) -> int:
+        """Return the number of elements in the set containing x.
+
+        Complexity: O(iAck(size)) amortized
+        """
+        return self._sizes[self.find(x)]
+
+    def set_count(self) -> int:
+        """Return the number of sets in the partition.
+
+        Complexity: O(1)
+        """
+        return self._count
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+
+class RollbackUnionFind:
+    """Union find supporting undoing merges in last-in first-out order.
+
+    Uses union by size without path compression, so that every merge changes
+    a single parent pointer and can be undone in constant time.
+    """
+
+    __slots__ = ('_parents', '_sizes', '_history', '_count')
+
+    _parents: array
+    _sizes: array
+    _history: array
+    _count: int
+
+    def __init__(self, size: int):
+        """Initialize a partition with size singleton sets.
+
+        Complexity: O(size)
+        """
+        self._parents = array('l', range(size))
+        self._sizes = array('l', [1]) * size
+        self._history = array('l')
+        self._count = size
+
+    def find(self, x: int) -> int:
+        """Find the current representative of the set containing x.
+
+        Complexity: O(lg size)
+        """
+        parents = self._parents
+        while x != parents[x]:
+            x = parents[x]
+        return x
+
+    def merge(self, x: int, y: int) -> bool:
+        """Merge the set containing x with the set containing y.
+
+        If x and y were originally in different sets, return True.
+        Otherwise, return False.
+
+        Complexity: O(lg size)
+        """
+        x = self.find(x)
+        y = self.find(y)
+
+        if x != y:
+            if self._sizes[x] > self._sizes[y]:
+                x, y = y, x
+
+            self._sizes[y] += self._sizes[x]
+            self._parents[x] = y
+            self._history.append(x)
+            self._count -= 1
+            return True
+        return False
+
+    def snapshot(self) -> int:
+        """Return a token that rollback can use to restore the current state.
+
+        Complexity: O(1)
+        """
+        return len(self._history)
+
+    def rollback(self, token: int) -> None:
+        """Undo all merges performed since the given snapshot was taken.
+
+        Tokens of snapshots taken after the given one become invalid.
+
+        Complexity: O(k), where k is the number of merges undone
+        """
+        if not 0 <= token <= len(self._history):
+            raise ValueError(f"invalid snapshot token {token}")
+
+        parents = self._parents
+        sizes = self._sizes
+        history = self._history
+        while len(history) > token:
+            x = history.pop()
+            sizes[parents[x]] -= sizes[x]
+            parents[x] = x
+            self._count += 1
+
+    def set_size(self, x: int) -> int:
+        """Return the number of elements in the set containing x.
+
+        Complexity: O(lg size)
+        """
+        return self._sizes[self.find(x)]
+
+    def set_count(self) -> int:
+        """Return the number of sets in the partition.
+
+        Complexity: O(1)
+        """
+        return self._count
+
+    def __len__(self) -> int:
+        return len(self._parents)
+
+
+class WeightedUnionFind:
+    """Union find that maintains known differences between unknown values.
+
+    Each element x has an unknown value x_x, and merge(u, v, w) records the
+    constraint x_u - x_v = w. Every element stores its offset relative to
+    its parent, so differences within a set follow from summing offsets
+    along the paths to the root.
+
+    Constraints contradicting earlier ones are rejected with a ValueError.
+    For inexact weights such as floats, a tolerance can be given.
+    """
+
+    __slots__ = ('_parents', '_sizes', '_offsets', '_count', '_tolerance')
+
+    _parents: array
+    _sizes: array
+    _offsets: list[Real]
+    _count: int
+    _tolerance: Real
+
+    def __init__(self, size: int, tolerance: Real = 0):
+        """Initialize a partition with size singleton sets.
+
+        Complexity: O(size)
+        """
+        self._parents = array('l', range(size))
+        self._sizes = array('l', [1]) * size
+        self._offsets = [0 for _ in range(size)]
+        self._count = size
+        self._tolerance = tolerance
+
+    def make_set(self) -> int:
+        """Create a new singleton set and return its index.
+
+        Complexity: O(1) amortized
+        """
+        x = len(self._parents)
+        self._parents.append(x)
+        self._sizes.append(1)
+        self._offsets.append(0)
+        self._count += 1
+        return x
+
+    def _find(self, x: int) -> tuple[int, Real]:
+        """Return the root r of the set containing x, and x_x - x_r.
+
+        Compresses the path from x to the root, accumulating offsets.
+        """
+        parents = self._parents
+        offsets = self._offsets
+
+        path = []
+        while x != parents[x]:
+            path.append(x)
+            x = parents[x]
+
+        # from the root down, the offset of each node becomes the sum of
+        # the offsets above it
+        total = 0
+        for y in reversed(path):
+            total += offsets[y]
+            offsets[y] = total
+            parents[y] = x
+
+        return x, total
+
+    def find(self, x: int) -> int:
+        """Find the current representative of the set containing x.
+
+        Complexity: O(iAck(size)) amortized
+        """
+        return self._find(x)[0]
+
+    def merge(self, u: int, v: int, weight: Real) -> bool:
+        """Record the constraint x_u - x_v = weight.
+
+        If u and v were originally in different sets, merge them and return
+        True. If the constraint already followed from earlier ones, return
+        False. If it contradicts them, raise a ValueError and leave the
+        structure unchanged.
+
+        Complexity: O(iAck(size)) amortized
+        """
+        u_root, u_offset = self._find(u)
+        v_root, v_offset = self._find(v)
+
+        if u_root == v_root:
+            implied = u_offset - v_offset
+            if abs(implied - weight) > self._tolerance:
+                raise ValueError(
+                    f"contradiction: x_{u} - x_{v} = {weight} "
+                    f"conflicts with implied difference {implied}")
+            return False
+
+        # x_{u_root} - x_{v_root}
+        root_offset = weight - u_offset + v_offset
+
+        # union by size
+        if self._sizes[u_root] > self._sizes[v_root]:
+            u_root, v_root = v_root, u_root
+            root_offset = -root_offset
+
+        self._sizes[v_root] += self._sizes[u_root]
+        self._parents[u_root] = v_root
+        self._offsets[u_root] = root_offset
+        self._count -= 1
+        return True
+
+    def diff(self, u: int, v: int) -> Optional[Real]:
+        """Return x_u - x_v, or None if it does not follow from constraints.
+
+        Complexity: O(iAck(size)) amortized
+        """
+        u_root, u_offset = self._find(u)
+        v_root, v_offset = self._find(v)
+        if u_root != v_root:
+            return None
+        return u_offset - v_offset
+
+    def set_count(self) -> int:
+        """Return the number of sets in the partition.
+
+        Complexity: O(1)
+        """
+        return self._count
+
+    def __len__(self) -> int:
+        return len(self._parents)
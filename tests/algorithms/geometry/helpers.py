@@ -0,0 +1,31 @@
+import itertools
+import math
+from numbers import Real
+from typing import TypeVar
+
+from hypothesis import strategies as st
+
+T = TypeVar("T")
+
+int_strategy = st.integers()
+float_strategy = st.floats(allow_nan=False, allow_infinity=False, width=32)
+
+
+@st.composite
+def n_point_lists(draw: st.DrawFn,
+                  elements: st.SearchStrategy[T],
+                  min_dimension: int = 1,
+                  max_dimension: int = 5,
+                  *,
+                  min_size: int = 2,
+                  max_size: int | None = None) -> list[tuple[T, ...]]:
+    dimension = draw(st.integers(min_dimension, max_dimension))
+    return draw(
+        st.lists(st.tuples(*(elements for _ in range(dimension))),
+                 min_size=min_size,
+                 max_size=max_size))
+
+
+def verify_closest(points: list[tuple[Real, ...]], i: int, j: int):
+    m_dist = min(math.dist(p, q) for p, q in itertools.combinations(points, 2))
+    assert math.dist(points[i], points[j]) == m_dist
@@ -1,45 +1,101 @@
 import itertools
 import math
 from numbers import Real
-from typing import TypeVar
 
 from hypothesis import given, strategies as st
 
-from src.algorithms.geometry.closest_pair import brute_force, rabin_lipton_2d
+from src.algorithms.geometry.closest_pair import (brute_force, rabin_lipton_2d,
+                                                 divide_and_conquer_2d,
+                                                 sweep_line_2d,
+                                                 DynamicClosestPair)
+from tests.algorithms.geometry.helpers import (float_strategy, int_strategy,
+                                               n_point_lists, verify_closest)
 
-T = TypeVar("T")
 
-int_strategy = st.integers()
-float_strategy = st.floats(allow_nan=False, allow_infinity=False, width=32)
+@given(n_point_lists(float_strategy))
+def test_brute_force(points: list[tuple[Real, ...]]):
+    i, j = brute_force(points)
+    verify_closest(points, i, j)
 
 
-@st.composite
-def n_point_lists(draw: st.DrawFn,
-                  elements: st.SearchStrategy[T],
-                  min_dimension: int = 1,
-                  max_dimension: int = 5,
-                  *,
-                  min_size: int = 2,
-                  max_size: int | None = None) -> list[tuple[T, ...]]:
-    dimension = draw(st.integers(min_dimension, max_dimension))
-    return draw(
-        st.lists(st.tuples(*(elements for _ in range(dimension))),
-                 min_size=min_size,
-                 max_size=max_size))
+@given(n_point_lists(float_strategy, min_dimension=2, max_dimension=2))
+def test_rabin_lipton_2d(points: list[tuple[Real, Real]]):
+    i, j = rabin_lipton_2d(points)
+    verify_closest(points, i, j)
 
 
-def verify_closest(points: list[tuple[Real, ...]], i: int, j: int):
-    m_dist = min(math.dist(p, q) for p, q in itertools.combinations(points, 2))
-    assert math.dist(points[i], points[j]) == m_dist
+@given(n_point_lists(float_strategy, min_dimension=2, max_dimension=2))
+def test_divide_and_conquer_2d(points: list[tuple[Real, Real]]):
+    i, j = divide_and_conquer_2d(points)
+    verify_closest(points, i, j)
 
 
-@given(n_point_lists(float_strategy))
-def test_brute_force(points: list[tuple[Real, ...]]):
-    i, j = brute_force(points)
+@given(n_point_lists(int_strategy, min_dimension=2, max_dimension=2))
+def test_divide_and_conquer_2d_int(points: list[tuple[Real, Real]]):
+    i, j = divide_and_conquer_2d(points)
     verify_closest(points, i, j)
 
 
 @given(n_point_lists(float_strategy, min_dimension=2, max_dimension=2))
-def test_rabin_lipton_2d(points: list[tuple[Real, Real]]):
-    i, j = rabin_lipton_2d(points)
+def test_sweep_line_2d(points: list[tuple[Real, Real]]):
+    i, j = sweep_line_2d(points)
+    verify_closest(points, i, j)
+
+
+@given(n_point_lists(int_strategy, min_dimension=2, max_dimension=2))
+def test_sweep_line_2d_int(points: list[tuple[Real, Real]]):
+    i, j = sweep_line_2d(points)
     verify_closest(points, i, j)
+
+
+def check_dynamic_closest_pair(initial: list[tuple[int, int]],
+                               coordinates: st.SearchStrategy[int],
+                               data: st.DataObject):
+    structure = DynamicClosestPair(initial)
+    points = dict(enumerate(initial))
+
+    for _ in range(data.draw(st.integers(0, 30))):
+        if points and data.draw(st.booleans()):
+            key = data.draw(st.sampled_from(sorted(points)))
+            structure.delete(key)
+            del points[key]
+        else:
+            point = data.draw(st.tuples(coordinates, coordinates))
+            key = structure.insert(point)
+            assert key not in points
+            points[key] = point
+
+        assert len(structure) == len(points)
+        pair = structure.closest_pair()
+        if len(points) < 2:
+            assert pair is None
+        else:
+            i, j = pair
+            assert i != j and i in points and j in points
+            m_dist = min(
+                math.dist(p, q)
+                for p, q in itertools.combinations(points.values(), 2))
+            assert math.dist(points[i], points[j]) == m_dist
+
+
+@given(st.lists(st.tuples(int_strategy, int_strategy)), st.data())
+def test_dynamic_closest_pair(initial: list[tuple[int, int]],
+                              data: st.DataObject):
+    check_dynamic_closest_pair(initial, int_strategy, data)
+
+
+@given(st.lists(st.tuples(st.integers(0, 3), st.integers(0, 3))), st.data())
+def test_dynamic_closest_pair_coincident(initial: list[tuple[int, int]],
+                                         data: st.DataObject):
+    check_dynamic_closest_pair(initial, st.integers(0, 3), data)
+
+
+def test_dynamic_closest_pair_close_insert_delete():
+    points = [(10 * i, 10 * j) for i in range(20) for j in range(20)]
+    structure = DynamicClosestPair(points)
+    for _ in range(100):
+        key = structure.insert((1, 0))
+        assert structure.closest_pair() in ((0, key), (key, 0))
+        structure.delete(key)
+        i, j = structure.closest_pair()
+        assert math.dist(structure[i], structure[j]) == 10
@@ -1,8 +1,13 @@
+from fractions import Fraction
+
 import pytest
 
 from hypothesis import given, strategies as st
 
-from src.algorithms.geometry.convex_hull import monotone_chain
+from src.algorithms.geometry.convex_hull import (IncrementalConvexHull, chan,
+                                                 monotone_chain,
+                                                 recursive_convex_hull)
+from tests.algorithms.geometry.helpers import float_strategy
 
 
 def is_strictly_ccw(p, q, r):
@@ -65,8 +70,113 @@ def verify_hull(points: list[tuple[int, int]], indices: list[int]):
 
 
 @given(st.lists(st.tuples(st.integers(), st.integers())))
-def test_monotone_chain(points: list[tuple[int, int]]):  # TODO: floats
+def test_monotone_chain(points: list[tuple[int, int]]):
     hull = monotone_chain(points)
     verify_no_repeated_points(points, hull)
     verify_convex(points, hull)
     verify_hull(points, hull)
+
+
+@given(st.lists(st.tuples(float_strategy, float_strategy)))
+def test_monotone_chain_floats(points: list[tuple[float, float]]):
+    hull = monotone_chain(points)
+    exact_points = [(Fraction(x), Fraction(y)) for x, y in points]
+    verify_no_repeated_points(points, hull)
+    verify_convex(exact_points, hull)
+    verify_hull(exact_points, hull)
+
+
+@given(st.lists(st.tuples(st.integers(), st.integers())))
+def test_recursive_convex_hull(points: list[tuple[int, int]]):
+    hull = recursive_convex_hull(points)
+    verify_no_repeated_points(points, hull)
+    verify_convex(points, hull)
+    verify_hull(points, hull)
+
+
+@given(st.lists(st.tuples(st.integers(-5, 5), st.integers(-5, 5))))
+def test_recursive_convex_hull_degenerate(points: list[tuple[int, int]]):
+    assert recursive_convex_hull(points) == monotone_chain(points)
+
+
+@given(st.lists(st.tuples(st.integers(), st.integers())), st.integers(2, 8))
+def test_chan(points: list[tuple[int, int]], group_size: int):
+    hull = chan(points, group_size)
+    verify_no_repeated_points(points, hull)
+    verify_convex(points, hull)
+    verify_hull(points, hull)
+
+
+@given(
+    st.lists(st.tuples(st.integers(-5, 5), st.integers(-5, 5)), max_size=200),
+    st.integers(2, 8))
+def test_chan_degenerate(points: list[tuple[int, int]], group_size: int):
+    assert chan(points, group_size) == monotone_chain(points)
+
+
+@given(st.sets(st.integers(-1000, 1000), min_size=20), st.integers(2, 8))
+def test_chan_large_hull(xs: set[int], group_size: int):
+    # every point on a parabola is a hull vertex, so hulls of more than
+    # group_size vertices force restarts
+    points = [(x, x * x) for x in xs]
+    assert chan(points, group_size) == monotone_chain(points)
+
+
+def test_chan_large_hull_default_group_size():
+    # more points than fit in a single group of the default size
+    points = [(x, x * x) for x in range(-150, 150)]
+    assert chan(points) == monotone_chain(points)
+
+
+def test_chan_group_size():
+    with pytest.raises(ValueError):
+        chan([(0, 0)], 1)
+
+
+@given(st.lists(st.tuples(st.integers(-5, 5), st.integers(-5, 5))))
+def test_monotone_chain_sorted(points: list[tuple[int, int]]):
+    assert monotone_chain(sorted(points)) == [
+        sorted(points).index(points[idx]) for idx in monotone_chain(points)
+    ]
+
+
+def inside_hull(points: list[tuple[int, int]], hull: list[int],
+                query: tuple[int, int]) -> bool:
+    if len(hull) == 1:
+        return points[hull[0]] == query
+    if len(hull) == 2:
+        p, r = points[hull[0]], points[hull[1]]
+        return (not is_strictly_ccw(p, query, r) and is_ccw(p, query, r) and
+                min(p, r) <= query <= max(p, r))
+    return all(
+        is_ccw(points[hull[i]], points[hull[(i + 1) % len(hull)]], query)
+        for i in range(len(hull)))
+
+
+small_points = st.tuples(st.integers(-8, 8), st.integers(-8, 8))
+
+
+@given(st.lists(small_points, min_size=1), st.lists(small_points))
+def test_incremental_convex_hull(points: list[tuple[int, int]],
+                                 queries: list[tuple[int, int]]):
+    hull = IncrementalConvexHull(points[:len(points) // 2])
+    for point in points[len(points) // 2:]:
+        hull.insert(point)
+    assert len(hull) == len(points)
+    assert hull.vertices() == monotone_chain(points)
+
+    for query in queries:
+        inside = inside_hull(points, monotone_chain(points), query)
+        assert hull.contains(query) == inside
+        if inside:
+            continue
+
+        right, left = hull.tangents(query)
+        for point in points:
+            assert is_ccw(query, points[right], point)
+            assert is_ccw(query, point, points[left])
+
+
+def test_incremental_convex_hull_tangents_empty():
+    with pytest.raises(ValueError):
+        IncrementalConvexHull().tangents((0, 0))
@@ -0,0 +1,65 @@
+from collections import Counter
+
+from hypothesis import example, given, strategies as st
+
+from src.algorithms.geometry.convex_hull import monotone_chain
+from src.algorithms.geometry.convex_hull_3d import randomized_incremental
+
+
+def volume(p, q, r, s):
+    ux, uy, uz = q[0] - p[0], q[1] - p[1], q[2] - p[2]
+    vx, vy, vz = r[0] - p[0], r[1] - p[1], r[2] - p[2]
+    wx, wy, wz = s[0] - p[0], s[1] - p[1], s[2] - p[2]
+    return (ux * (vy * wz - vz * wy) - uy * (vx * wz - vz * wx) +
+            uz * (vx * wy - vy * wx))
+
+
+def is_coplanar(points):
+    for p in points:
+        for q in points:
+            for r in points:
+                if any(volume(p, q, r, s) for s in points):
+                    return False
+    return True
+
+
+def verify_closed(faces: list[tuple[int, int, int]]):
+    edges = Counter((face[k], face[(k + 1) % 3]) for face in faces
+                    for k in range(3))
+    for (u, v), count in edges.items():
+        assert count == 1, f"edge {u, v} appears {count} times"
+        assert edges[v, u] == 1, f"edge {u, v} has no twin"
+
+
+def verify_hull_3d(points: list[tuple[int, int, int]],
+                   faces: list[tuple[int, int, int]]):
+    for i, j, k in faces:
+        p, q, r = points[i], points[j], points[k]
+        cross = ((q[1] - p[1]) * (r[2] - p[2]) - (q[2] - p[2]) * (r[1] - p[1]),
+                 (q[2] - p[2]) * (r[0] - p[0]) - (q[0] - p[0]) * (r[2] - p[2]),
+                 (q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) * (r[0] - p[0]))
+        assert cross != (0, 0, 0), f"face {i, j, k} is degenerate"
+        for s in points:
+            assert volume(p, q, r, s) <= 0, f"{s} lies outside face {i, j, k}"
+
+
+coordinates = st.integers(-4, 4)
+
+
+@given(st.lists(st.tuples(coordinates, coordinates, coordinates)))
+@example([(0, 0, 0), (0, 1, 0), (1, 0, 0), (1, 1, 0)])
+def test_randomized_incremental(points: list[tuple[int, int, int]]):
+    faces = randomized_incremental(points)
+    if len(points) >= 4 and not is_coplanar(points):
+        assert faces
+    verify_closed(faces)
+    verify_hull_3d(points, faces)
+
+
+@given(st.lists(st.tuples(coordinates, coordinates)))
+def test_randomized_incremental_coplanar(points: list[tuple[int, int]]):
+    hull = monotone_chain(points)
+    faces = randomized_incremental([(x, y, x + 2 * y) for x, y in points])
+    hull_points = {points[i] for i in hull} if len(hull) > 2 else set()
+    assert {points[i] for face in faces for i in face} == hull_points
+    assert len(faces) == 2 * max(len(hull) - 2, 0)
@@ -0,0 +1,62 @@
+import math
+
+from hypothesis import given, strategies as st
+
+from src.algorithms.geometry.kd_tree import KDTree
+
+coordinate_strategy = st.integers(-20, 20)
+
+
+@st.composite
+def points_and_queries(draw: st.DrawFn, min_size: int = 0):
+    dimension = draw(st.integers(1, 4))
+    point_strategy = st.tuples(*(coordinate_strategy
+                                 for _ in range(dimension)))
+    points = draw(st.lists(point_strategy, min_size=min_size, max_size=200))
+    queries = draw(st.lists(point_strategy, min_size=1, max_size=5))
+    leaf_size = draw(st.integers(1, 20))
+    return points, queries, leaf_size
+
+
+def brute_force_nearest(points, query, k):
+    return sorted(range(len(points)),
+                  key=lambda i: (math.dist(points[i], query), i))[:k]
+
+
+@given(points_and_queries(), st.integers(1, 10))
+def test_nearest(ex, k: int):
+    points, queries, leaf_size = ex
+    tree = KDTree(points, leaf_size)
+    assert len(tree) == len(points)
+
+    for query in queries:
+        assert tree.nearest(query, k) == brute_force_nearest(points, query, k)
+    assert tree.nearest_batch(queries, k) == [
+        brute_force_nearest(points, query, k) for query in queries
+    ]
+
+
+@given(points_and_queries(), st.integers(0, 30))
+def test_within(ex, radius: int):
+    points, queries, leaf_size = ex
+    tree = KDTree(points, leaf_size)
+
+    expected = [[
+        i for i in range(len(points))
+        if math.dist(points[i], query) <= radius
+    ] for query in queries]
+    assert [tree.within(query, radius) for query in queries] == expected
+    assert tree.within_batch(queries, radius) == expected
+
+
+@given(points_and_queries(min_size=2))
+def test_all_nearest_neighbors(ex):
+    points, _, leaf_size = ex
+    tree = KDTree(points, leaf_size)
+
+    expected = [
+        min((j for j in range(len(points)) if j != i),
+            key=lambda j: (math.dist(points[i], points[j]), j))
+        for i in range(len(points))
+    ]
+    assert tree.all_nearest_neighbors() == expected
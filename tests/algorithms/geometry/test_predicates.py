@@ -0,0 +1,75 @@
+from fractions import Fraction
+
+from hypothesis import given, strategies as st
+
+from src.algorithms.geometry.predicates import (in_circle, orientation,
+                                                orientation_3d)
+
+floats = st.floats(-1e6, 1e6, allow_nan=False, allow_infinity=False)
+points_2d = st.tuples(floats, floats)
+points_3d = st.tuples(floats, floats, floats)
+
+
+def sign(value) -> int:
+    return (value > 0) - (value < 0)
+
+
+def exact(point):
+    return [Fraction(x) for x in point]
+
+
+@st.composite
+def nearly_collinear(draw: st.DrawFn) -> tuple[tuple[float, float], ...]:
+    p = draw(points_2d)
+    q = draw(points_2d)
+    t = draw(st.floats(-2, 2))
+    r = (p[0] + t * (q[0] - p[0]), p[1] + t * (q[1] - p[1]))
+    return p, q, r
+
+
+@given(st.one_of(st.tuples(points_2d, points_2d, points_2d),
+                 nearly_collinear()))
+def test_orientation(points):
+    p, q, r = map(exact, points)
+    expected = sign((q[0] - p[0]) * (r[1] - p[1]) - (q[1] - p[1]) *
+                    (r[0] - p[0]))
+    assert orientation(*points) == expected
+
+
+@given(points_3d, points_3d, points_3d, st.floats(-2, 2), st.floats(-2, 2))
+def test_orientation_3d(p, q, r, s, t):
+    # a point close to the plane through p, q, r
+    point = tuple(p[k] + s * (q[k] - p[k]) + t * (r[k] - p[k])
+                  for k in range(3))
+    for s in point, q:
+        a, b, c, d = map(exact, (p, q, r, s))
+        u = [b[k] - a[k] for k in range(3)]
+        v = [c[k] - a[k] for k in range(3)]
+        w = [d[k] - a[k] for k in range(3)]
+        expected = sign(w[0] * (u[1] * v[2] - u[2] * v[1]) + w[1] *
+                        (u[2] * v[0] - u[0] * v[2]) + w[2] *
+                        (u[0] * v[1] - u[1] * v[0]))
+        assert orientation_3d(p, q, r, s) == expected
+
+
+@given(points_2d, points_2d, points_2d, st.one_of(points_2d, st.just(None)))
+def test_in_circle(a, b, c, d):
+    if d is None:
+        # a point on or near the circle
+        d = (a[0] + c[0] - b[0], a[1] + c[1] - b[1])
+    ea, eb, ec, ed = map(exact, (a, b, c, d))
+    rows = [(p[0] - ed[0], p[1] - ed[1]) for p in (ea, eb, ec)]
+    lifts = [x * x + y * y for x, y in rows]
+    (ax, ay), (bx, by), (cx, cy) = rows
+    expected = sign(lifts[0] * (bx * cy - cx * by) + lifts[1] *
+                    (cx * ay - ax * cy) + lifts[2] * (ax * by - bx * ay))
+    assert in_circle(a, b, c, d) == expected
+
+
+def test_orientation_exact_on_float_rounding():
+    # the float determinant rounds to 0, but p lies just off the line
+    p = (0.5, 0.5000000000000001)
+    q = (12.0, 12.0)
+    r = (24.0, 24.0)
+    assert orientation(p, q, r) == 1
+    assert orientation((0.5, 0.5), q, r) == 0
@@ -0,0 +1,76 @@
+import itertools
+import math
+
+import pytest
+from hypothesis import given, strategies as st
+
+from src.algorithms.geometry.convex_hull import monotone_chain
+from src.algorithms.geometry.rotating_calipers import (
+    diameter, minimum_area_rectangle, minimum_perimeter_rectangle,
+    minimum_width)
+
+point_lists = st.lists(st.tuples(st.integers(-50, 50), st.integers(-50, 50)),
+                       min_size=1)
+
+
+def edge_rectangles(points: list[tuple[int, int]], hull: list[int]):
+    """Yield width and height of the rectangle with a side on each hull edge.
+    """
+    for i in range(len(hull)):
+        p = points[hull[i]]
+        q = points[hull[(i + 1) % len(hull)]]
+        length = math.dist(p, q)
+        if length == 0:
+            yield 0.0, 0.0
+            continue
+        along = [((r[0] - p[0]) * (q[0] - p[0]) +
+                  (r[1] - p[1]) * (q[1] - p[1])) / length for r in points]
+        away = [((q[0] - p[0]) * (r[1] - p[1]) -
+                 (q[1] - p[1]) * (r[0] - p[0])) / length for r in points]
+        yield max(along) - min(along), max(away) - min(away)
+
+
+def verify_rectangle(points: list[tuple[int, int]],
+                     corners: list[tuple[float, float]]):
+    for k in range(4):
+        p = corners[k]
+        q = corners[(k + 1) % 4]
+        length = math.dist(p, q)
+        for r in points:
+            cross = ((q[0] - p[0]) * (r[1] - p[1]) -
+                     (q[1] - p[1]) * (r[0] - p[0]))
+            assert cross >= -1e-9 * max(length, 1)
+
+
+@given(point_lists)
+def test_diameter(points: list[tuple[int, int]]):
+    i, j = diameter(points, monotone_chain(points))
+    assert math.dist(points[i], points[j]) == max(
+        math.dist(p, q) for p, q in itertools.product(points, repeat=2))
+
+
+@given(point_lists)
+def test_minimum_width(points: list[tuple[int, int]]):
+    hull = monotone_chain(points)
+    expected = min(height for _, height in edge_rectangles(points, hull))
+    assert minimum_width(points, hull) == pytest.approx(expected)
+
+
+@given(point_lists)
+def test_minimum_area_rectangle(points: list[tuple[int, int]]):
+    hull = monotone_chain(points)
+    corners = minimum_area_rectangle(points, hull)
+    verify_rectangle(points, corners)
+    expected = min(w * h for w, h in edge_rectangles(points, hull))
+    area = math.dist(*corners[:2]) * math.dist(*corners[1:3])
+    assert area == pytest.approx(expected, abs=1e-9)
+
+
+@given(point_lists)
+def test_minimum_perimeter_rectangle(points: list[tuple[int, int]]):
+    hull = monotone_chain(points)
+    corners = minimum_perimeter_rectangle(points, hull)
+    verify_rectangle(points, corners)
+    expected = min(2 * (w + h) for w, h in edge_rectangles(points, hull))
+    perimeter = 2 * (math.dist(*corners[:2]) + math.dist(*corners[1:3]))
+    assert perimeter == pytest.approx(expected, abs=1e-9)
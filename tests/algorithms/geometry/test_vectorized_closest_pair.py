@@ -0,0 +1,41 @@
+from collections.abc import Callable
+from numbers import Real
+
+import pytest
+
+from hypothesis import given, strategies as st
+
+from src.algorithms.geometry.vectorized_closest_pair import (
+    blocked_brute_force, rabin_lipton_nd)
+from tests.algorithms.geometry.helpers import (float_strategy, n_point_lists,
+                                               verify_closest)
+
+
+@given(n_point_lists(float_strategy), st.integers(1, 8))
+def test_blocked_brute_force(points: list[tuple[Real, ...]], block_size: int):
+    i, j = blocked_brute_force(points, block_size)
+    verify_closest(points, i, j)
+
+
+@given(n_point_lists(float_strategy), st.integers(1, 8))
+def test_rabin_lipton_nd(points: list[tuple[Real, ...]], max_pairs: int):
+    i, j = rabin_lipton_nd(points, max_pairs)
+    verify_closest(points, i, j)
+
+
+@given(
+    n_point_lists(st.integers(-10, 10),
+                  min_dimension=3,
+                  max_dimension=3,
+                  min_size=50))
+def test_rabin_lipton_nd_clustered(points: list[tuple[int, int, int]]):
+    i, j = rabin_lipton_nd(points)
+    verify_closest(points, i, j)
+
+
+@pytest.mark.parametrize("algorithm", [blocked_brute_force, rabin_lipton_nd])
+def test_large_integers(
+        algorithm: Callable[[list[tuple[int, int]]], tuple[int, int]]):
+    # float64 would round 2^60 + 200 to 2^60 + 256
+    points = [(2**60, 0), (2**60 + 200, 0), (0, 0), (0, 255)]
+    assert sorted(algorithm(points)) == [0, 1]
@@ -14,3 +14,17 @@ def adjacency_lists(draw: st.DrawFn,
             adj[u].append(v)
             adj[v].append(u)
     return adj
+
+
+@st.composite
+def directed_adjacency_lists(draw: st.DrawFn,
+                             *,
+                             min_vertices: int = 0,
+                             max_vertices: int = 30) -> list[list[int]]:
+    vertex_count = draw(st.integers(min_vertices, max_vertices))
+    if not vertex_count:
+        return []
+    return draw(
+        st.lists(st.lists(st.integers(0, vertex_count - 1), max_size=4),
+                 min_size=vertex_count,
+                 max_size=vertex_count))
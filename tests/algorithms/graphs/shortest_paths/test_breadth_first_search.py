@@ -0,0 +1,66 @@
+import pytest
+
+from hypothesis import given, strategies as st
+
+from tests.algorithms.graphs.helpers import (adjacency_lists,
+                                             directed_adjacency_lists)
+
+from src.algorithms.graphs.shortest_paths.dijkstra import dijkstra_one_to_all
+from src.algorithms.graphs.shortest_paths.breadth_first_search import (
+    bfs, multi_source_bfs, zero_one_bfs, direction_optimizing_bfs)
+
+
+def unit_weights(adj: list[list[int]]) -> list[list[tuple[int, int]]]:
+    return [[(v, 1) for v in neighbors] for neighbors in adj]
+
+
+def reverse_graph(adj: list[list[int]]) -> list[list[int]]:
+    reverse = [[] for _ in adj]
+    for u in range(len(adj)):
+        for v in adj[u]:
+            reverse[v].append(u)
+    return reverse
+
+
+@given(directed_adjacency_lists(min_vertices=1), st.data())
+def test_bfs(adj, data: st.DataObject):
+    source = data.draw(st.integers(0, len(adj) - 1))
+    assert bfs(adj, source) == dijkstra_one_to_all(unit_weights(adj), source)
+
+
+@given(directed_adjacency_lists(min_vertices=1), st.data())
+def test_multi_source_bfs(adj, data: st.DataObject):
+    sources = data.draw(st.lists(st.integers(0, len(adj) - 1)))
+    expected = [float('inf') for _ in adj]
+    for source in sources:
+        expected = list(map(min, expected, bfs(adj, source)))
+    assert multi_source_bfs(adj, sources) == expected
+
+
+@given(directed_adjacency_lists(min_vertices=1), st.data())
+def test_zero_one_bfs(adj, data: st.DataObject):
+    graph = [[(v, data.draw(st.integers(0, 1))) for v in neighbors]
+             for neighbors in adj]
+    source = data.draw(st.integers(0, len(adj) - 1))
+    assert zero_one_bfs(graph, source) == dijkstra_one_to_all(graph, source)
+
+
+def test_zero_one_bfs_invalid_weight():
+    with pytest.raises(ValueError):
+        zero_one_bfs([[(1, 2)], []])
+
+
+@given(adjacency_lists(min_vertices=1), st.data(), st.floats(0.1, 30),
+       st.floats(0.1, 30))
+def test_direction_optimizing_bfs(adj, data: st.DataObject, alpha: float,
+                                  beta: float):
+    source = data.draw(st.integers(0, len(adj) - 1))
+    assert direction_optimizing_bfs(adj, source, alpha=alpha,
+                                    beta=beta) == bfs(adj, source)
+
+
+@given(directed_adjacency_lists(min_vertices=1), st.data())
+def test_direction_optimizing_bfs_directed(adj, data: st.DataObject):
+    source = data.draw(st.integers(0, len(adj) - 1))
+    assert direction_optimizing_bfs(adj, source, reverse_graph(adj),
+                                    alpha=1) == bfs(adj, source)
@@ -0,0 +1,50 @@
+from hypothesis import given, strategies as st
+
+from tests.algorithms.graphs.helpers import directed_adjacency_lists
+
+from src.algorithms.graphs.shortest_paths.k_shortest_paths import yen
+
+
+def all_path_lengths(graph, source: int, target: int) -> list[int]:
+    lengths = []
+    visited = {source}
+
+    def extend(u: int, length: int):
+        if u == target:
+            lengths.append(length)
+            return
+        # parallel arcs give the same vertex sequence, keep the cheapest
+        cheapest = {}
+        for v, weight in graph[u]:
+            cheapest[v] = min(weight, cheapest.get(v, weight))
+        for v, weight in cheapest.items():
+            if v not in visited:
+                visited.add(v)
+                extend(v, length + weight)
+                visited.remove(v)
+
+    extend(source, 0)
+    return sorted(lengths)
+
+
+@given(directed_adjacency_lists(min_vertices=1, max_vertices=8), st.data(),
+       st.integers(1, 20))
+def test_yen(adj, data: st.DataObject, k: int):
+    n = len(adj)
+    graph = [[(v, data.draw(st.integers(0, 10))) for v in adj[u]]
+             for u in range(n)]
+    source = data.draw(st.integers(0, n - 1))
+    target = data.draw(st.integers(0, n - 1))
+
+    paths = yen(graph, source, target, k)
+
+    expected = all_path_lengths(graph, source, target)[:k]
+    assert [length for length, _ in paths] == expected
+
+    assert len({tuple(path) for _, path in paths}) == len(paths)
+    for length, path in paths:
+        assert path[0] == source and path[-1] == target
+        assert len(set(path)) == len(path)
+        assert length == sum(
+            min(weight for w, weight in graph[u] if w == v)
+            for u, v in zip(path, path[1:]))
@@ -0,0 +1,23 @@
+from hypothesis import given
+
+from tests.algorithms.graphs.helpers import adjacency_lists
+
+from src.algorithms.graphs.csr import CSRGraph
+
+
+@given(adjacency_lists())
+def test_from_adjacency_list(adj):
+    graph = CSRGraph.from_adjacency_list(adj)
+    assert len(graph) == len(adj)
+    assert graph.to_adjacency_list() == adj
+    assert graph.max_degree() == max((len(e) for e in adj), default=0)
+
+
+@given(adjacency_lists())
+def test_from_edges(adj):
+    edges = [(u, v, 1.0) for u in range(len(adj)) for v in adj[u] if u < v]
+    graph = CSRGraph.from_edges(len(adj), edges)
+    assert len(graph) == len(adj)
+    for u in range(len(adj)):
+        assert sorted(graph.neighbors(u)) == sorted(adj[u])
+        assert graph.degree(u) == len(adj[u])
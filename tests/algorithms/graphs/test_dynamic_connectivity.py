@@ -0,0 +1,50 @@
+from hypothesis import given, strategies as st
+
+from src.algorithms.graphs.dynamic_connectivity import offline_connectivity
+from src.data_structures.union_find import UnionFind
+
+
+@st.composite
+def update_logs(draw: st.DrawFn,
+                max_vertices: int = 10,
+                max_updates: int = 50):
+    n = draw(st.integers(1, max_vertices))
+    vertices = st.integers(0, n - 1)
+
+    updates = []
+    edges = []
+    for _ in range(draw(st.integers(0, max_updates))):
+        if edges and draw(st.booleans()):
+            u, v = edges.pop(draw(st.integers(0, len(edges) - 1)))
+            updates.append((False, v, u))
+        else:
+            u, v = draw(vertices), draw(vertices)
+            edges.append((u, v))
+            updates.append((True, u, v))
+
+    queries = draw(
+        st.lists(st.tuples(st.integers(0, len(updates)), vertices, vertices)))
+    return n, updates, queries
+
+
+def connected_after(n, updates, t, u, v):
+    edges = []
+    for added, x, y in updates[:t]:
+        if added:
+            edges.append((min(x, y), max(x, y)))
+        else:
+            edges.remove((min(x, y), max(x, y)))
+
+    components = UnionFind(n)
+    for x, y in edges:
+        components.merge(x, y)
+    return components.find(u) == components.find(v)
+
+
+@given(update_logs())
+def test_offline_connectivity(ex):
+    n, updates, queries = ex
+    answers = offline_connectivity(n, updates, queries)
+    assert answers == [
+        connected_after(n, updates, t, u, v) for t, u, v in queries
+    ]
@@ -0,0 +1,82 @@
+import os
+import tempfile
+
+import pytest
+
+from hypothesis import given, strategies as st
+
+from src.algorithms.graphs.csr import CSRGraph
+from src.algorithms.graphs.edge_files import write_edge_file, MappedEdgeList
+from src.algorithms.graphs.minimum_spanning_forest import (kruskal,
+                                                            kruskal_columns)
+
+
+@st.composite
+def edge_lists(draw: st.DrawFn, max_vertices: int = 2**40):
+    n = draw(st.integers(1, max_vertices))
+    vertices = st.integers(0, n - 1)
+    edges = draw(
+        st.lists(
+            st.tuples(vertices, vertices,
+                      st.floats(allow_nan=False, allow_infinity=False))))
+    return n, edges
+
+
+@given(edge_lists())
+def test_round_trip(ex):
+    n, edges = ex
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.edges")
+        assert write_edge_file(path, n, edges) == len(edges)
+
+        with MappedEdgeList(path) as graph:
+            assert graph.n == n
+            assert len(graph) == len(edges)
+            assert list(graph) == edges
+
+
+@given(edge_lists())
+def test_round_trip_unweighted(ex):
+    n, edges = ex
+    edges = [(u, v) for u, v, _ in edges]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.edges")
+        write_edge_file(path, n, edges, weighted=False)
+
+        with MappedEdgeList(path) as graph:
+            assert graph.weights is None
+            assert list(graph) == edges
+
+
+@given(edge_lists(max_vertices=30))
+def test_consumers(ex):
+    n, edges = ex
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.edges")
+        write_edge_file(path, n, edges)
+
+        with MappedEdgeList(path) as graph:
+            csr = CSRGraph.from_edge_columns(graph.n, graph.tails,
+                                             graph.heads)
+            assert csr.to_adjacency_list() == CSRGraph.from_edges(
+                n, edges).to_adjacency_list()
+
+            indices = kruskal_columns(graph.n, graph.tails, graph.heads,
+                                      graph.weights)
+            assert sorted(edges[i][2] for i in indices) == sorted(
+                weight for _, _, weight in kruskal(n, edges))
+
+
+def test_invalid_file():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.edges")
+        with open(path, "wb") as file:
+            file.write(b"not an edge file at all!")
+        with pytest.raises(ValueError):
+            MappedEdgeList(path)
+
+        write_edge_file(path, 3, [(0, 1, 1.0), (1, 2, 2.0)])
+        with open(path, "r+b") as file:
+            file.truncate(os.path.getsize(path) - 1)
+        with pytest.raises(ValueError):
+            MappedEdgeList(path)
@@ -0,0 +1,59 @@
+from hypothesis import given, strategies as st
+
+from src.algorithms.graphs.minimum_spanning_forest import (kruskal,
+                                                            kruskal_columns,
+                                                            boruvka,
+                                                            boruvka_columns)
+from src.data_structures.union_find import UnionFind
+
+
+@st.composite
+def weighted_graphs(draw: st.DrawFn,
+                    max_vertices: int = 30,
+                    max_edges: int = 100) -> tuple[int, list]:
+    n = draw(st.integers(1, max_vertices))
+    vertices = st.integers(0, n - 1)
+    edges = draw(
+        st.lists(st.tuples(vertices, vertices, st.integers(-10, 10)),
+                 max_size=max_edges))
+    return n, edges
+
+
+def check_spanning_forest(n: int, edges: list, forest: list):
+    __tracebackhide__ = True
+
+    graph_components = UnionFind(n)
+    for u, v, _ in edges:
+        graph_components.merge(u, v)
+    component_count = len({graph_components.find(u) for u in range(n)})
+
+    forest_components = UnionFind(n)
+    for u, v, _ in forest:
+        assert forest_components.merge(u, v), "forest contains a cycle"
+    assert len(forest) == n - component_count
+
+
+@given(weighted_graphs())
+def test_boruvka(ex):
+    n, edges = ex
+    forest = boruvka(n, edges)
+    check_spanning_forest(n, edges, forest)
+    assert sorted(forest) == sorted(set(forest))
+    assert (sum(weight for _, _, weight in forest) == sum(
+        weight for _, _, weight in kruskal(n, edges)))
+
+
+@given(weighted_graphs())
+def test_columns(ex):
+    n, edges = ex
+    tails = [u for u, _, _ in edges]
+    heads = [v for _, v, _ in edges]
+    weights = [weight for _, _, weight in edges]
+    expected = sum(weight for _, _, weight in kruskal(n, edges))
+
+    for algorithm in kruskal_columns, boruvka_columns:
+        indices = algorithm(n, tails, heads, weights)
+        assert len(set(indices)) == len(indices)
+        forest = [edges[i] for i in indices]
+        check_spanning_forest(n, edges, forest)
+        assert sum(weight for _, _, weight in forest) == expected
@@ -0,0 +1,84 @@
+import pytest
+
+from hypothesis import given
+
+from tests.algorithms.graphs.helpers import directed_adjacency_lists
+
+from src.algorithms.graphs.csr import CSRGraph
+from src.algorithms.graphs.strongly_connected_components import (
+    tarjan, topological_sort, condensation)
+
+
+def reachability(adj: list[list[int]]) -> list[set[int]]:
+    reachable = []
+    for source in range(len(adj)):
+        seen = {source}
+        stack = [source]
+        while stack:
+            u = stack.pop()
+            for v in adj[u]:
+                if v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+        reachable.append(seen)
+    return reachable
+
+
+def check_topological_order(adj: list[list[int]], order):
+    __tracebackhide__ = True
+
+    assert sorted(order) == list(range(len(adj)))
+    position = {u: i for i, u in enumerate(order)}
+    for u in range(len(adj)):
+        for v in adj[u]:
+            if position[u] >= position[v]:
+                pytest.fail(f"arc {u} -> {v} points backwards")
+
+
+@given(directed_adjacency_lists())
+def test_tarjan(adj):
+    reachable = reachability(adj)
+    for graph in adj, CSRGraph.from_adjacency_list(adj):
+        components = tarjan(graph)
+        for u in range(len(adj)):
+            for v in range(len(adj)):
+                assert ((components[u] == components[v]) ==
+                        (v in reachable[u] and u in reachable[v]))
+            for v in adj[u]:
+                assert components[u] <= components[v]
+
+
+@given(directed_adjacency_lists())
+def test_topological_sort(adj):
+    acyclic = [[v for v in adj[u] if v > u] for u in range(len(adj))]
+    for graph in acyclic, CSRGraph.from_adjacency_list(acyclic):
+        check_topological_order(acyclic, topological_sort(graph))
+
+    reachable = reachability(adj)
+    if any(u in reachable[v] for u in range(len(adj)) for v in adj[u]):
+        with pytest.raises(ValueError):
+            topological_sort(adj)
+    else:
+        check_topological_order(adj, topological_sort(adj))
+
+
+@given(directed_adjacency_lists())
+def test_condensation(adj):
+    components, dag = condensation(adj)
+    assert list(components) == list(tarjan(adj))
+
+    expected = {(components[u], components[v])
+                for u in range(len(adj)) for v in adj[u]
+                if components[u] != components[v]}
+    arcs = [(c, d) for c in range(len(dag)) for d in dag.neighbors(c)]
+    assert len(arcs) == len(expected)
+    assert set(arcs) == expected
+    assert len(dag) == len(set(components))
+    check_topological_order(dag.to_adjacency_list(), range(len(dag)))
+
+
+def test_deep_graph():
+    n = 100000
+    path = [[u + 1] for u in range(n - 1)] + [[0]]
+    assert set(tarjan(path)) == {0}
+    assert list(topological_sort(path[:-1] + [[]])) == list(range(n))
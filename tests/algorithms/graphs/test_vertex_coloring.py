@@ -1,11 +1,18 @@
 import pytest
 
-from hypothesis import given
+from hypothesis import given, settings, strategies as st
 
 from tests.helpers import with_index_permutation
 from tests.algorithms.graphs.helpers import adjacency_lists
 
-from src.algorithms.graphs.vertex_coloring import color_greedy
+from src.algorithms.graphs.csr import CSRGraph
+from src.algorithms.graphs.vertex_coloring import (color_greedy,
+                                                    smallest_last_ordering,
+                                                    color_dsatur,
+                                                    color_speculative,
+                                                    color_exact,
+                                                    _color_partition,
+                                                    _init_color_worker)
 
 
 def check_proper_coloring(adj: list[list[int]], colors: list[int]):
@@ -28,6 +35,17 @@ def check_proper_coloring(adj: list[list[int]], colors: list[int]):
                     f"adjacent vertices {u} and {v} share color {colors[v]}")
 
 
+def degeneracy(adj: list[list[int]]) -> int:
+    remaining = set(range(len(adj)))
+    result = 0
+    while remaining:
+        u = min(remaining,
+                key=lambda x: sum(v in remaining for v in adj[x]))
+        result = max(result, sum(v in remaining for v in adj[u]))
+        remaining.remove(u)
+    return result
+
+
 @given(with_index_permutation(adjacency_lists()))
 def test_color_greedy(ex):
     adj, order = ex
@@ -38,3 +56,126 @@ def test_color_greedy(ex):
     colors_used = len(set(colors))
     max_degree = max((len(e) for e in adj), default=0)
     assert colors_used <= max_degree + 1
+
+
+@given(adjacency_lists())
+def test_smallest_last_ordering(adj):
+    order = smallest_last_ordering(adj)
+    assert sorted(order) == list(range(len(adj)))
+
+    colors = color_greedy(adj, order)
+    check_proper_coloring(adj, colors)
+
+    # every vertex has at most k neighbors earlier in the ordering
+    position = {u: i for i, u in enumerate(order)}
+    back_degree = max((sum(position[v] < position[u] for v in adj[u])
+                       for u in range(len(adj))),
+                      default=0)
+    assert back_degree == degeneracy(adj)
+    assert len(set(colors)) <= back_degree + 1
+
+
+@given(adjacency_lists())
+def test_smallest_last_ordering_repeated_neighbors(adj):
+    # every edge listed twice, so degrees can reach 2 (n - 1)
+    doubled = [neighbors * 2 for neighbors in adj]
+    order = smallest_last_ordering(doubled)
+    assert sorted(order) == list(range(len(adj)))
+
+    position = {u: i for i, u in enumerate(order)}
+    back_degree = max((sum(position[v] < position[u] for v in adj[u])
+                       for u in range(len(adj))),
+                      default=0)
+    assert back_degree == degeneracy(adj)
+
+
+@given(adjacency_lists())
+def test_color_dsatur(adj):
+    colors = color_dsatur(adj)
+    check_proper_coloring(adj, colors)
+
+    colors_used = len(set(colors))
+    max_degree = max((len(e) for e in adj), default=0)
+    assert colors_used <= max_degree + 1
+
+
+@given(st.integers(1, 50))
+def test_color_dsatur_even_cycle(k: int):
+    n = 2 * k + 2
+    adj = [[(u - 1) % n, (u + 1) % n] for u in range(n)]
+    colors = color_dsatur(adj)
+    check_proper_coloring(adj, colors)
+    assert len(set(colors)) == 2
+
+
+@given(adjacency_lists(), st.integers(1, 8))
+def test_color_speculative_serial(adj, partitions: int):
+    colors, conflicts = color_speculative(adj, 1, partitions)
+    check_proper_coloring(adj, colors)
+    assert conflicts == ([0] if adj else [])
+
+    max_degree = max((len(e) for e in adj), default=0)
+    assert len(set(colors)) <= max_degree + 1
+
+
+@settings(max_examples=10, deadline=None)
+@given(adjacency_lists(min_vertices=1, max_vertices=200))
+def test_color_speculative_parallel(adj):
+    colors, conflicts = color_speculative(adj, 2)
+    check_proper_coloring(adj, colors)
+    assert conflicts[-1] == 0
+
+    max_degree = max((len(e) for e in adj), default=0)
+    assert len(set(colors)) <= max_degree + 1
+
+
+def test_color_partition_recolor():
+    # marks left from coloring vertex 2 must not block colors the second
+    # time, when its neighbors no longer use them
+    graph = CSRGraph.from_adjacency_list([[1], [0, 2], [1, 3], [2]])
+    colors = [0, 1, 0, 2]
+    _init_color_worker(graph, colors, graph.max_degree())
+    try:
+        _color_partition([2])
+        assert colors[2] == 3
+        colors[3] = 3
+        _color_partition([2])
+        assert colors[2] == 2
+    finally:
+        _init_color_worker(None, None, -1)
+
+
+def chromatic_number(adj: list[list[int]]) -> int:
+    n = len(adj)
+    colors = [-1 for _ in range(n)]
+
+    def colorable(u: int, k: int) -> bool:
+        if u == n:
+            return True
+        for color in range(k):
+            if all(colors[v] != color for v in adj[u]):
+                colors[u] = color
+                if colorable(u + 1, k):
+                    return True
+        colors[u] = -1
+        return False
+
+    k = 0
+    while not colorable(0, k):
+        k += 1
+    return k
+
+
+@settings(deadline=None)
+@given(adjacency_lists(max_vertices=10))
+def test_color_exact(adj):
+    colors, optimal = color_exact(adj)
+    check_proper_coloring(adj, colors)
+    assert optimal
+    assert len(set(colors)) == chromatic_number(adj)
+
+
+@given(adjacency_lists())
+def test_color_exact_time_limit(adj):
+    colors, _ = color_exact(adj, time_limit=0)
+    check_proper_coloring(adj, colors)
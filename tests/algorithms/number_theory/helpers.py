@@ -0,0 +1,12 @@
+import math
+from functools import cache
+
+
+@cache
+def is_prime(n: int) -> bool:
+    if n < 2:
+        return False
+    for i in range(2, math.isqrt(n) + 1):
+        if n % i == 0:
+            return False
+    return True
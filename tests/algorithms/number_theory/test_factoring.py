@@ -1,21 +1,15 @@
 import math
-from functools import cache
+import random
 
 import pytest
 
-from hypothesis import given, strategies as st
+from hypothesis import given, settings, strategies as st
 
-from src.algorithms.number_theory.factoring import trial_division
-
-
-@cache
-def is_prime(n: int) -> bool:
-    if n in (0, 1):
-        return False
-    for i in range(2, math.isqrt(n) + 1):
-        if n % i == 0:
-            return False
-    return True
+from src.algorithms.number_theory.factoring import (Factorizer, factor,
+                                                    pollard_brent, siqs,
+                                                    trial_division)
+from src.algorithms.number_theory.primality import miller_rabin
+from tests.algorithms.number_theory.helpers import is_prime
 
 
 def verify_factorization(n: int, factors: list[tuple[int, int]]):
@@ -31,3 +25,105 @@ def verify_factorization(n: int, factors: list[tuple[int, int]]):
 def test_trial_division(n: int):
     factors = trial_division(n)
     verify_factorization(n, factors)
+
+
+def verify_large_factorization(n: int, factors: list[tuple[int, int]]):
+    assert math.prod(p**e for p, e in factors) == n
+    assert [p for p, _ in factors] == sorted({p for p, _ in factors})
+    for factor, _ in factors:
+        if not miller_rabin(factor):
+            pytest.fail(f"factor {factor} is not prime")
+
+
+@given(st.integers(2, 2**40))
+def test_factor(n: int):
+    factors = factor(n)
+    verify_factorization(n, factors)
+    assert factors == trial_division(n)
+
+
+@settings(deadline=None)
+@given(st.integers(2, 2**80))
+def test_factor_large(n: int):
+    verify_large_factorization(n, factor(n))
+
+
+@given(st.lists(st.integers(2, 2**32), min_size=1, max_size=4))
+def test_factor_products(parts: list[int]):
+    n = math.prod(parts)
+    verify_large_factorization(n, factor(n))
+
+
+def test_factor_balanced():
+    # rho alone would take about 2^30 steps, so this goes through siqs
+    p, q = 1000000000000000003, 1000000000000000009
+    assert factor(p * q) == [(p, 1), (q, 1)]
+
+
+@given(st.integers(2, 2**20), st.integers(2, 2**20))
+def test_pollard_brent(a: int, b: int):
+    n = a * b
+    d = pollard_brent(n)
+    assert 1 < d < n
+    assert n % d == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_siqs_small(seed: int):
+    # just above the 64-bit cutoff below which siqs uses pollard_brent
+    rng = random.Random(seed)
+    n = rng.randrange(2**32, 2**34) * rng.randrange(2**32, 2**34)
+    d = siqs(n)
+    assert 1 < d < n
+    assert n % d == 0
+
+
+@pytest.mark.parametrize("p, q", [
+    (1000000012367, 3000000067891),
+    (1000000000012421, 3000000000067921),
+    (100000000000000012349, 300000000000000067919),
+])
+def test_siqs(p: int, q: int):
+    assert siqs(p * q) in (p, q)
+
+
+def test_siqs_processes():
+    p, q = 1000000000012421, 3000000000067921
+    assert siqs(p * q, processes=2) in (p, q)
+
+
+@pytest.mark.parametrize("n", [2, 3, 2**89 - 1, 100000000000000012349])
+def test_siqs_prime(n: int):
+    with pytest.raises(ValueError):
+        siqs(n)
+
+
+@pytest.mark.parametrize("p, k", [
+    (1000000007, 3),
+    (3, 80),
+    (1000000000012421, 2),
+    (1000000000012421, 5),
+])
+def test_siqs_prime_power(p: int, k: int):
+    assert siqs(p**k) == p
+
+
+def test_siqs_factor_base_divisor():
+    # 7 divides n, so it is found while building the factor base
+    n = 7 * 100000000000000012349 * 300000000000000067919
+    assert siqs(n) == 7
+
+
+@given(st.integers(1, 2000), st.integers(1, 100), st.data())
+def test_factorizer(limit: int, block_size: int, data: st.DataObject):
+    factorizer = Factorizer(limit, block_size)
+    assert list(factorizer.primes()) == [
+        n for n in range(limit + 1) if is_prime(n)
+    ]
+
+    if limit < 2:
+        return
+    numbers = data.draw(st.lists(st.integers(2, limit)))
+    assert factorizer.factor_all(numbers) == [
+        trial_division(n) for n in numbers
+    ]
@@ -1,8 +1,12 @@
 import math
+import random
 
 from hypothesis import given, strategies as st
 
-from src.algorithms.number_theory.gcd import euclidean, binary_euclidean
+from src.algorithms.number_theory.gcd import (binary_euclidean, euclidean,
+                                              extended_half_gcd,
+                                              extended_lehmer, half_gcd,
+                                              lehmer)
 
 
 @given(st.integers(), st.integers())
@@ -13,3 +17,56 @@ def test_euclidean(a: int, b: int):
 @given(st.integers(), st.integers())
 def test_binary_euclidean(a: int, b: int):
     assert binary_euclidean(a, b) == math.gcd(a, b)
+
+
+@given(st.integers(), st.integers())
+def test_lehmer(a: int, b: int):
+    assert lehmer(a, b) == math.gcd(a, b)
+
+
+@given(st.integers(), st.integers())
+def test_half_gcd(a: int, b: int):
+    assert half_gcd(a, b) == math.gcd(a, b)
+
+
+@given(st.randoms(use_true_random=False), st.integers(0, 20000),
+       st.integers(0, 20000), st.integers(0, 5000))
+def test_large(rng: random.Random, a_bits: int, b_bits: int, c_bits: int):
+    # large enough for several rounds of the half-gcd recursion
+    c = rng.getrandbits(c_bits) + 1
+    a = rng.getrandbits(a_bits) * c * rng.choice((-1, 1))
+    b = rng.getrandbits(b_bits) * c
+    expected = math.gcd(a, b)
+    assert lehmer(a, b) == expected
+    assert half_gcd(a, b) == expected
+
+    for extended_gcd in extended_lehmer, extended_half_gcd:
+        g, x, y = extended_gcd(a, b)
+        assert g == expected
+        assert a * x + b * y == g
+
+
+@given(st.integers(), st.integers())
+def test_extended(a: int, b: int):
+    for extended_gcd in extended_lehmer, extended_half_gcd:
+        g, x, y = extended_gcd(a, b)
+        assert g == math.gcd(a, b)
+        assert a * x + b * y == g
+
+
+def fibonacci(n: int) -> int:
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+def test_fibonacci():
+    # consecutive Fibonacci numbers have all quotients 1
+    a, b = fibonacci(30001), fibonacci(30000)
+    assert lehmer(a, b) == 1
+    assert half_gcd(a, b) == 1
+    for extended_gcd in extended_lehmer, extended_half_gcd:
+        g, x, y = extended_gcd(a, b)
+        assert g == 1
+        assert a * x + b * y == 1
@@ -0,0 +1,28 @@
+from hypothesis import given, strategies as st
+
+from src.algorithms.number_theory.primality import miller_rabin
+from tests.algorithms.number_theory.helpers import is_prime
+
+# strong pseudoprimes to all bases of the next smaller witness set
+PSEUDOPRIMES = [
+    2047, 1373653, 25326001, 3215031751, 2152302898747, 3474749660383,
+    341550071728321, 3825123056546413051, 318665857834031151167461,
+    3317044064679887385961981
+]
+
+
+@given(st.integers(-10, 2**20))
+def test_miller_rabin(n: int):
+    assert miller_rabin(n) == is_prime(n)
+
+
+def test_miller_rabin_pseudoprimes():
+    for n in PSEUDOPRIMES:
+        assert not miller_rabin(n)
+
+
+def test_miller_rabin_large_primes():
+    assert miller_rabin(2**61 - 1)
+    assert miller_rabin(2**89 - 1)
+    assert miller_rabin(2**127 - 1)
+    assert not miller_rabin((2**61 - 1) * (2**89 - 1))
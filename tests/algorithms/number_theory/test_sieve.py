@@ -0,0 +1,23 @@
+from hypothesis import given, strategies as st
+
+from src.algorithms.number_theory.sieve import segmented_sieve
+from tests.algorithms.number_theory.helpers import is_prime
+
+
+@given(st.integers(-10, 5000), st.integers(0, 5000), st.integers(1, 50))
+def test_segmented_sieve(lo: int, length: int, segment_size: int):
+    hi = lo + length
+    assert list(segmented_sieve(lo, hi, segment_size)) == [
+        n for n in range(lo, hi) if is_prime(n)
+    ]
+
+
+def test_segmented_sieve_window():
+    lo = 10**12
+    primes = list(segmented_sieve(lo, lo + 1000))
+    assert primes == [n for n in range(lo, lo + 1000) if is_prime(n)]
+
+
+def test_segmented_sieve_processes():
+    assert list(segmented_sieve(10, 100000, 64, processes=2)) == list(
+        segmented_sieve(10, 100000, 64))
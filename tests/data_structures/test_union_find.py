@@ -1,40 +1,191 @@
 from typing import Optional
 
+import pytest
+
 from hypothesis import given, strategies as st
 from hypothesis.stateful import RuleBasedStateMachine, Bundle, initialize, rule, multiple, invariant
 
 from tests.helpers import size_and_range_queries
 
-from src.data_structures.union_find import UnionFind
+from src.data_structures.union_find import (UnionFind, ArrayUnionFind,
+                                            RollbackUnionFind,
+                                            WeightedUnionFind)
 
 
+@pytest.mark.parametrize("union_find_cls", [UnionFind, ArrayUnionFind])
 class TestUnionFind:
 
-    @given(st.integers(0, 1000))
-    def test_init(self, size: int):
-        uf = UnionFind(size)
+    @given(size=st.integers(0, 1000))
+    def test_init(self, union_find_cls, size: int):
+        uf = union_find_cls(size)
         assert len(uf) == size
         for x in range(size):
             assert uf.find(x) == x
 
-    @given(size_and_range_queries())
-    def test_merge(self, ex):
+    @given(ex=size_and_range_queries())
+    def test_merge(self, union_find_cls, ex):
         size, merges = ex
-        uf = UnionFind(size)
+        uf = union_find_cls(size)
         for x, y in merges:
             uf.merge(x, y)
             assert uf.find(x) == uf.find(y)
             assert not uf.merge(x, y)
 
-    @given(st.integers(0, 1000))
-    def test_make_set(self, size: int):
-        uf = UnionFind(size)
+    @given(size=st.integers(0, 1000))
+    def test_make_set(self, union_find_cls, size: int):
+        uf = union_find_cls(size)
         idx = uf.make_set()
         assert idx == size
         for x in range(size + 1):
             assert uf.find(x) == x
 
 
+class TestArrayUnionFind:
+
+    @given(size_and_range_queries(max_size=100))
+    def test_merge_many(self, ex):
+        size, merges = ex
+        uf = ArrayUnionFind(size)
+        reference = UnionFind(size)
+
+        expected_merges = sum(reference.merge(x, y) for x, y in merges)
+        assert uf.merge_many(merges) == expected_merges
+        assert uf.set_count() == size - expected_merges
+        for x in range(size):
+            for y in range(size):
+                assert ((uf.find(x) == uf.find(y)) ==
+                        (reference.find(x) == reference.find(y)))
+
+    @given(size_and_range_queries(max_size=100))
+    def test_components(self, ex):
+        size, merges = ex
+        uf = ArrayUnionFind(size)
+        uf.merge_many(merges)
+
+        labels = uf.components()
+        assert len(labels) == size
+        assert max(labels) == uf.set_count() - 1
+
+        first_seen = []
+        for x in range(size):
+            if labels[x] not in first_seen:
+                first_seen.append(labels[x])
+            for y in range(size):
+                assert (labels[x] == labels[y]) == (uf.find(x) == uf.find(y))
+        assert first_seen == list(range(uf.set_count()))
+
+        for x in range(size):
+            assert uf.set_size(x) == labels.count(labels[x])
+
+
+class TestRollbackUnionFind:
+
+    @given(size_and_range_queries(max_size=100), st.data())
+    def test_rollback(self, ex, data: st.DataObject):
+        size, merges = ex
+        uf = RollbackUnionFind(size)
+
+        tokens = []
+        states = []
+        for x, y in merges:
+            tokens.append(uf.snapshot())
+            states.append([uf.find(z) for z in range(size)])
+            uf.merge(x, y)
+            assert uf.find(x) == uf.find(y)
+            assert not uf.merge(x, y)
+
+        while tokens:
+            idx = data.draw(st.integers(0, len(tokens) - 1))
+            uf.rollback(tokens[idx])
+            assert [uf.find(z) for z in range(size)] == states[idx]
+            assert uf.set_count() == len(set(states[idx]))
+            del tokens[idx:]
+            del states[idx:]
+
+    @given(size_and_range_queries(max_size=100))
+    def test_set_size(self, ex):
+        size, merges = ex
+        uf = RollbackUnionFind(size)
+        for x, y in merges:
+            uf.merge(x, y)
+
+        roots = [uf.find(z) for z in range(size)]
+        for z in range(size):
+            assert uf.set_size(z) == roots.count(roots[z])
+
+
+class TestWeightedUnionFind:
+
+    @given(size_and_range_queries(max_size=100), st.data())
+    def test_consistent_constraints(self, ex, data: st.DataObject):
+        size, pairs = ex
+        values = data.draw(
+            st.lists(st.integers(-1000, 1000), min_size=size,
+                     max_size=size))
+        uf = WeightedUnionFind(size)
+        reference = UnionFind(size)
+
+        for x, y in pairs:
+            assert (uf.merge(x, y, values[x] - values[y]) ==
+                    reference.merge(x, y))
+            assert uf.diff(x, y) == values[x] - values[y]
+            assert uf.diff(y, x) == values[y] - values[x]
+
+        for x in range(size):
+            for y in range(size):
+                if reference.find(x) == reference.find(y):
+                    assert uf.diff(x, y) == values[x] - values[y]
+                else:
+                    assert uf.diff(x, y) is None
+
+    @given(size_and_range_queries(max_size=20),
+           st.lists(st.integers(-3, 3)))
+    def test_contradictions(self, ex, weights: list[int]):
+        size, pairs = ex
+        uf = WeightedUnionFind(size)
+        constraints = []
+
+        for (x, y), weight in zip(pairs, weights):
+            # brute force: the constraints are consistent iff some values
+            # satisfy all of them, which fixes values along each component
+            candidate = constraints + [(x, y, weight)]
+            values = [None for _ in range(size)]
+            consistent = True
+            for root in range(size):
+                if values[root] is not None:
+                    continue
+                values[root] = 0
+                stack = [root]
+                while stack:
+                    z = stack.pop()
+                    for a, b, w in candidate:
+                        for p, q, d in (a, b, w), (b, a, -w):
+                            if p == z:
+                                if values[q] is None:
+                                    values[q] = values[p] - d
+                                    stack.append(q)
+                                elif values[p] - values[q] != d:
+                                    consistent = False
+
+            if consistent:
+                uf.merge(x, y, weight)
+                constraints.append((x, y, weight))
+            else:
+                with pytest.raises(ValueError):
+                    uf.merge(x, y, weight)
+
+        for x, y, weight in constraints:
+            assert uf.diff(x, y) == weight
+
+    def test_tolerance(self):
+        uf = WeightedUnionFind(3, tolerance=1e-9)
+        assert uf.merge(0, 1, 0.1)
+        assert uf.merge(1, 2, 0.2)
+        assert not uf.merge(0, 2, 0.3)
+        with pytest.raises(ValueError):
+            uf.merge(0, 2, 0.31)
+
+
 class UnionFindTester(RuleBasedStateMachine):
     union_find: Optional[UnionFind]
     sets: list[set[int]]